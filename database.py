@@ -1,30 +1,58 @@
 import os
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from datetime import datetime, timedelta
 import logging
+import threading
+import time
+from contextlib import contextmanager
+from psycopg2.pool import ThreadedConnectionPool
 import discord
 
 logger = logging.getLogger(__name__)
 
+# Connections for concurrent moderation queries; only the minimum is opened up front,
+# the rest are opened on demand and closed again when returned above it
+POOL_MIN_CONNECTIONS = 2
+POOL_MAX_CONNECTIONS = 10
+
 class ModerationDB:
     def __init__(self):
         self.db_url = os.getenv('DATABASE_URL')
         if not self.db_url:
             raise ValueError("DATABASE_URL environment variable not set")
-        
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # getconn() raises instead of waiting once every connection is out, so callers queue here
+        self._pool_slots = threading.BoundedSemaphore(POOL_MAX_CONNECTIONS)
+
+    def get_pool(self):
+        """Create the connection pool on first use, with retry logic"""
+        if self._pool is None:
+            with self._pool_lock:
+                max_retries = 3
+                for attempt in range(max_retries):
+                    if self._pool is not None:
+                        break
+                    try:
+                        self._pool = ThreadedConnectionPool(POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS, self.db_url, cursor_factory=RealDictCursor)
+                    except Exception as e:
+                        logger.error(f"Database connection attempt {attempt + 1} failed: {e}")
+                        if attempt == max_retries - 1:
+                            raise
+                        time.sleep(1)
+        return self._pool
+
+    @contextmanager
     def get_connection(self):
-        """Get database connection with retry logic"""
-        max_retries = 3
-        for attempt in range(max_retries):
+        """Borrow a pooled database connection, committing on success and rolling back on error"""
+        pool = self.get_pool()
+        with self._pool_slots:
+            conn = pool.getconn()
             try:
-                return psycopg2.connect(self.db_url, cursor_factory=RealDictCursor)
-            except Exception as e:
-                logger.error(f"Database connection attempt {attempt + 1} failed: {e}")
-                if attempt == max_retries - 1:
-                    raise
-                import time
-                time.sleep(1)
+                with conn:
+                    yield conn
+            finally:
+                pool.putconn(conn)
     
     def init_database(self):
         """Initialize database tables"""
@@ -62,6 +90,10 @@ class ModerationDB:
                     CREATE INDEX IF NOT EXISTS idx_moderation_active 
                     ON moderation_actions(is_active, expires_at)
                 """)
+                cur.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_moderation_user_server_type 
+                    ON moderation_actions(user_id, server_id, action_type, created_at DESC)
+                """)
                 
                 conn.commit()
                 logger.info("Database tables initialized successfully")
@@ -85,16 +117,94 @@ class ModerationDB:
                 conn.commit()
                 return action_id
     
-    def get_user_record(self, user_id, server_id):
-        """Get all moderation actions for a user"""
+    def add_moderation_actions_batch(self, actions):
+        """Add several moderation actions in one transaction and return their ids in order"""
+        if not actions:
+            return []
+
+        now = datetime.utcnow()
+        rows = []
+        for action in actions:
+            duration_minutes = action.get('duration_minutes')
+            expires_at = now + timedelta(minutes=duration_minutes) if duration_minutes else None
+            rows.append((action['user_id'], action['moderator_id'], action['server_id'],
+                         action['action_type'], action['reason'], duration_minutes, expires_at))
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                results = execute_values(cur, """
+                    INSERT INTO moderation_actions 
+                    (user_id, moderator_id, server_id, action_type, reason, duration_minutes, expires_at)
+                    VALUES %s
+                    RETURNING id
+                """, rows, fetch=True)
+
+                conn.commit()
+                return [row['id'] for row in results]
+    
+    def _user_action_filter(self, user_id, server_id, action_type=None, is_active=None):
+        """Build the WHERE clause and params selecting a user's actions"""
+        where = "WHERE user_id = %s AND server_id = %s"
+        params = [user_id, server_id]
+
+        if action_type:
+            where += " AND action_type = %s"
+            params.append(action_type)
+
+        if is_active is not None:
+            where += " AND is_active = %s"
+            params.append(is_active)
+
+        return where, params
+
+    def get_user_record(self, user_id, server_id, action_type=None, is_active=None, limit=None):
+        """Get moderation actions for a user, newest first"""
+        where, params = self._user_action_filter(user_id, server_id, action_type, is_active)
+        query = f"SELECT * FROM moderation_actions {where} ORDER BY created_at DESC"
+
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                
+                return cur.fetchall()
+    
+    def count_user_actions(self, user_id, server_id, action_type=None, is_active=None):
+        """Count moderation actions for a user"""
+        where, params = self._user_action_filter(user_id, server_id, action_type, is_active)
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT COUNT(*) AS count FROM moderation_actions {where}", params)
+                
+                return cur.fetchone()['count']
+    
+    def get_user_action_summary(self, user_id, server_id):
+        """Count a user's moderation actions grouped by (action_type, is_active), with a NULL is_active counted as inactive"""
         with self.get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("""
-                    SELECT * FROM moderation_actions 
+                    SELECT action_type, COALESCE(is_active, FALSE) AS is_active, COUNT(*) AS count
+                    FROM moderation_actions
                     WHERE user_id = %s AND server_id = %s
-                    ORDER BY created_at DESC
+                    GROUP BY action_type, COALESCE(is_active, FALSE)
                 """, (user_id, server_id))
                 
+                return {(row['action_type'], row['is_active']): row['count'] for row in cur.fetchall()}
+    
+    def count_actions_by_user(self):
+        """Count moderation actions for every user and server pair"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT user_id, server_id, COUNT(*) AS count
+                    FROM moderation_actions
+                    GROUP BY user_id, server_id
+                """)
+                
                 return cur.fetchall()
     
     def get_active_actions(self, user_id, server_id, action_type=None):
@@ -6,51 +6,113 @@ import re
 from typing import Optional
 import json
 import os
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
 from database import mod_db
 import difflib
 import random
 import operator
+import heapq
+import time
+from functools import lru_cache
+from collections import Counter
+from array import array
 
 logger = logging.getLogger(__name__)
 
+# Custom emojis used in bot responses
+WRONG_EMOJI = "<:GsWrong:1414561861352816753>"
+RIGHT_EMOJI = "<:GsRight:1414593140156792893>"
+
+# Moderation record status, indexed by is_active
+_STATUS = (f"{WRONG_EMOJI}   Removed", f"{RIGHT_EMOJI}  Active")
+MOD_FOOTER = "🔥 Game Services Moderation System"
+
+# Permission flag bits checked against ctx.author.guild_permissions.value by prefix commands
+_ADMIN_BIT = discord.Permissions.administrator.flag
+_KICK_BIT = discord.Permissions.kick_members.flag
+_BAN_BIT = discord.Permissions.ban_members.flag
+_MODERATE_BIT = discord.Permissions.moderate_members.flag
+_MANAGE_MESSAGES_BIT = discord.Permissions.manage_messages.flag
+_MANAGE_GUILD_BIT = discord.Permissions.manage_guild.flag
+
+# One line block per record in the history commands
+_RECORD_LINE = "**#{id}** {action} - {created_at}\nBy: <@{moderator_id}> | {status}\nReason: {reason}\n"
+_KICK_LINE = "**#{id}** {action} - {created_at}\nBy: <@{moderator_id}>\nReason: {reason}\n"
+
+@lru_cache(maxsize=2048)
+def _short(text, length=50):
+    """Truncate text to length characters, marking the cut with an ellipsis"""
+    return text if len(text) <= length else f"{text[:length]}..."
+
+def format_record_time(dt):
+    """MM/DD/YYYY HH:MM without going through strftime's format parser"""
+    return f"{dt.month:02d}/{dt.day:02d}/{dt.year} {dt.hour:02d}:{dt.minute:02d}"
+
+def format_record_lines(records, template, action=None, reason_length=50):
+    """Render moderation records with a line template; action defaults to each record's own type"""
+    return "\n".join(
+        template.format(
+            id=record['id'],
+            action=action or record['action_type'].title(),
+            created_at=format_record_time(record['created_at']),
+            moderator_id=record['moderator_id'],
+            status=_STATUS[bool(record['is_active'])],
+            reason=_short(record['reason'], reason_length)
+        )
+        for record in records
+    )
+
 # In-memory pet database  
 PET_DATABASE = {}
 PET_DATA_FILE = os.path.join(os.path.dirname(__file__), "pet_values.json")
+PET_DATA_VERSION = 0  # Bumped on every load/save so readers can tell when cached views are stale
+PET_DATA_LOCK = threading.RLock()  # Held while changing or saving PET_DATABASE (web server threads); never taken on the event loop
 
 # Pet data will be loaded after function definitions
 
 # Chat guide message system
-channel_message_counts = {}  # Track messages per channel for chat guide
+channel_message_counts = Counter()  # Track messages per channel for chat guide
 chat_guide_cooldown = {}     # Prevent spam/duplicates per channel
+_NEVER_SENT = datetime.min.replace(tzinfo=timezone.utc)  # Cooldown default for channels without a guide message yet
 CHAT_GUIDE_MESSAGE = "**Make sure to check out the [Chat Guide](https://discord.com/channels/1370086525210984458/1410921626241073173) & you are following the guidelines whilst chatting!**"
 CHAT_GUIDE_INTERVAL = 100    # Send every 100 messages
 CHAT_GUIDE_CHANNEL_ID = 1370086532433838102  # Only send in this specific channel
 
 # Load existing pet data on startup
 def load_pet_data():
-    global PET_DATABASE
+    """Read the pet file and swap it in; blocks on PET_DATA_LOCK, so call it off the event loop"""
+    global PET_DATABASE, PET_DATA_VERSION
     try:
         logger.info(f"🔄 Attempting to load pet data from {PET_DATA_FILE}")
         if os.path.exists(PET_DATA_FILE):
             logger.info(f"✅ File {PET_DATA_FILE} exists, loading...")
             with open(PET_DATA_FILE, 'r') as f:
-                PET_DATABASE = json.load(f)
-            logger.info(f"🐾 Successfully loaded {len(PET_DATABASE)} pets from database")
+                pets = json.load(f)
+            logger.info(f"🐾 Successfully loaded {len(pets)} pets from database")
         else:
-            PET_DATABASE = {}
+            pets = {}
             logger.error(f"❌ File {PET_DATA_FILE} not found, starting with empty database")
     except Exception as e:
         logger.error(f"💥 Error loading pet data: {e}")
         logger.error(f"📁 Current working directory: {os.getcwd()}")
         logger.error(f"📂 Contents of directory: {os.listdir('.')}")
-        PET_DATABASE = {}
+        pets = {}
+    with PET_DATA_LOCK:
+        PET_DATABASE = pets
+        PET_DATA_VERSION += 1
 
 # Save pet data to file
 def save_pet_data():
+    global PET_DATA_VERSION
     try:
-        with open(PET_DATA_FILE, 'w') as f:
-            json.dump(PET_DATABASE, f, indent=2)
+        with PET_DATA_LOCK:
+            PET_DATA_VERSION += 1
+            # write a temp file and swap it in so a concurrent load never sees a half-written file
+            tmp_path = PET_DATA_FILE + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(PET_DATABASE, f, indent=2)
+            os.replace(tmp_path, PET_DATA_FILE)
         logger.info(f"Saved {len(PET_DATABASE)} pets to database")
     except Exception as e:
         logger.error(f"Error saving pet data: {e}")
@@ -191,6 +253,7 @@ async def process_pet_value_message(message, provided_image_url=None):
                     found_pets.append((pet_name, value, demand, extracted_image_url))
 
     # Store pets with images - FIXED assignment logic
+    updates = []
     for i, pet_data in enumerate(found_pets):
         pet_name, value, demand = pet_data[:3]
         extracted_image_url = pet_data[3] if len(pet_data) > 3 else None
@@ -209,40 +272,39 @@ async def process_pet_value_message(message, provided_image_url=None):
             logger.info(f"No suitable image found for {pet_name}")
 
         pet_key = pet_name.lower().replace(' ', '_')
-
-        # Store pet data with instant update - preserve existing image if no new one
-        existing_image = PET_DATABASE.get(pet_key, {}).get('image_url')
-        final_image = assigned_image if assigned_image else existing_image
-
-        PET_DATABASE[pet_key] = {
+        updates.append((pet_key, {
             'name': pet_name,
             'value': value,
             'demand': demand,
             'last_updated': message.created_at.isoformat(),
             'message_id': message.id,
-            'image_url': final_image
-        }
+            'image_url': assigned_image
+        }))
 
         logger.info(f"Updated pet: {pet_name} - Value: {value} - Demand: {demand} - Image: {'Yes' if assigned_image else 'No'}")
 
     # Save data immediately for instant updates
     if found_pets:
-        save_pet_data()
+        await asyncio.to_thread(store_pet_updates, updates)
         logger.info(f"INSTANT UPDATE: Processed {len(found_pets)} pets and saved to database")
 
+def store_pet_updates(updates):
+    """Apply (pet_key, pet) updates and save them; blocks on PET_DATA_LOCK, so call it off the event loop"""
+    with PET_DATA_LOCK:
+        for pet_key, pet in updates:
+            # preserve existing image if no new one
+            pet['image_url'] = pet['image_url'] or PET_DATABASE.get(pet_key, {}).get('image_url')
+            PET_DATABASE[pet_key] = pet
+        save_pet_data()
+
 # Pet weight formula
-BASE_WEIGHTS = {
-    1: 1.00, 2: 1.09, 3: 1.18, 4: 1.27, 5: 1.36, 6: 1.45, 7: 1.55, 8: 1.64, 9: 1.73, 10: 1.82,
-    11: 1.91, 12: 2.00, 13: 2.09, 14: 2.18, 15: 2.27, 16: 2.36, 17: 2.45, 18: 2.55, 19: 2.64, 20: 2.73,
-    21: 2.82, 22: 2.91, 23: 3.00, 24: 3.09, 25: 3.18, 26: 3.27, 27: 3.36, 28: 3.45, 29: 3.55, 30: 3.64,
-    31: 3.73, 32: 3.82, 33: 3.91, 34: 4.00, 35: 4.09, 36: 4.18, 37: 4.27, 38: 4.36, 39: 4.45, 40: 4.55,
-    41: 4.64, 42: 4.73, 43: 4.82, 44: 4.91, 45: 5.00, 46: 5.09, 47: 5.18, 48: 5.27, 49: 5.36, 50: 5.45,
-    51: 5.55, 52: 5.64, 53: 5.73, 54: 5.82, 55: 5.91, 56: 6.00, 57: 6.09, 58: 6.18, 59: 6.27, 60: 6.36,
-    61: 6.45, 62: 6.55, 63: 6.64, 64: 6.73, 65: 6.82, 66: 6.91, 67: 7.00, 68: 7.09, 69: 7.18, 70: 7.27,
-    71: 7.36, 72: 7.45, 73: 7.55, 74: 7.64, 75: 7.73, 76: 7.82, 77: 7.91, 78: 8.00, 79: 8.09, 80: 8.18,
-    81: 8.27, 82: 8.36, 83: 8.45, 84: 8.55, 85: 8.64, 86: 8.73, 87: 8.82, 88: 8.91, 89: 9.00, 90: 9.09,
-    91: 9.18, 92: 9.27, 93: 9.36, 94: 9.45, 95: 9.55, 96: 9.64, 97: 9.73, 98: 9.82, 99: 9.91, 100: 10.00
-}
+def base_weight(age):
+    """Base weight at an age: linear from 1.00 at age 1 to 10.00 at age 100"""
+    return round(1.0 + (age - 1) / 11, 2)
+
+BASE_WEIGHTS = {age: base_weight(age) for age in range(1, 101)}
+# Same weights as a flat table indexed by age (slot 0 unused) for the prediction hot path
+BASE_WEIGHT_TABLE = array('d', [0.0] + [BASE_WEIGHTS[age] for age in range(1, 101)])
 
 intents = discord.Intents.default()
 intents.message_content = True
@@ -306,7 +368,83 @@ COUNTRIES_FLAGS = {
 
 # Tracking systems
 invite_cache = {}
-user_invites = {}
+INVITE_DATA_FILE = os.path.join(os.path.dirname(__file__), "invites.json")
+INVITE_FIELDS = ('invites', 'fake', 'rejoins', 'bonus')
+
+class InviteStore:
+    """Invite counters kept as parallel integer columns indexed through a user_id -> row map"""
+
+    def __init__(self):
+        self.ids = []
+        self.idx = {}
+        self.columns = {field: array('q') for field in INVITE_FIELDS}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row(self, user_id):
+        """Return the row index for a user, appending a zeroed row if needed"""
+        i = self.idx.get(user_id)
+        if i is None:
+            i = self.idx[user_id] = len(self.ids)
+            self.ids.append(user_id)
+            for column in self.columns.values():
+                column.append(0)
+        return i
+
+    def stats(self, user_id):
+        """Return a user's counters as a dict"""
+        i = self.row(user_id)
+        return {field: column[i] for field, column in self.columns.items()}
+
+    def add_bonus(self, user_id, amount):
+        """Adjust a user's bonus invites, never dropping below zero, and return the new total"""
+        i = self.row(user_id)
+        bonus = self.columns['bonus']
+        bonus[i] = max(0, bonus[i] + amount)
+        return bonus[i]
+
+    def scores(self):
+        """Total invite score for every row, in row order"""
+        c = self.columns
+        return [inv + bon - fake - rej for inv, bon, fake, rej in zip(c['invites'], c['bonus'], c['fake'], c['rejoins'])]
+
+    def top(self, n):
+        """Return (user_id, score) for the n highest scores"""
+        return heapq.nlargest(n, zip(self.ids, self.scores()), key=operator.itemgetter(1))
+
+    def save(self, path=INVITE_DATA_FILE):
+        """Write the columns to disk, replacing the previous file atomically"""
+        data = {'ids': self.ids, **{field: column.tolist() for field, column in self.columns.items()}}
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=INVITE_DATA_FILE):
+        """Build a store from a saved file, or an empty one if there is none"""
+        store = cls()
+        if not os.path.exists(path):
+            return store
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            store.ids = [int(user_id) for user_id in data['ids']]
+            store.idx = {user_id: i for i, user_id in enumerate(store.ids)}
+            store.columns = {field: array('q', data[field]) for field in INVITE_FIELDS}
+        except Exception as e:
+            logger.error(f"Error loading invite data: {e}")
+            store = cls()
+        return store
+
+def save_invite_data():
+    try:
+        user_invites.save()
+    except Exception as e:
+        logger.error(f"Error saving invite data: {e}")
+
+user_invites = InviteStore.load()
 user_message_counts = {}
 daily_reset = None
 weekly_reset = None
@@ -347,6 +485,23 @@ WORDBOMB_SEQUENCES = [
     "ough", "ight", "ould", "ance", "ence", "able", "ible", "ment", "ness", "less", "ful", "ous"
 ]
 
+# Custom emoji players react with to join group games
+_JOIN_EMOJI_ID = 1414593140156792893
+
+# Join windows that are open: message id -> ids of users who reacted
+_pending_joins = {}
+
+# Leaderboard medals for the top three places
+_MEDALS = ("🥇", "🥈", "🥉")
+
+# Final leaderboard lines for point and round based games
+_POINTS_LINE = "{} <@{}>: **{}** points\n"
+_ROUNDS_LINE = "{} <@{}>: **{}/{}** ({}%)\n"
+
+def _medal(i):
+    """Return the medal (or "N.") prefix for a 1-based leaderboard position"""
+    return _MEDALS[i - 1] if i <= 3 else f"{i}."
+
 def reset_message_counts():
     """Reset message counts based on time periods"""
     global daily_reset, weekly_reset, monthly_reset
@@ -397,16 +552,10 @@ def predict_weights(current_age, current_weight, target_ages=None):
     if multiplier is None:
         return None
 
+    table = BASE_WEIGHT_TABLE
     if target_ages is None:
-        target_ages = list(range(1, 101))
-
-    predictions = {}
-    for age in target_ages:
-        if age in BASE_WEIGHTS:
-            predicted_weight = BASE_WEIGHTS[age] * multiplier
-            predictions[age] = round(predicted_weight, 2)
-
-    return predictions
+        return {age: round(table[age] * multiplier, 2) for age in range(1, 101)}
+    return {age: round(table[age] * multiplier, 2) for age in target_ages if age in BASE_WEIGHTS}
 
 # Automod Ban View
 class AutomodBanView(discord.ui.View):
@@ -480,12 +629,12 @@ async def on_ready():
 
     # Initialize database tables
     try:
-        mod_db.init_database()
+        await asyncio.to_thread(mod_db.init_database)
         logger.info("Database tables initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
 
-    load_pet_data()
+    await asyncio.to_thread(load_pet_data)
     await cache_invites()
     reset_message_counts()
 
@@ -520,6 +669,29 @@ async def on_disconnect():
 async def on_resumed():
     logger.info("Bot reconnected to Discord!")
 
+@bot.event
+async def on_raw_reaction_add(payload):
+    joins = _pending_joins.get(payload.message_id)
+    if joins is not None and payload.emoji.id == _JOIN_EMOJI_ID and not (payload.member and payload.member.bot):
+        joins.add(payload.user_id)
+
+@bot.event
+async def on_raw_reaction_remove(payload):
+    joins = _pending_joins.get(payload.message_id)
+    if joins is not None and payload.emoji.id == _JOIN_EMOJI_ID:
+        joins.discard(payload.user_id)
+
+async def wait_for_joins(message):
+    """Open a 20 second join window on a group game message and return the ids of users who joined"""
+    joins = _pending_joins[message.id] = set()
+    try:
+        # Bot reacts first
+        await message.add_reaction("<:GsRight:1414593140156792893>")
+        await asyncio.sleep(20)
+    finally:
+        del _pending_joins[message.id]
+    return joins
+
 @bot.event
 async def on_message(message):
     if message.author.bot:
@@ -540,17 +712,13 @@ async def on_message(message):
     # Chat guide message system - only track messages in the specific channel
     channel_id = message.channel.id
     if channel_id == CHAT_GUIDE_CHANNEL_ID:
-        if channel_id not in channel_message_counts:
-            channel_message_counts[channel_id] = 0
-
         channel_message_counts[channel_id] += 1
 
         # Check if we should send chat guide message
         if channel_message_counts[channel_id] % CHAT_GUIDE_INTERVAL == 0:
             # Check cooldown to prevent spam (5 minute cooldown)
             current_time = discord.utils.utcnow()
-            if channel_id not in chat_guide_cooldown or \
-               (current_time - chat_guide_cooldown[channel_id]).total_seconds() > 300:
+            if (current_time - chat_guide_cooldown.get(channel_id, _NEVER_SENT)).total_seconds() > 300:
                 try:
                     await message.channel.send(CHAT_GUIDE_MESSAGE)
                     chat_guide_cooldown[channel_id] = current_time
@@ -559,7 +727,7 @@ async def on_message(message):
                     logger.error(f"Error sending chat guide message: {e}")
 
     # Automoderation check (skip admins)
-    is_admin = message.author.guild_permissions.manage_guild or message.author.guild_permissions.administrator
+    is_admin = message.author.guild_permissions.value & (_MANAGE_GUILD_BIT | _ADMIN_BIT)
 
     if not is_admin:
         message_lower = message.content.lower()
@@ -607,23 +775,26 @@ async def on_message(message):
 
                     # Log in database with error handling
                     try:
-                        action_id = mod_db.add_moderation_action(
+                        pending_actions = [queue_moderation_action(
                             user_id=message.author.id,
                             moderator_id=bot.user.id,
                             server_id=message.guild.id,
                             action_type="warn",
                             reason=f"Automod: Used banned word '{banned_word}'"
-                        )
+                        )]
 
                         if timeout_success:
-                            mod_db.add_moderation_action(
+                            pending_actions.append(queue_moderation_action(
                                 user_id=message.author.id,
                                 moderator_id=bot.user.id,
                                 server_id=message.guild.id,
                                 action_type="mute",
                                 reason=f"Automod: Used banned word '{banned_word}'",
                                 duration_minutes=duration_minutes
-                            )
+                            ))
+
+                        # Both rows land in the same bulk insert
+                        await asyncio.gather(*pending_actions)
                         database_logged = True
                     except Exception as db_error:
                         logger.error(f"Database error in automod: {db_error}")
@@ -705,7 +876,7 @@ async def on_message(message):
 
                     # React to show it was correct
                     try:
-                        await message.add_reaction('<:GsRight:1414593140156792893> ')
+                        await message.add_reaction('<:GsRight:1414593140156792893>')
                     except:
                         pass
 
@@ -745,7 +916,7 @@ async def on_message(message):
 
                 # React to show it was correct
                 try:
-                    await message.add_reaction('<:GsRight:1414593140156792893> ')
+                    await message.add_reaction('<:GsRight:1414593140156792893>')
                 except:
                     pass
 
@@ -773,7 +944,7 @@ async def on_message(message):
 
                 # React to show it was correct
                 try:
-                    await message.add_reaction('<:GsRight:1414593140156792893> ')
+                    await message.add_reaction('<:GsRight:1414593140156792893>')
                 except:
                     pass
 
@@ -886,7 +1057,7 @@ async def petvalue(ctx, *, pet_name: str):
         # Lazy fallback: Load pets if database is empty 
         if not PET_DATABASE:
             logger.warning("PET_DATABASE is empty, attempting to reload...")
-            load_pet_data()
+            await asyncio.to_thread(load_pet_data)
             
         logger.info(f"🔍 Pet value lookup for '{pet_name}' - Database has {len(PET_DATABASE)} pets")
         # Enhanced search
@@ -1117,7 +1288,7 @@ async def petvalue(ctx, *, pet_name: str):
         logger.error(f"Error in petvalue command: {e}")
         await ctx.send("<:GsWrong:1414561861352816753>   An error occurred while looking up pet values")
 
-    if not ctx.author.guild_permissions.administrator:
+    if not ctx.author.guild_permissions.value & _ADMIN_BIT:
         await ctx.send("<:GsWrong:1414561861352816753>   You need administrator permissions to force update the database.")
         return
 
@@ -1322,10 +1493,7 @@ async def end_country_game(ctx):
         # Sort players by score
         sorted_players = sorted(game['players'].items(), key=lambda x: x[1], reverse=True)
 
-        leaderboard = ""
-        for i, (user_id, score) in enumerate(sorted_players, 1):
-            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-            leaderboard += f"{medal} <@{user_id}>: **{score}** points\n"
+        leaderboard = "".join(_POINTS_LINE.format(_medal(i), user_id, score) for i, (user_id, score) in enumerate(sorted_players, 1))
 
         embed = discord.Embed(
             title="🎮 Game Over! Final Scores:",
@@ -1530,10 +1698,7 @@ async def end_math_game(ctx):
         # Sort players by score
         sorted_players = sorted(game['players'].items(), key=lambda x: x[1], reverse=True)
 
-        leaderboard = ""
-        for i, (user_id, score) in enumerate(sorted_players, 1):
-            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-            leaderboard += f"{medal} <@{user_id}>: **{score}** points\n"
+        leaderboard = "".join(_POINTS_LINE.format(_medal(i), user_id, score) for i, (user_id, score) in enumerate(sorted_players, 1))
 
         embed = discord.Embed(
             title="🎮 Game Over! Final Scores:",
@@ -1574,20 +1739,8 @@ async def group_math_game(ctx):
 
     message = await ctx.send(embed=embed)
 
-    # Bot reacts first
-    await message.add_reaction("<:GsRight:1414593140156792893> ")
-
-    # Wait 20 seconds for reactions
-    await asyncio.sleep(20)
-
-    # Get participants
-    updated_message = await ctx.channel.fetch_message(message.id)
-    participants = set()
-    for reaction in updated_message.reactions:
-        if str(reaction.emoji) == "<:GsRight:1414593140156792893> ":
-            async for user in reaction.users():
-                if not user.bot:
-                    participants.add(user.id)
+    # Collect everyone who reacts in the next 20 seconds
+    participants = await wait_for_joins(message)
 
     if not participants:
         await ctx.send("<:GsWrong:1414561861352816753>   No one joined the game! Better luck next time.")
@@ -1602,7 +1755,7 @@ async def group_math_game(ctx):
         'max_rounds': 10,
         'start_time': discord.utils.utcnow(),
         'answered_this_round': set(),
-        'participants': participants
+        'participants': frozenset(participants)
     }
 
     embed = discord.Embed(
@@ -1643,20 +1796,8 @@ async def group_country_quiz(ctx):
 
     message = await ctx.send(embed=embed)
 
-    # Bot reacts first
-    await message.add_reaction("<:GsRight:1414593140156792893> ")
-
-    # Wait 20 seconds for reactions
-    await asyncio.sleep(20)
-
-    # Get participants
-    updated_message = await ctx.channel.fetch_message(message.id)
-    participants = set()
-    for reaction in updated_message.reactions:
-        if str(reaction.emoji) == "<:GsRight:1414593140156792893> ":
-            async for user in reaction.users():
-                if not user.bot:
-                    participants.add(user.id)
+    # Collect everyone who reacts in the next 20 seconds
+    participants = await wait_for_joins(message)
 
     if not participants:
         await ctx.send("<:GsWrong:1414561861352816753>   No one joined the game! Better luck next time.")
@@ -1671,7 +1812,7 @@ async def group_country_quiz(ctx):
         'max_rounds': 10,
         'start_time': discord.utils.utcnow(),
         'answered_this_round': set(),
-        'participants': participants
+        'participants': frozenset(participants)
     }
 
     embed = discord.Embed(
@@ -1799,11 +1940,11 @@ async def end_group_math_game(ctx):
         # Sort players by score
         sorted_players = sorted(game['players'].items(), key=lambda x: x[1], reverse=True)
 
-        leaderboard = ""
-        for i, (user_id, score) in enumerate(sorted_players, 1):
-            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-            percentage = int((score / game['max_rounds']) * 100)
-            leaderboard += f"{medal} <@{user_id}>: **{score}/{game['max_rounds']}** ({percentage}%)\n"
+        max_rounds = game['max_rounds']
+        leaderboard = "".join(
+            _ROUNDS_LINE.format(_medal(i), user_id, score, max_rounds, int((score / max_rounds) * 100))
+            for i, (user_id, score) in enumerate(sorted_players, 1)
+        )
 
         embed = discord.Embed(
             title="🎮 Group Math Game Over! Final Leaderboard:",
@@ -1842,11 +1983,11 @@ async def end_group_country_game(ctx):
         # Sort players by score
         sorted_players = sorted(game['players'].items(), key=lambda x: x[1], reverse=True)
 
-        leaderboard = ""
-        for i, (user_id, score) in enumerate(sorted_players, 1):
-            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-            percentage = int((score / game['max_rounds']) * 100)
-            leaderboard += f"{medal} <@{user_id}>: **{score}/{game['max_rounds']}** ({percentage}%)\n"
+        max_rounds = game['max_rounds']
+        leaderboard = "".join(
+            _ROUNDS_LINE.format(_medal(i), user_id, score, max_rounds, int((score / max_rounds) * 100))
+            for i, (user_id, score) in enumerate(sorted_players, 1)
+        )
 
         embed = discord.Embed(
             title="🎮 Group Countries Quiz Over! Final Leaderboard:",
@@ -1888,20 +2029,8 @@ async def group_scramble_game(ctx):
 
     message = await ctx.send(embed=embed)
 
-    # Bot reacts first
-    await message.add_reaction("<:GsRight:1414593140156792893> ")
-
-    # Wait 20 seconds for reactions
-    await asyncio.sleep(20)
-
-    # Get participants
-    updated_message = await ctx.channel.fetch_message(message.id)
-    participants = set()
-    for reaction in updated_message.reactions:
-        if str(reaction.emoji) == "<:GsRight:1414593140156792893> ":
-            async for user in reaction.users():
-                if not user.bot:
-                    participants.add(user.id)
+    # Collect everyone who reacts in the next 20 seconds
+    participants = await wait_for_joins(message)
 
     if not participants:
         await ctx.send("<:GsWrong:1414561861352816753>   No one joined the game! Better luck next time.")
@@ -1919,7 +2048,7 @@ async def group_scramble_game(ctx):
         'max_rounds': 10,
         'start_time': discord.utils.utcnow(),
         'answered_this_round': set(),
-        'participants': participants
+        'participants': frozenset(participants)
     }
 
     embed = discord.Embed(
@@ -2068,11 +2197,11 @@ async def end_group_scramble_game(ctx):
         # Sort players by score
         sorted_players = sorted(game['players'].items(), key=lambda x: x[1], reverse=True)
 
-        leaderboard = ""
-        for i, (user_id, score) in enumerate(sorted_players, 1):
-            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-            percentage = int((score / game['max_rounds']) * 100)
-            leaderboard += f"{medal} <@{user_id}>: **{score}/{game['max_rounds']}** ({percentage}%)\n"
+        max_rounds = game['max_rounds']
+        leaderboard = "".join(
+            _ROUNDS_LINE.format(_medal(i), user_id, score, max_rounds, int((score / max_rounds) * 100))
+            for i, (user_id, score) in enumerate(sorted_players, 1)
+        )
 
         embed = discord.Embed(
             title="🎮 Group Word Scramble Over! Final Leaderboard:",
@@ -2114,20 +2243,8 @@ async def group_wordbomb_game(ctx):
 
     message = await ctx.send(embed=embed)
 
-    # Bot reacts first
-    await message.add_reaction("<:GsRight:1414593140156792893> ")
-
-    # Wait 20 seconds for reactions
-    await asyncio.sleep(20)
-
-    # Get participants
-    updated_message = await ctx.channel.fetch_message(message.id)
-    participants = set()
-    for reaction in updated_message.reactions:
-        if str(reaction.emoji) == "<:GsRight:1414593140156792893> ":
-            async for user in reaction.users():
-                if not user.bot:
-                    participants.add(user.id)
+    # Collect everyone who reacts in the next 20 seconds
+    participants = await wait_for_joins(message)
 
     if not participants:
         await ctx.send("<:GsWrong:1414561861352816753>   No one joined the game! Better luck next time.")
@@ -2136,33 +2253,37 @@ async def group_wordbomb_game(ctx):
     # Select random letter sequence
     sequence = random.choice(WORDBOMB_SEQUENCES)
 
-    active_group_wordbomb_games[ctx.channel.id] = {
-        'sequence': sequence,
-        'players': {},
-        'round': 1,
-        'max_rounds': 10,
-        'start_time': discord.utils.utcnow(),
-        'answered_this_round': set(),
-        'used_words': set(),
-        'participants': participants
-    }
+    # Always free the channel, even if a round fails part way through
+    try:
+        active_group_wordbomb_games[ctx.channel.id] = {
+            'sequence': sequence,
+            'players': {},
+            'round': 1,
+            'max_rounds': 10,
+            'start_time': discord.utils.utcnow(),
+            'answered_this_round': set(),
+            'used_words': set(),
+            'participants': frozenset(participants)
+        }
 
-    embed = discord.Embed(
-        title="💣 Group Word Bomb Started!",
-        description=f"**Round 1/10:** Make words containing! 💥\n\n**{sequence.upper()}**",
-        color=0xFFC916,
-        timestamp=discord.utils.utcnow()
-    )
-    embed.add_field(name="⏰ Time Limit", value="25 seconds per round ⏱️", inline=True)
-    embed.add_field(name="👥 Players", value=f"{len(participants)} joined! 🎯", inline=True)
-    embed.add_field(name="📋 Rules", value="At least 3 letters, no repeats!", inline=True)
-    embed.set_footer(text="🔥 Game Services • Group Word Bomb!")
+        embed = discord.Embed(
+            title="💣 Group Word Bomb Started!",
+            description=f"**Round 1/10:** Make words containing! 💥\n\n**{sequence.upper()}**",
+            color=0xFFC916,
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="⏰ Time Limit", value="25 seconds per round ⏱️", inline=True)
+        embed.add_field(name="👥 Players", value=f"{len(participants)} joined! 🎯", inline=True)
+        embed.add_field(name="📋 Rules", value="At least 3 letters, no repeats!", inline=True)
+        embed.set_footer(text="🔥 Game Services • Group Word Bomb!")
 
-    await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
-    # Wait for answers
-    await asyncio.sleep(25)  # Give 25 seconds for everyone to answer
-    await continue_group_wordbomb_game(ctx)
+        # Wait for answers
+        await asyncio.sleep(25)  # Give 25 seconds for everyone to answer
+        await continue_group_wordbomb_game(ctx)
+    finally:
+        active_group_wordbomb_games.pop(ctx.channel.id, None)
 
 async def continue_group_wordbomb_game(ctx):
     """Continue the group word bomb game"""
@@ -2173,10 +2294,10 @@ async def continue_group_wordbomb_game(ctx):
 
     # Show who got words this round
     if game['answered_this_round']:
-        correct_users = [f"<@{uid}>" for uid in game['answered_this_round']]
+        correct_mentions = ", ".join(f"<@{uid}>" for uid in game['answered_this_round'])
         embed = discord.Embed(
             title="💥 Words Found!",
-            description=f"🎉 **{len(correct_users)}** players found valid words!\n{', '.join(correct_users)}",
+            description=f"🎉 **{len(game['answered_this_round'])}** players found valid words!\n{correct_mentions}",
             color=0xFFC916
         )
         embed.add_field(name="🔤 Sequence", value=f"**{game['sequence'].upper()}**", inline=True)
@@ -2230,10 +2351,10 @@ async def end_group_wordbomb_game(ctx):
         # Sort players by score
         sorted_players = sorted(game['players'].items(), key=lambda x: x[1], reverse=True)
 
-        leaderboard = ""
-        for i, (user_id, score) in enumerate(sorted_players, 1):
-            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-            leaderboard += f"{medal} <@{user_id}>: **{score}** words found\n"
+        leaderboard = "\n".join(
+            f"{_medal(i)} <@{user_id}>: **{score}** words found"
+            for i, (user_id, score) in enumerate(sorted_players, 1)
+        )
 
         embed = discord.Embed(
             title="🎮 Group Word Bomb Over! Final Leaderboard:",
@@ -2252,7 +2373,18 @@ async def end_group_wordbomb_game(ctx):
         embed.set_footer(text="🔥 Game Services • Thanks for playing!")
 
     await ctx.send(embed=embed)
-    del active_group_wordbomb_games[ctx.channel.id]
+    active_group_wordbomb_games.pop(ctx.channel.id, None)
+
+def _make_calc_embed(title, desc, expr, extra_fields=(), timestamped=False):
+    """Build a calculator embed with the expression field followed by any extra (name, value) fields"""
+    fields = [{'name': "📝 Expression", 'value': f"`{expr}`", 'inline': False}]
+    fields.extend({'name': name, 'value': value, 'inline': False} for name, value in extra_fields)
+    data = {'title': title, 'color': 0xFFC916, 'fields': fields, 'footer': {'text': "🔥 Game Services • Calculator"}}
+    if desc is not None:
+        data['description'] = desc
+    if timestamped:
+        data['timestamp'] = discord.utils.utcnow().isoformat()
+    return discord.Embed.from_dict(data)
 
 @bot.command(name="c", aliases=["calc", "calculator"])
 async def calculate(ctx, *, expression: str):
@@ -2281,38 +2413,13 @@ async def calculate(ctx, *, expression: str):
                 else:
                     result = round(result, 6)  # Round to 6 decimal places
 
-            embed = discord.Embed(
-                title="🧮 Calculator Result",
-                color=0xFFC916,
-                timestamp=discord.utils.utcnow()
-            )
-            embed.add_field(name="📝 Expression", value=f"`{expression}`", inline=False)
-            embed.add_field(name="🎯 Result", value=f"**{result}**", inline=False)
-            embed.add_field(name="💡 Usage", value="Try: `gs.c 4+11`, `gs.c 4/11`, `gs.c 4x11`, `gs.c (5+3)*2`", inline=False)
-            embed.set_footer(text="🔥 Game Services • Calculator")
-
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_make_calc_embed("🧮 Calculator Result", None, expression, [("🎯 Result", f"**{result}**"), ("💡 Usage", "Try: `gs.c 4+11`, `gs.c 4/11`, `gs.c 4x11`, `gs.c (5+3)*2`")], timestamped=True))
 
         except ZeroDivisionError:
-            embed = discord.Embed(
-                title="<:GsWrong:1414561861352816753>   Calculation Error",
-                description="Cannot divide by zero!",
-                color=0xFFC916
-            )
-            embed.add_field(name="📝 Expression", value=f"`{expression}`", inline=False)
-            embed.set_footer(text="🔥 Game Services • Calculator")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_make_calc_embed("<:GsWrong:1414561861352816753>   Calculation Error", "Cannot divide by zero!", expression))
 
         except Exception as e:
-            embed = discord.Embed(
-                title="<:GsWrong:1414561861352816753>   Calculation Error",
-                description="Invalid mathematical expression!",
-                color=0xFFC916
-            )
-            embed.add_field(name="📝 Expression", value=f"`{expression}`", inline=False)
-            embed.add_field(name="💡 Tip", value="Make sure your expression is valid. Example: `gs.c 4+11`", inline=False)
-            embed.set_footer(text="🔥 Game Services • Calculator")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_make_calc_embed("<:GsWrong:1414561861352816753>   Calculation Error", "Invalid mathematical expression!", expression, [("💡 Tip", "Make sure your expression is valid. Example: `gs.c 4+11`")]))
 
     except Exception as e:
         logger.error(f"Error in calculator command: {e}")
@@ -2358,7 +2465,8 @@ async def show_messages(ctx, user: discord.Member = None):
 @bot.command(name="msgtop", aliases=["messageleaderboard", "msgleaderboard"])
 async def message_leaderboard(ctx, period: str = "daily"):
     """🏆 Show top message senders"""
-    if period.lower() not in ['daily', 'weekly', 'monthly']:
+    key = period.lower()
+    if key not in ['daily', 'weekly', 'monthly']:
         embed = discord.Embed(
             title="<:GsWrong:1414561861352816753>   Invalid Period",
             description="Please specify: `daily`, `weekly`, or `monthly` 📅",
@@ -2376,29 +2484,24 @@ async def message_leaderboard(ctx, period: str = "daily"):
         await ctx.send(embed=embed)
         return
 
-    # Sort by the specified period
-    leaderboard = []
-    for user_id, data in user_message_counts.items():
-        count = data[period.lower()]
-        if count > 0:
-            leaderboard.append((user_id, count))
-
-    leaderboard.sort(key=lambda x: x[1], reverse=True)
-    leaderboard = leaderboard[:10]  # Top 10
+    # Top 10 for the specified period
+    leaderboard = heapq.nlargest(
+        10,
+        ((user_id, data[key]) for user_id, data in user_message_counts.items() if data[key] > 0),
+        key=operator.itemgetter(1)
+    )
 
     embed = discord.Embed(
         title=f"🏆 {period.title()} Message Leaderboard",
-        description=f"Top 10 most active members ({period.lower()}) 💬",
+        description=f"Top 10 most active members ({key}) 💬",
         color=0xFFC916,
         timestamp=discord.utils.utcnow()
     )
 
-    leaderboard_text = ""
-    for i, (user_id, count) in enumerate(leaderboard, 1):
-        user = bot.get_user(user_id)
-        if user:
-            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-            leaderboard_text += f"{medal} {user.mention}: **{count}** messages 📝\n"
+    leaderboard_text = "\n".join(
+        f"{_medal(i)} <@{user_id}>: **{count}** messages 📝"
+        for i, (user_id, count) in enumerate(leaderboard, 1)
+    )
 
     if leaderboard_text:
         embed.add_field(name="📋 Rankings", value=leaderboard_text, inline=False)
@@ -2440,7 +2543,7 @@ class ReportConfirmationView(discord.ui.View):
 
             # Confirmation to reporter
             confirm_embed = discord.Embed(
-                title="<:GsRight:1414593140156792893>  Report Submitted Successfully",
+                title=f"{RIGHT_EMOJI}  Report Submitted Successfully",
                 description=f"Your report against {self.user.mention} has been sent to the moderation team.",
                 color=0xFFC916,
                 timestamp=discord.utils.utcnow()
@@ -2463,7 +2566,7 @@ class ReportConfirmationView(discord.ui.View):
             except:
                 pass
 
-    @discord.ui.button(label="Cancel Report", style=discord.ButtonStyle.secondary, emoji="<:GsWrong:1414561861352816753>  ")
+    @discord.ui.button(label="Cancel Report", style=discord.ButtonStyle.secondary, emoji=f"{WRONG_EMOJI}  ")
     async def cancel_report(self, interaction: discord.Interaction, button: discord.ui.Button):
         if interaction.user != self.reporter:
             try:
@@ -2477,7 +2580,7 @@ class ReportConfirmationView(discord.ui.View):
 
             self.confirmed = False
             cancel_embed = discord.Embed(
-                title="<:GsWrong:1414561861352816753>   Report Cancelled",
+                title=f"{WRONG_EMOJI}   Report Cancelled",
                 description="Your report has been cancelled and will not be sent to the moderation team.",
                 color=0x808080
             )
@@ -2500,7 +2603,7 @@ class StaffModerationView(discord.ui.View):
         self.reporter = reporter
         self.reason = reason
 
-    @discord.ui.button(label="Approve Report", style=discord.ButtonStyle.success, emoji="<:GsRight:1414593140156792893>")
+    @discord.ui.button(label="Approve Report", style=discord.ButtonStyle.success, emoji=RIGHT_EMOJI)
     async def approve_report(self, interaction: discord.Interaction, button: discord.ui.Button):
         if not interaction.user.guild_permissions.kick_members:
             try:
@@ -2514,7 +2617,7 @@ class StaffModerationView(discord.ui.View):
             mod_view = QuickModerationView(self.reported_user, interaction.user, self.reason)
 
             embed = discord.Embed(
-                title="<:GsRight:1414593140156792893>  Report Approved - Choose Action",
+                title=f"{RIGHT_EMOJI}  Report Approved - Choose Action",
                 description=f"Report against {self.reported_user.mention} has been approved by {interaction.user.mention}",
                 color=0xFFC916,
                 timestamp=discord.utils.utcnow()
@@ -2522,7 +2625,7 @@ class StaffModerationView(discord.ui.View):
             embed.add_field(name="📋 Original Reason", value=self.reason, inline=False)
             embed.add_field(name="👤 Reporter", value=self.reporter.mention, inline=True)
             embed.add_field(name="👮 Reviewing Staff", value=interaction.user.mention, inline=True)
-            embed.set_footer(text="🔥 Game Services Moderation System")
+            embed.set_footer(text=MOD_FOOTER)
 
             await interaction.response.edit_message(embed=embed, view=mod_view)
         except Exception as e:
@@ -2533,7 +2636,7 @@ class StaffModerationView(discord.ui.View):
             except:
                 pass
 
-    @discord.ui.button(label="Deny Report", style=discord.ButtonStyle.danger, emoji="<:GsWrong:1414561861352816753>  ")
+    @discord.ui.button(label="Deny Report", style=discord.ButtonStyle.danger, emoji=f"{WRONG_EMOJI}  ")
     async def deny_report(self, interaction: discord.Interaction, button: discord.ui.Button):
         if not interaction.user.guild_permissions.kick_members:
             try:
@@ -2544,7 +2647,7 @@ class StaffModerationView(discord.ui.View):
 
         try:
             embed = discord.Embed(
-                title="<:GsWrong:1414561861352816753>   Report Denied",
+                title=f"{WRONG_EMOJI}   Report Denied",
                 description=f"Report against {self.reported_user.mention} has been denied by {interaction.user.mention}",
                 color=0x808080,
                 timestamp=discord.utils.utcnow()
@@ -2553,7 +2656,7 @@ class StaffModerationView(discord.ui.View):
             embed.add_field(name="👤 Reporter", value=self.reporter.mention, inline=True)
             embed.add_field(name="👮 Reviewing Staff", value=interaction.user.mention, inline=True)
             embed.add_field(name="📝 Status", value="No action taken - Report deemed invalid", inline=False)
-            embed.set_footer(text="🔥 Game Services Moderation System")
+            embed.set_footer(text=MOD_FOOTER)
 
             await interaction.response.edit_message(embed=embed, view=None)
         except Exception as e:
@@ -2564,6 +2667,122 @@ class StaffModerationView(discord.ui.View):
             except:
                 pass
 
+# Short-lived cache of moderation records per (user_id, server_id)
+RECORD_CACHE_TTL = 30  # Seconds a cached lookup stays valid
+RECORD_CACHE_MAX = 4096
+_record_cache = {}
+
+def _prune_record_cache(now):
+    """Drop expired users from the record cache, then the oldest ones if it is still full"""
+    for user_key in [k for k, entries in _record_cache.items() if all(now - cached_at >= RECORD_CACHE_TTL for cached_at, _ in entries.values())]:
+        del _record_cache[user_key]
+    while len(_record_cache) >= RECORD_CACHE_MAX:
+        del _record_cache[next(iter(_record_cache))]
+
+async def _cached_record_query(user_id, server_id, query, filters):
+    """Run a per-user moderation query, reusing its result from the last RECORD_CACHE_TTL seconds"""
+    now = time.monotonic()
+    entries = _record_cache.get((user_id, server_id))
+    if entries is None:
+        if len(_record_cache) >= RECORD_CACHE_MAX:
+            _prune_record_cache(now)
+        entries = _record_cache[(user_id, server_id)] = {}
+
+    key = (query.__name__, tuple(sorted(filters.items())))
+    cached = entries.get(key)
+    if cached and now - cached[0] < RECORD_CACHE_TTL:
+        return cached[1]
+
+    result = await asyncio.to_thread(query, user_id, server_id, **filters)
+    entries[key] = (now, result)
+    return result
+
+async def get_user_record_cached(user_id, server_id, **filters):
+    """Cached mod_db.get_user_record"""
+    if has_no_actions(user_id, server_id):
+        return []
+    return await _cached_record_query(user_id, server_id, mod_db.get_user_record, filters)
+
+async def count_user_actions_cached(user_id, server_id, **filters):
+    """Cached mod_db.count_user_actions"""
+    if has_no_actions(user_id, server_id):
+        return 0
+    return await _cached_record_query(user_id, server_id, mod_db.count_user_actions, filters)
+
+async def get_user_action_summary_cached(user_id, server_id):
+    """Cached mod_db.get_user_action_summary"""
+    if has_no_actions(user_id, server_id):
+        return {}
+    return await _cached_record_query(user_id, server_id, mod_db.get_user_action_summary, {})
+
+def invalidate_user_record(user_id, server_id):
+    """Drop the cached records for a user after their history changes"""
+    _record_cache.pop((user_id, server_id), None)
+
+# Number of recorded actions per (user_id, server_id), loaded once in setup_hook before commands are served
+_action_counts = None
+
+async def load_action_counts():
+    """Load the per-user action counts before the bot connects, so no action can be recorded mid-load"""
+    global _action_counts
+    try:
+        rows = await asyncio.to_thread(mod_db.count_actions_by_user)
+    except Exception as e:
+        logger.error(f"Error loading moderation action counts: {e}")
+        return
+    _action_counts = Counter({(row['user_id'], row['server_id']): row['count'] for row in rows})
+
+bot.setup_hook = load_action_counts
+
+def has_no_actions(user_id, server_id):
+    """Return True if the user is known to have no moderation actions in the server"""
+    # if the startup load failed the counts are unknown and callers go to the database
+    return _action_counts is not None and _action_counts[(user_id, server_id)] == 0
+
+def record_added_actions(user_id, server_id, count=1):
+    """Note newly recorded actions for a user so cached lookups stay correct"""
+    invalidate_user_record(user_id, server_id)
+    if _action_counts is not None:
+        _action_counts[(user_id, server_id)] += count
+
+# Batched moderation action writes
+_mod_queue = None
+_mod_flusher_task = None
+
+async def _mod_flusher():
+    """Drain queued moderation actions and insert them in bulk"""
+    while True:
+        # a lone action is written straight away; under load, whatever queued up
+        # while the previous insert ran goes in together
+        batch = [await _mod_queue.get()]
+        while not _mod_queue.empty():
+            batch.append(_mod_queue.get_nowait())
+
+        try:
+            action_ids = await asyncio.to_thread(mod_db.add_moderation_actions_batch, [action for action, _ in batch])
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} moderation actions: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+
+        for (action, future), action_id in zip(batch, action_ids):
+            record_added_actions(action['user_id'], action['server_id'])
+            if not future.done():
+                future.set_result(action_id)
+
+async def queue_moderation_action(**action):
+    """Queue a moderation action for the next bulk insert and return its database id"""
+    global _mod_queue, _mod_flusher_task
+    if _mod_flusher_task is None or _mod_flusher_task.done():
+        _mod_queue = asyncio.Queue()
+        _mod_flusher_task = asyncio.create_task(_mod_flusher())
+
+    future = asyncio.get_running_loop().create_future()
+    await _mod_queue.put((action, future))
+    return await future
+
 class QuickModerationView(discord.ui.View):
     def __init__(self, user, moderator, reason, reporter=None):
         super().__init__(timeout=1800)  # 30 minutes timeout
@@ -2594,8 +2813,14 @@ class QuickModerationView(discord.ui.View):
 
     async def execute_quick_action(self, interaction, action_type, duration=None):
         try:
+            # The log row waits for the next batched insert, which can outlast the 3s acknowledgement window
+            await interaction.response.defer()
+
+            # One timestamp for the timeout and the success embed
+            now = discord.utils.utcnow()
+
             if action_type == "warn":
-                action_id = mod_db.add_moderation_action(
+                pending_log = queue_moderation_action(
                     user_id=self.user.id,
                     moderator_id=self.moderator.id,
                     server_id=interaction.guild.id,
@@ -2607,17 +2832,16 @@ class QuickModerationView(discord.ui.View):
                 duration_minutes = parse_duration(duration)
                 if duration_minutes and duration_minutes > 0:
                     # Discord timeout max is 28 days, ensure we don't exceed it
-                    max_minutes = 28 * 24 * 60  # 28 days in minutes
-                    duration_minutes = min(duration_minutes, max_minutes)
-                    timeout_until = discord.utils.utcnow() + timedelta(minutes=duration_minutes)
+                    duration_minutes = min(duration_minutes, MAX_MUTE_MINUTES)
+                    timeout_until = now + timedelta(minutes=duration_minutes)
                     await self.user.timeout(timeout_until, reason=self.reason)
                 else:
                     # Default to 10 minutes if parsing fails
-                    timeout_until = discord.utils.utcnow() + timedelta(minutes=10)
+                    timeout_until = now + timedelta(minutes=DEFAULT_MUTE_MINUTES)
                     await self.user.timeout(timeout_until, reason=self.reason)
-                    duration_minutes = 10
+                    duration_minutes = DEFAULT_MUTE_MINUTES
 
-                action_id = mod_db.add_moderation_action(
+                pending_log = queue_moderation_action(
                     user_id=self.user.id,
                     moderator_id=self.moderator.id,
                     server_id=interaction.guild.id,
@@ -2628,7 +2852,7 @@ class QuickModerationView(discord.ui.View):
 
             elif action_type == "kick":
                 await interaction.guild.kick(self.user, reason=self.reason)
-                action_id = mod_db.add_moderation_action(
+                pending_log = queue_moderation_action(
                     user_id=self.user.id,
                     moderator_id=self.moderator.id,
                     server_id=interaction.guild.id,
@@ -2636,34 +2860,46 @@ class QuickModerationView(discord.ui.View):
                     reason=self.reason
                 )
 
-            # Send DM to user
-            dm_success = await self.send_dm_notification(action_type, duration)
+            # Send DM to user while the action is logged
+            action_id, dm_success = await asyncio.gather(pending_log, self.send_dm_notification(action_type, duration))
 
             # Create success embed
-            if action_type == "warn": title = "⚠️ Warning Issued"
-            elif action_type == "mute": title = f"🔇 User Muted for {duration}"
-            elif action_type == "kick": title = "👢 User Kicked"
-
             embed = discord.Embed(
-                title=f"{title} Successfully",
+                title=ACTION_SUCCESS_TITLES[action_type].format(duration=duration),
                 color=0xFFC916,
-                timestamp=discord.utils.utcnow()
+                timestamp=now
             )
             embed.add_field(name="👤 User", value=f"{self.user.mention} ({self.user})", inline=False)
             embed.add_field(name="👮 Moderator", value=f"{self.moderator.mention}", inline=True)
             embed.add_field(name="📋 Reason", value=self.reason, inline=False)
             embed.add_field(name="🆔 Action ID", value=f"#{action_id}", inline=True)
-            embed.add_field(name="💬 DM Status", value="<:GsRight:1414593140156792893>  Sent" if dm_success else "<:GsWrong:1414561861352816753>   Failed", inline=True)
-            embed.add_field(name="📊 Database", value="<:GsRight:1414593140156792893>  Logged", inline=True)
+            embed.add_field(name="💬 DM Status", value=f"{RIGHT_EMOJI}  Sent" if dm_success else f"{WRONG_EMOJI}   Failed", inline=True)
+            embed.add_field(name="📊 Database", value=f"{RIGHT_EMOJI}  Logged", inline=True)
             if self.reporter:
                 embed.add_field(name="👤 Original Reporter", value=self.reporter.mention, inline=True)
-            embed.set_footer(text="🔥 Game Services Moderation System")
+            embed.set_footer(text=MOD_FOOTER)
 
             await interaction.edit_original_response(embed=embed, view=None)
 
         except Exception as e:
             logger.error(f"Error executing quick action {action_type}: {e}")
-            await interaction.response.send_message(f"Error executing {action_type}: {str(e)}", ephemeral=True)
+            if interaction.response.is_done():
+                await interaction.followup.send(f"Error executing {action_type}: {str(e)}", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"Error executing {action_type}: {str(e)}", ephemeral=True)
+
+    # Constant parts of the DM embed, shared by every quick action
+    _DM_TEMPLATE = {
+        'color': 0xFFC916,
+        'footer_prefix': "🔥 Game Services Moderation System • Today at ",
+        'fields_tail': [
+            {
+                'name': "🚨 Appeal Process",
+                'value': "If you believe this action was taken in error, you may appeal this decision in our appeals server:\n🔗 https://discord.gg/ahharETNNR",
+                'inline': False
+            }
+        ]
+    }
 
     async def send_dm_notification(self, action_type, duration=None):
         """Send DM notification to the user and return success status"""
@@ -2681,23 +2917,24 @@ class QuickModerationView(discord.ui.View):
                 title = f"You have been {action_type}"
                 description = f"You have been {action_type} from the server"
 
-            embed = discord.Embed(
-                title=title,
-                description=description,
-                color=0xFFC916,
-                timestamp=discord.utils.utcnow()
-            )
-            embed.add_field(name="🏠 Server", value=f"{self.moderator.guild.name} (Roblox)", inline=True)
-            embed.add_field(name="👤 Moderator", value=f"{self.moderator} (on study arc)", inline=True)
+            now = discord.utils.utcnow()
+            fields = [
+                {'name': "🏠 Server", 'value': f"{self.moderator.guild.name} (Roblox)", 'inline': True},
+                {'name': "👤 Moderator", 'value': f"{self.moderator} (on study arc)", 'inline': True}
+            ]
             if duration:
-                embed.add_field(name="⏱️ Duration", value=duration, inline=True)
-            embed.add_field(name="📋 Reason", value=self.reason, inline=False)
-            embed.add_field(
-                name="🚨 Appeal Process",
-                value="If you believe this action was taken in error, you may appeal this decision in our appeals server:\n🔗 https://discord.gg/ahharETNNR",
-                inline=False
-            )
-            embed.set_footer(text="🔥 Game Services Moderation System • Today at " + discord.utils.utcnow().strftime("%I:%M %p"))
+                fields.append({'name': "⏱️ Duration", 'value': duration, 'inline': True})
+            fields.append({'name': "📋 Reason", 'value': self.reason, 'inline': False})
+            fields.extend(self._DM_TEMPLATE['fields_tail'])
+
+            embed = discord.Embed.from_dict({
+                'title': title,
+                'description': description,
+                'color': self._DM_TEMPLATE['color'],
+                'timestamp': now.isoformat(),
+                'fields': fields,
+                'footer': {'text': self._DM_TEMPLATE['footer_prefix'] + now.strftime("%I:%M %p")}
+            })
 
             await self.user.send(embed=embed)
             return True
@@ -2705,7 +2942,86 @@ class QuickModerationView(discord.ui.View):
             logger.error(f"Error sending DM to {self.user}: {e}")
             return False
 
+# Discord errors worth retrying: server-side failures and rate limits
+_RETRYABLE_STATUSES = {500, 502, 503, 504}
+
+async def retry_discord(call, *, retries=3, base=1.0, cap=30.0, jitter=0.5):
+    """Await call() and retry transient Discord failures with capped exponential backoff"""
+    for attempt in range(retries):
+        try:
+            return await call()
+        except discord.Forbidden:
+            raise
+        except discord.RateLimited as e:
+            if attempt == retries - 1:
+                raise
+            delay = min(e.retry_after, cap)
+        except discord.HTTPException as e:
+            if e.status not in _RETRYABLE_STATUSES or attempt == retries - 1:
+                raise
+            delay = min(base * 2 ** attempt * (1 + random.random() * jitter), cap)
+        logger.warning(f"Discord call failed, retrying in {delay:.1f}s (attempt {attempt + 1}/{retries})")
+        await asyncio.sleep(delay)
+
+# Permission bits the bot needs for each confirmed action
+_ACTION_PERM_BITS = {
+    "warn": discord.Permissions(send_messages=True).value,
+    "mute": discord.Permissions(moderate_members=True).value,
+    "kick": discord.Permissions(kick_members=True).value,
+    "ban": discord.Permissions(ban_members=True).value,
+    "mutewarn": discord.Permissions(moderate_members=True).value
+}
+
+# Messages shown to the moderator when a confirmed action fails
+_PERM_ERROR_TEMPLATE = "Cannot {verb} {mention}\n\n**Possible causes:**\n• Bot missing `{permission}` permission\n• Target user has higher role than bot\n• Target user is server owner\n\n**Error details:** {error}"
+_MISSING_PERMS_PREFIX = f"{WRONG_EMOJI}   **Bot Missing Permissions**\n"
+_MISSING_PERMS_TEMPLATE = "I'm missing these permissions: **{permissions}**\n\n**How to fix:**\n1. Go to Server Settings → Roles\n2. Find my role and edit permissions\n3. Enable the missing permissions above"
+_HIERARCHY_ERROR_TEMPLATE = WRONG_EMOJI + "   **Role Hierarchy Error**\nI cannot {action} {mention} because their role is equal to or higher than mine.\n\n**Solution:** Move my role above theirs in Server Settings → Roles."
+_PERM_ERROR_EMBED = discord.Embed(title=f"{WRONG_EMOJI}   Permission Error", color=0xFFC916)
+_ACTION_FAIL_EMBED = discord.Embed(title=f"{WRONG_EMOJI}   Action Failed", color=0xFFC916)
+
+async def safe_discord_action(interaction, verb, permission, target, call):
+    """Run a Discord moderation call with retries; report any failure to the moderator and return (ok, result)"""
+    try:
+        return True, await retry_discord(call)
+    except discord.Forbidden as e:
+        embed = _PERM_ERROR_EMBED.copy()
+        embed.description = _PERM_ERROR_TEMPLATE.format(verb=verb, mention=target.mention, permission=permission, error=e)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+    except Exception as e:
+        embed = _ACTION_FAIL_EMBED.copy()
+        embed.title = f"{WRONG_EMOJI}   {verb.title()} Failed"
+        embed.description = str(e)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+    return False, None
+
+# Title of the embed confirming each action to the moderator
+ACTION_SUCCESS_TITLES = {
+    "warn": "⚠️ Warning Issued Successfully",
+    "mute": "🔇 User Muted for {duration} Successfully",
+    "kick": "👢 User Kicked Successfully",
+    "ban": "🔨 User Banned ({duration}) Successfully",
+    "mutewarn": "⚠️🔇 User Warned + Muted for {duration} Successfully"
+}
+
+# Title and description of the DM sent to a user for each action type
+DM_ACTION_TITLES = {
+    "warn": "⚠️ You Have Been Warned",
+    "mute": "🔇 You Have Been Muted",
+    "kick": "👢 You Have Been Kicked",
+    "ban": "🔨 You Have Been Banned",
+    "mutewarn": "⚠️🔇 You Have Been Warned + Muted"
+}
+DM_ACTION_DESCRIPTIONS = {
+    "warn": "You have been warned in the server",
+    "mute": "You have been muted from the server",
+    "kick": "You have been kicked from the server",
+    "ban": "You have been banned from the server",
+    "mutewarn": "You have been warned and muted from the server"
+}
+
 # Confirmation View for moderation actions
+
 class ConfirmationView(discord.ui.View):
     def __init__(self, action_type, user, moderator, reason, duration=None):
         super().__init__(timeout=300)
@@ -2714,8 +3030,9 @@ class ConfirmationView(discord.ui.View):
         self.moderator = moderator
         self.reason = reason
         self.duration = duration
+        self.confirmed_at = None
 
-    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger, emoji="<:GsRight:1414593140156792893> ")
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger, emoji=f"{RIGHT_EMOJI} ")
     async def confirm_action(self, interaction: discord.Interaction, button: discord.ui.Button):
         if interaction.user != self.moderator:
             try:
@@ -2728,184 +3045,56 @@ class ConfirmationView(discord.ui.View):
             # Acknowledge the interaction first
             await interaction.response.defer()
 
+            # One timestamp for the timeout, the DM and the success embed
+            self.confirmed_at = discord.utils.utcnow()
+
             # Check bot permissions first
             bot_member = interaction.guild.get_member(interaction.client.user.id)
             if not bot_member:
-                await interaction.followup.send("<:GsWrong:1414561861352816753>   Error: Bot member not found in guild.", ephemeral=True)
+                await interaction.followup.send(f"{WRONG_EMOJI}   Error: Bot member not found in guild.", ephemeral=True)
                 return
 
             # Check if bot can perform the action
             permission_check = self.check_bot_permissions(bot_member, interaction.guild)
             if not permission_check["success"]:
-                await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Bot Missing Permissions**\n{permission_check['error']}", ephemeral=True)
+                await interaction.followup.send(_MISSING_PERMS_PREFIX + permission_check['error'], ephemeral=True)
                 return
 
             # Check role hierarchy
             if self.user.top_role >= bot_member.top_role:
-                await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Role Hierarchy Error**\nI cannot {self.action_type} {self.user.mention} because their role is equal to or higher than mine.\n\n**Solution:** Move my role above theirs in Server Settings → Roles.", ephemeral=True)
+                await interaction.followup.send(_HIERARCHY_ERROR_TEMPLATE.format(action=self.action_type, mention=self.user.mention), ephemeral=True)
                 return
 
-            if self.action_type == "warn":
-                action_id = mod_db.add_moderation_action(
-                    user_id=self.user.id,
-                    moderator_id=self.moderator.id,
-                    server_id=interaction.guild.id,
-                    action_type="warn",
-                    reason=self.reason
-                )
-
-            elif self.action_type == "mute":
-                duration_minutes = parse_duration(self.duration)
-                if duration_minutes and duration_minutes > 0:
-                    # Discord timeout max is 28 days, ensure we don't exceed it
-                    max_minutes = 28 * 24 * 60  # 28 days in minutes
-                    duration_minutes = min(duration_minutes, max_minutes)
-                    timeout_until = discord.utils.utcnow() + timedelta(minutes=duration_minutes)
-                    try:
-                        await self.user.timeout(timeout_until, reason=self.reason)
-                    except discord.Forbidden as e:
-                        await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Permission Error**: Cannot mute {self.user.mention}\n\n**Possible causes:**\n• Bot missing `Moderate Members` permission\n• Target user has higher role than bot\n• Target user is server owner\n\n**Error details:** {str(e)}", ephemeral=True)
-                        return
-                    except Exception as e:
-                        await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Mute Failed**: {str(e)}", ephemeral=True)
-                        return
-                else:
-                    # Default to 10 minutes if parsing fails
-                    timeout_until = discord.utils.utcnow() + timedelta(minutes=10)
-                    try:
-                        await self.user.timeout(timeout_until, reason=self.reason)
-                    except discord.Forbidden as e:
-                        await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Permission Error**: Cannot mute {self.user.mention}\n\n**Possible causes:**\n• Bot missing `Moderate Members` permission\n• Target user has higher role than bot\n• Target user is server owner\n\n**Error details:** {str(e)}", ephemeral=True)
-                        return
-                    except Exception as e:
-                        await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Mute Failed**: {str(e)}", ephemeral=True)
-                        return
-                    duration_minutes = 10
-
-                action_id = mod_db.add_moderation_action(
-                    user_id=self.user.id,
-                    moderator_id=self.moderator.id,
-                    server_id=interaction.guild.id,
-                    action_type="mute",
-                    reason=self.reason,
-                    duration_minutes=duration_minutes
-                )
-
-            elif self.action_type == "kick":
-                try:
-                    await interaction.guild.kick(self.user, reason=self.reason)
-                except discord.Forbidden as e:
-                    await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Permission Error**: Cannot kick {self.user.mention}\n\n**Possible causes:**\n• Bot missing `Kick Members` permission\n• Target user has higher role than bot\n• Target user is server owner\n\n**Error details:** {str(e)}", ephemeral=True)
-                    return
-                except Exception as e:
-                    await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Kick Failed**: {str(e)}", ephemeral=True)
-                    return
-                action_id = mod_db.add_moderation_action(
-                    user_id=self.user.id,
-                    moderator_id=self.moderator.id,
-                    server_id=interaction.guild.id,
-                    action_type="kick",
-                    reason=self.reason
-                )
-
-            elif self.action_type == "ban":
-                duration_minutes = None
-                if self.duration and self.duration != "permanent":
-                    duration_minutes = parse_duration(self.duration)
-
-                try:
-                    await interaction.guild.ban(self.user, reason=self.reason)
-                except discord.Forbidden as e:
-                    await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Permission Error**: Cannot ban {self.user.mention}\n\n**Possible causes:**\n• Bot missing `Ban Members` permission\n• Target user has higher role than bot\n• Target user is server owner\n\n**Error details:** {str(e)}", ephemeral=True)
-                    return
-                except Exception as e:
-                    await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Ban Failed**: {str(e)}", ephemeral=True)
-                    return
-                action_id = mod_db.add_moderation_action(
-                    user_id=self.user.id,
-                    moderator_id=self.moderator.id,
-                    server_id=interaction.guild.id,
-                    action_type="ban",
-                    reason=self.reason,
-                    duration_minutes=duration_minutes
-                )
-
-            elif self.action_type == "mutewarn":
-                # First apply the warning
-                warn_action_id = mod_db.add_moderation_action(
-                    user_id=self.user.id,
-                    moderator_id=self.moderator.id,
-                    server_id=interaction.guild.id,
-                    action_type="warn",
-                    reason=self.reason
-                )
-
-                # Then apply the mute
-                duration_minutes = parse_duration(self.duration)
-                if duration_minutes and duration_minutes > 0:
-                    # Discord timeout max is 28 days, ensure we don't exceed it
-                    max_minutes = 28 * 24 * 60  # 28 days in minutes
-                    duration_minutes = min(duration_minutes, max_minutes)
-                    timeout_until = discord.utils.utcnow() + timedelta(minutes=duration_minutes)
-                    try:
-                        await self.user.timeout(timeout_until, reason=self.reason)
-                    except discord.Forbidden as e:
-                        await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Permission Error**: Cannot mute {self.user.mention}\n\n**Possible causes:**\n• Bot missing `Moderate Members` permission\n• Target user has higher role than bot\n• Target user is server owner\n\n**Error details:** {str(e)}", ephemeral=True)
-                        return
-                    except Exception as e:
-                        await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Mute Failed**: {str(e)}", ephemeral=True)
-                        return
-                else:
-                    # Default to 10 minutes if parsing fails
-                    timeout_until = discord.utils.utcnow() + timedelta(minutes=10)
-                    try:
-                        await self.user.timeout(timeout_until, reason=self.reason)
-                    except discord.Forbidden as e:
-                        await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Permission Error**: Cannot mute {self.user.mention}\n\n**Possible causes:**\n• Bot missing `Moderate Members` permission\n• Target user has higher role than bot\n• Target user is server owner\n\n**Error details:** {str(e)}", ephemeral=True)
-                        return
-                    except Exception as e:
-                        await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Mute Failed**: {str(e)}", ephemeral=True)
-                        return
-                    duration_minutes = 10
+            action_id = await self._ACTIONS[self.action_type](self, interaction)
+            if action_id is None:
+                return
 
-                action_id = mod_db.add_moderation_action(
-                    user_id=self.user.id,
-                    moderator_id=self.moderator.id,
-                    server_id=interaction.guild.id,
-                    action_type="mute",
-                    reason=self.reason,
-                    duration_minutes=duration_minutes
+            # Send DM to user while the success embed is built
+            dm_task = asyncio.create_task(self.send_dm_notification())
+            try:
+                # Create success embed
+                embed = discord.Embed(
+                    title=ACTION_SUCCESS_TITLES[self.action_type].format(duration=self.duration),
+                    color=0xFFC916,
+                    timestamp=self.confirmed_at
                 )
-
-            # Send DM to user
-            dm_success = await self.send_dm_notification()
-
-            # Create success embed
-            action_titles = {
-                "warn": "⚠️ Warning Issued",
-                "mute": f"🔇 User Muted for {self.duration}",
-                "kick": "👢 User Kicked",
-                "ban": f"🔨 User Banned ({self.duration})",
-                "mutewarn": f"⚠️🔇 User Warned + Muted for {self.duration}"
-            }
-
-            embed = discord.Embed(
-                title=f"{action_titles[self.action_type]} Successfully",
-                color=0xFFC916,
-                timestamp=discord.utils.utcnow()
-            )
-            embed.add_field(name="👤 User", value=f"{self.user.mention} ({self.user})", inline=False)
-            embed.add_field(name="👮 Moderator", value=f"{self.moderator.mention}", inline=True)
-            embed.add_field(name="🏠 Server", value=f"{interaction.guild.name}", inline=True)
-            embed.add_field(name="📋 Reason", value=self.reason, inline=False)
-            embed.add_field(name="🆔 Action ID", value=f"#{action_id}", inline=True)
-            embed.add_field(name="💬 DM Status", value="<:GsRight:1414593140156792893>  Sent" if dm_success else "<:GsWrong:1414561861352816753>   Failed", inline=True)
-            embed.add_field(name="📊 Database", value="<:GsRight:1414593140156792893>  Logged", inline=True)
+                embed.add_field(name="👤 User", value=f"{self.user.mention} ({self.user})", inline=False)
+                embed.add_field(name="👮 Moderator", value=f"{self.moderator.mention}", inline=True)
+                embed.add_field(name="🏠 Server", value=f"{interaction.guild.name}", inline=True)
+                embed.add_field(name="📋 Reason", value=self.reason, inline=False)
+                embed.add_field(name="🆔 Action ID", value=f"#{action_id}", inline=True)
+                dm_success = await dm_task
+                embed.add_field(name="💬 DM Status", value=f"{RIGHT_EMOJI}  Sent" if dm_success else f"{WRONG_EMOJI}   Failed", inline=True)
+            finally:
+                # no-op once the DM has finished; otherwise don't leave it running unawaited
+                dm_task.cancel()
+
+            embed.add_field(name="📊 Database", value=f"{RIGHT_EMOJI}  Logged", inline=True)
 
             if self.duration and self.action_type in ["mute", "ban", "mutewarn"]:
                 embed.add_field(name="⏱️ Duration", value=self.duration, inline=True)
 
-            embed.set_footer(text="🔥 Game Services Moderation System")
+            embed.set_footer(text=MOD_FOOTER)
 
             try:
                 await interaction.edit_original_response(embed=embed, view=None)
@@ -2916,37 +3105,105 @@ class ConfirmationView(discord.ui.View):
         except Exception as e:
             logger.error(f"Error executing {self.action_type}: {e}")
             try:
-                await interaction.followup.send(f"<:GsWrong:1414561861352816753>   **Unexpected Error**\nFailed to execute {self.action_type}: {str(e)}", ephemeral=True)
+                await interaction.followup.send(f"{WRONG_EMOJI}   **Unexpected Error**\nFailed to execute {self.action_type}: {str(e)}", ephemeral=True)
             except:
                 pass
 
-    def check_bot_permissions(self, bot_member, guild):
-        """Check if bot has required permissions for the action"""
-        required_perms = {
-            "warn": ["send_messages"],
-            "mute": ["moderate_members"],
-            "kick": ["kick_members"],
-            "ban": ["ban_members"],
-            "mutewarn": ["moderate_members"]
+    def _action_row(self, interaction, action_type, duration_minutes=None):
+        """Build the database row for an action against the target user"""
+        return {
+            'user_id': self.user.id,
+            'moderator_id': self.moderator.id,
+            'server_id': interaction.guild.id,
+            'action_type': action_type,
+            'reason': self.reason,
+            'duration_minutes': duration_minutes
         }
 
-        permissions_needed = required_perms.get(self.action_type, [])
-        missing_perms = []
+    async def _log_action(self, interaction, action_type, duration_minutes=None):
+        """Record the action in the database and return its id"""
+        action_id = await asyncio.to_thread(mod_db.add_moderation_action, **self._action_row(interaction, action_type, duration_minutes))
+        record_added_actions(self.user.id, interaction.guild.id)
+        return action_id
+
+    async def _apply_timeout(self, interaction):
+        """Time the user out and return the minutes applied, or None if it failed"""
+        duration_minutes = parse_duration(self.duration)
+        if duration_minutes and duration_minutes > 0:
+            # Discord timeout max is 28 days, ensure we don't exceed it
+            duration_minutes = min(duration_minutes, MAX_MUTE_MINUTES)
+        else:
+            # Default to 10 minutes if parsing fails
+            duration_minutes = DEFAULT_MUTE_MINUTES
+
+        timeout_until = self.confirmed_at + timedelta(minutes=duration_minutes)
+        ok, _ = await safe_discord_action(interaction, "mute", "Moderate Members", self.user, lambda: self.user.timeout(timeout_until, reason=self.reason))
+        if not ok:
+            return None
+        return duration_minutes
+
+    async def _do_warn(self, interaction):
+        return await self._log_action(interaction, "warn")
+
+    async def _do_mute(self, interaction):
+        duration_minutes = await self._apply_timeout(interaction)
+        if duration_minutes is None:
+            return None
+        return await self._log_action(interaction, "mute", duration_minutes)
+
+    async def _do_kick(self, interaction):
+        ok, _ = await safe_discord_action(interaction, "kick", "Kick Members", self.user, lambda: interaction.guild.kick(self.user, reason=self.reason))
+        if not ok:
+            return None
+        return await self._log_action(interaction, "kick")
+
+    async def _do_ban(self, interaction):
+        duration_minutes = None
+        if self.duration and self.duration != "permanent":
+            duration_minutes = parse_duration(self.duration)
+
+        ok, _ = await safe_discord_action(interaction, "ban", "Ban Members", self.user, lambda: interaction.guild.ban(self.user, reason=self.reason))
+        if not ok:
+            return None
+        return await self._log_action(interaction, "ban", duration_minutes)
+
+    async def _do_mutewarn(self, interaction):
+        duration_minutes = await self._apply_timeout(interaction)
+        if duration_minutes is None:
+            return None
+
+        # Record the warning and the mute together in one transaction
+        warn_id, mute_id = await asyncio.to_thread(mod_db.add_moderation_actions_batch, [
+            self._action_row(interaction, "warn"),
+            self._action_row(interaction, "mute", duration_minutes)
+        ])
+        record_added_actions(self.user.id, interaction.guild.id, 2)
+        return mute_id
+
+    # Action type -> coroutine that performs it and returns the action id (None if it failed)
+    _ACTIONS = {
+        "warn": _do_warn,
+        "mute": _do_mute,
+        "kick": _do_kick,
+        "ban": _do_ban,
+        "mutewarn": _do_mutewarn
+    }
 
-        for perm in permissions_needed:
-            if not getattr(bot_member.guild_permissions, perm, False):
-                missing_perms.append(perm.replace('_', ' ').title())
+    def check_bot_permissions(self, bot_member, guild):
+        """Check if bot has required permissions for the action"""
+        required = _ACTION_PERM_BITS.get(self.action_type, 0)
+        missing = required & ~bot_member.guild_permissions.value
 
-        if missing_perms:
-            perm_list = ', '.join(missing_perms)
+        if missing:
+            perm_list = ', '.join(name.replace('_', ' ').title() for name, value in discord.Permissions(missing) if value)
             return {
                 "success": False,
-                "error": f"I'm missing these permissions: **{perm_list}**\n\n**How to fix:**\n1. Go to Server Settings → Roles\n2. Find my role and edit permissions\n3. Enable the missing permissions above"
+                "error": _MISSING_PERMS_TEMPLATE.format(permissions=perm_list)
             }
 
         return {"success": True, "error": None}
 
-    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji="<:GsWrong:1414561861352816753>  ")
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji=f"{WRONG_EMOJI}  ")
     async def cancel_action(self, interaction: discord.Interaction, button: discord.ui.Button):
         if interaction.user != self.moderator:
             try:
@@ -2959,11 +3216,11 @@ class ConfirmationView(discord.ui.View):
             await interaction.response.defer()
 
             embed = discord.Embed(
-                title="<:GsWrong:1414561861352816753>   Action Cancelled",
+                title=f"{WRONG_EMOJI}   Action Cancelled",
                 description=f"The {self.action_type} action has been cancelled.",
                 color=0x808080
             )
-            embed.set_footer(text="🔥 Game Services Moderation System")
+            embed.set_footer(text=MOD_FOOTER)
 
             try:
                 await interaction.edit_original_response(embed=embed, view=None)
@@ -2972,34 +3229,18 @@ class ConfirmationView(discord.ui.View):
         except Exception as e:
             logger.error(f"Error cancelling action: {e}")
             try:
-                await interaction.followup.send("<:GsWrong:1414561861352816753>   Error occurred while cancelling, but action was not executed.", ephemeral=True)
+                await interaction.followup.send(f"{WRONG_EMOJI}   Error occurred while cancelling, but action was not executed.", ephemeral=True)
             except:
                 pass
 
     async def send_dm_notification(self):
         """Send DM notification to the user and return success status"""
         try:
-            action_titles = {
-                "warn": "⚠️ You Have Been Warned",
-                "mute": "🔇 You Have Been Muted",
-                "kick": "👢 You Have Been Kicked",
-                "ban": "🔨 You Have Been Banned",
-                "mutewarn": "⚠️🔇 You Have Been Warned + Muted"
-            }
-
-            action_descriptions = {
-                "warn": "You have been warned in the server",
-                "mute": "You have been muted from the server",
-                "kick": "You have been kicked from the server",
-                "ban": "You have been banned from the server",
-                "mutewarn": "You have been warned and muted from the server"
-            }
-
             embed = discord.Embed(
-                title=action_titles[self.action_type],
-                description=action_descriptions[self.action_type],
+                title=DM_ACTION_TITLES[self.action_type],
+                description=DM_ACTION_DESCRIPTIONS[self.action_type],
                 color=0xFFC916,
-                timestamp=discord.utils.utcnow()
+                timestamp=self.confirmed_at
             )
             embed.add_field(name="🏠 Server", value=f"{self.moderator.guild.name}", inline=True)
             embed.add_field(name="👤 Moderator", value=f"{self.moderator}", inline=True)
@@ -3013,7 +3254,7 @@ class ConfirmationView(discord.ui.View):
                 value="If you believe this action was taken in error, you may appeal this decision in our appeals server:\n🔗 https://discord.gg/ahharETNNR",
                 inline=False
             )
-            embed.set_footer(text="🔥 Game Services Moderation System")
+            embed.set_footer(text=MOD_FOOTER)
 
             await self.user.send(embed=embed)
             return True
@@ -3022,26 +3263,36 @@ class ConfirmationView(discord.ui.View):
             return False
 
 # Utility functions
+def _top_pos(member):
+    """Position of the member's highest role, for hierarchy checks"""
+    return member.top_role.position
+
+MAX_MUTE_MINUTES = 28 * 24 * 60  # Discord caps timeouts at 28 days
+DEFAULT_MUTE_MINUTES = 10  # Used when a duration can't be parsed
+
+_DURATION_RE = re.compile(r'(\d+)([mhd])')
+
+@lru_cache(maxsize=256)
 def parse_duration(duration_str):
     """Parse duration string like '1h', '30m', '2d' into minutes"""
     if not duration_str:
-        return 10  # Default 10 minutes
+        return DEFAULT_MUTE_MINUTES
 
     duration_str = duration_str.lower().strip()
     if duration_str == "permanent":
         return None
 
     # Extract number and unit
-    match = re.match(r'(\d+)([mhd])', duration_str)
+    match = _DURATION_RE.match(duration_str)
     if not match:
-        return 10  # Default 10 minutes
+        return DEFAULT_MUTE_MINUTES
 
     number, unit = match.groups()
     number = int(number)
 
     # Ensure positive number
     if number <= 0:
-        return 10
+        return DEFAULT_MUTE_MINUTES
 
     if unit == 'm':
         return number
@@ -3050,13 +3301,28 @@ def parse_duration(duration_str):
     elif unit == 'd':
         return number * 24 * 60
 
-    return 10
+    return DEFAULT_MUTE_MINUTES
+
+# Readable forms of the usual mute and ban lengths
+_COMMON_DURATIONS = {
+    10: "10 minutes",
+    30: "30 minutes",
+    60: "1 hour",
+    1440: "1 day",
+    10080: "7 days",
+    MAX_MUTE_MINUTES: "28 days"
+}
 
+@lru_cache(maxsize=1024)
 def format_duration(minutes):
     """Format minutes into readable duration"""
     if not minutes:
         return "Permanent"
 
+    common = _COMMON_DURATIONS.get(minutes)
+    if common:
+        return common
+
     if minutes < 60:
         return f"{minutes} minute{'s' if minutes != 1 else ''}"
     elif minutes < 1440:  # Less than a day
@@ -3078,11 +3344,11 @@ def format_duration(minutes):
 @bot.command(name="warn", aliases=["w"])
 async def warn_user(ctx, user: discord.Member, *, reason="No reason provided"):
     """Warn a user with 2-step confirmation"""
-    if not ctx.author.guild_permissions.kick_members:
+    if not ctx.author.guild_permissions.value & _KICK_BIT:
         await ctx.send("You don't have permission to warn users.")
         return
 
-    if user.top_role >= ctx.author.top_role and ctx.author != ctx.guild.owner:
+    if ctx.author.id != ctx.guild.owner_id and _top_pos(user) >= _top_pos(ctx.author):
         await ctx.send("You cannot warn users with equal or higher roles.")
         return
 
@@ -3103,11 +3369,11 @@ async def warn_user(ctx, user: discord.Member, *, reason="No reason provided"):
 @bot.command(name="mute", aliases=["timeout"])
 async def mute_user(ctx, user: discord.Member, duration="1h", *, reason="No reason provided"):
     """Mute a user with 2-step confirmation"""
-    if not ctx.author.guild_permissions.moderate_members:
+    if not ctx.author.guild_permissions.value & _MODERATE_BIT:
         await ctx.send("You don't have permission to mute users.")
         return
 
-    if user.top_role >= ctx.author.top_role and ctx.author != ctx.guild.owner:
+    if ctx.author.id != ctx.guild.owner_id and _top_pos(user) >= _top_pos(ctx.author):
         await ctx.send("You cannot mute users with equal or higher roles.")
         return
 
@@ -3129,11 +3395,11 @@ async def mute_user(ctx, user: discord.Member, duration="1h", *, reason="No reas
 @bot.command(name="ban", aliases=["b"])
 async def ban_user(ctx, user: discord.Member, duration="permanent", *, reason="No reason provided"):
     """Ban a user with 2-step confirmation"""
-    if not ctx.author.guild_permissions.ban_members:
+    if not ctx.author.guild_permissions.value & _BAN_BIT:
         await ctx.send("You don't have permission to ban users.")
         return
 
-    if user.top_role >= ctx.author.top_role and ctx.author != ctx.guild.owner:
+    if ctx.author.id != ctx.guild.owner_id and _top_pos(user) >= _top_pos(ctx.author):
         await ctx.send("You cannot ban users with equal or higher roles.")
         return
 
@@ -3155,11 +3421,11 @@ async def ban_user(ctx, user: discord.Member, duration="permanent", *, reason="N
 @bot.command(name="kick", aliases=["k"])
 async def kick_user(ctx, user: discord.Member, *, reason="No reason provided"):
     """Kick a user with 2-step confirmation"""
-    if not ctx.author.guild_permissions.kick_members:
+    if not ctx.author.guild_permissions.value & _KICK_BIT:
         await ctx.send("You don't have permission to kick users.")
         return
 
-    if user.top_role >= ctx.author.top_role and ctx.author != ctx.guild.owner:
+    if ctx.author.id != ctx.guild.owner_id and _top_pos(user) >= _top_pos(ctx.author):
         await ctx.send("You cannot kick users with equal or higher roles.")
         return
 
@@ -3180,11 +3446,11 @@ async def kick_user(ctx, user: discord.Member, *, reason="No reason provided"):
 @bot.command(name="mutewarn", aliases=["mw"])
 async def mutewarn_user(ctx, user: discord.Member, duration="1h", *, reason="No reason provided"):
     """Warn and mute a user simultaneously with 2-step confirmation"""
-    if not ctx.author.guild_permissions.moderate_members:
+    if not ctx.author.guild_permissions.value & _MODERATE_BIT:
         await ctx.send("You don't have permission to mute and warn users.")
         return
 
-    if user.top_role >= ctx.author.top_role and ctx.author != ctx.guild.owner:
+    if ctx.author.id != ctx.guild.owner_id and _top_pos(user) >= _top_pos(ctx.author):
         await ctx.send("You cannot warn/mute users with equal or higher roles.")
         return
 
@@ -3207,7 +3473,7 @@ async def mutewarn_user(ctx, user: discord.Member, duration="1h", *, reason="No
 @bot.command(name="unmute", aliases=["um"])
 async def unmute_user(ctx, user: discord.Member, *, reason="No reason provided"):
     """Unmute a user"""
-    if not ctx.author.guild_permissions.moderate_members:
+    if not ctx.author.guild_permissions.value & _MODERATE_BIT:
         await ctx.send("You don't have permission to unmute users.")
         return
 
@@ -3253,7 +3519,7 @@ async def unmute_user(ctx, user: discord.Member, *, reason="No reason provided")
                 value="If you believe this action was taken in error, you may appeal this decision in our appeals server:\n🔗 https://discord.gg/ahharETNNR",
                 inline=False
             )
-            dm_embed.set_footer(text="🔥 Game Services Moderation System")
+            dm_embed.set_footer(text=MOD_FOOTER)
 
             await user.send(embed=dm_embed)
         except discord.Forbidden:
@@ -3266,7 +3532,7 @@ async def unmute_user(ctx, user: discord.Member, *, reason="No reason provided")
 @bot.command(name="removewarn", aliases=["unwarn", "rw"])
 async def remove_warn(ctx, action_id_str: str, *, removal_reason="No reason provided"):
     """Remove a moderation action"""
-    if not ctx.author.guild_permissions.kick_members:
+    if not ctx.author.guild_permissions.value & _KICK_BIT:
         await ctx.send("You don't have permission to remove moderation actions.")
         return
 
@@ -3275,26 +3541,27 @@ async def remove_warn(ctx, action_id_str: str, *, removal_reason="No reason prov
         action_id = int(action_id_str)
     except ValueError:
         embed = discord.Embed(
-            title="<:GsWrong:1414561861352816753>   Invalid Action ID",
+            title=f"{WRONG_EMOJI}   Invalid Action ID",
             description="Please provide a valid action ID number.",
             color=0xFFC916
         )
         embed.add_field(name="💡 Usage", value="`gs.removewarn <action_id> [reason]`", inline=False)
         embed.add_field(name="📋 Example", value="`gs.removewarn 123 mistake by staff`", inline=False)
         embed.add_field(name="🔍 How to find Action ID", value="Use `gs.warns @user` to see action IDs", inline=False)
-        embed.set_footer(text="🔥 Game Services Moderation System")
+        embed.set_footer(text=MOD_FOOTER)
         await ctx.send(embed=embed)
         return
 
     # Remove from database
-    removed_action = mod_db.remove_moderation_action(action_id, ctx.author.id, removal_reason)
+    removed_action = await asyncio.to_thread(mod_db.remove_moderation_action, action_id, ctx.author.id, removal_reason)
 
     if not removed_action:
         await ctx.send("No active moderation action found with that ID.")
         return
+    invalidate_user_record(removed_action['user_id'], removed_action['server_id'])
 
     embed = discord.Embed(
-        title="<:GsRight:1414593140156792893>  Moderation Action Removed Successfully",
+        title=f"{RIGHT_EMOJI}  Moderation Action Removed Successfully",
         color=0xFFC916,
         timestamp=discord.utils.utcnow()
     )
@@ -3303,10 +3570,10 @@ async def remove_warn(ctx, action_id_str: str, *, removal_reason="No reason prov
     embed.add_field(name="👤 Target User", value=f"<@{removed_action['user_id']}>", inline=True)
     embed.add_field(name="👮 Original Moderator", value=f"<@{removed_action['moderator_id']}>", inline=True)
     embed.add_field(name="🗑️ Removed By", value=f"{ctx.author.mention}", inline=True)
-    embed.add_field(name="📊 Database", value="<:GsRight:1414593140156792893>  Updated", inline=True)
+    embed.add_field(name="📊 Database", value=f"{RIGHT_EMOJI}  Updated", inline=True)
     embed.add_field(name="📝 Removal Reason", value=removal_reason, inline=False)
     embed.add_field(name="📋 Original Reason", value=removed_action['reason'], inline=False)
-    embed.set_footer(text="🔥 Game Services Moderation System")
+    embed.set_footer(text=MOD_FOOTER)
 
     await ctx.send(embed=embed)
 
@@ -3325,8 +3592,7 @@ async def user_warns(ctx, user: discord.Member = None):
     if not user:
         user = ctx.author
 
-    records = mod_db.get_user_record(user.id, ctx.guild.id)
-    warn_records = [r for r in records if r['action_type'] == 'warn' and r['is_active']]
+    warn_records = await get_user_record_cached(user.id, ctx.guild.id, action_type='warn', is_active=True, limit=10)
 
     if not warn_records:
         embed = discord.Embed(
@@ -3334,7 +3600,7 @@ async def user_warns(ctx, user: discord.Member = None):
             description=f"{user.mention} has no warning history in **{ctx.guild.name}**.",
             color=0xFFC916
         )
-        embed.set_footer(text="🔥 Game Services Moderation System")
+        embed.set_footer(text=MOD_FOOTER)
         await ctx.send(embed=embed)
         return
 
@@ -3346,247 +3612,164 @@ async def user_warns(ctx, user: discord.Member = None):
     )
     embed.set_thumbnail(url=user.display_avatar.url)
 
-    recent_warns = []
-    active_warns = [r for r in warn_records if r['is_active']]
+    # Fewer rows than the limit means we already have every active warning
+    warn_count = len(warn_records)
+    if warn_count == 10:
+        warn_count = await count_user_actions_cached(user.id, ctx.guild.id, action_type='warn', is_active=True)
 
-    embed.add_field(name="📊 Summary", value=f"**{len(active_warns)}** active warnings", inline=True)
-    embed.add_field(name="📈 Total", value=f"**{len(warn_records)}** total warnings", inline=True)
+    embed.add_field(name="📊 Summary", value=f"**{warn_count}** active warnings", inline=True)
+    embed.add_field(name="📈 Total", value=f"**{warn_count}** total warnings", inline=True)
     embed.add_field(name="🏠 Server", value=f"**{ctx.guild.name}**", inline=True)
 
-    for record in warn_records[:10]:
-        created_at = record['created_at'].strftime('%m/%d/%Y %H:%M')
-        moderator_id = record['moderator_id']
-        reason = record['reason'][:50] + "..." if len(record['reason']) > 50 else record['reason']
-        status = "<:GsWrong:1414561861352816753>   Removed" if not record['is_active'] else "<:GsRight:1414593140156792893>  Active"
-
-        recent_warns.append(
-            f"**#{record['id']}** Warning - {created_at}\n"
-            f"By: <@{moderator_id}> | {status}\n"
-            f"Reason: {reason}\n"
-        )
-
-    if recent_warns:
-        embed.add_field(name="📝 Recent Warnings",
-                       value="\n".join(recent_warns),
-                       inline=False)
+    # Only active warnings are fetched, so every entry is shown as Active
+    embed.add_field(name="📝 Recent Warnings", value=format_record_lines(warn_records, _RECORD_LINE, "Warning"), inline=False)
 
     embed.set_footer(text="🔥 Game Services Moderation System • Server-Specific Data")
     await ctx.send(embed=embed)
 
-@bot.command(name="mutes", aliases=["mutelist"])
-async def user_mutes(ctx, user: discord.Member = None):
-    """Show mute history for a user"""
-    if not user:
-        user = ctx.author
-
-    records = mod_db.get_user_record(user.id, ctx.guild.id)
-    mute_records = [r for r in records if r['action_type'] == 'mute']
+async def _render_action_history(ctx, user, action_type, icon, word, template=_RECORD_LINE,
+                                 empty_color=0xFFC916, footer=MOD_FOOTER):
+    """Send the last 10 records of one action type for a user"""
+    records = await get_user_record_cached(user.id, ctx.guild.id, action_type=action_type, limit=10)
 
-    if not mute_records:
+    if not records:
         embed = discord.Embed(
-            title="📋 No Mute History",
-            description=f"{user.mention} has no mute history.",
-            color=0xFFC916
+            title=f"📋 No {word} History",
+            description=f"{user.mention} has no {action_type} history.",
+            color=empty_color
         )
-        embed.set_footer(text="🔥 Game Services Moderation System")
+        embed.set_footer(text=MOD_FOOTER)
         await ctx.send(embed=embed)
         return
 
     embed = discord.Embed(
-        title=f"🔇 Mute History for {user.display_name}",
+        title=f"{icon} {word} History for {user.display_name}",
         color=0xFFC916,
         timestamp=discord.utils.utcnow()
     )
     embed.set_thumbnail(url=user.display_avatar.url)
 
-    recent_mutes = []
-    for record in mute_records[:10]:
-        created_at = record['created_at'].strftime('%m/%d/%Y %H:%M')
-        moderator_id = record['moderator_id']
-        reason = record['reason'][:50] + "..." if len(record['reason']) > 50 else record['reason']
-        status = "<:GsWrong:1414561861352816753>   Removed" if not record['is_active'] else "<:GsRight:1414593140156792893>  Active"
-
-        recent_mutes.append(
-            f"**#{record['id']}** Mute - {created_at}\n"
-            f"By: <@{moderator_id}> | {status}\n"
-            f"Reason: {reason}\n"
-        )
-
-    if recent_mutes:
-        embed.add_field(name="📝 Recent Mutes",
-                       value="\n".join(recent_mutes),
-                       inline=False)
+    embed.add_field(name=f"📝 Recent {word}s", value=format_record_lines(records, template, word), inline=False)
 
-    embed.set_footer(text="🔥 Game Services Moderation System")
+    embed.set_footer(text=footer)
     await ctx.send(embed=embed)
 
+@bot.command(name="mutes", aliases=["mutelist"])
+async def user_mutes(ctx, user: discord.Member = None):
+    """Show mute history for a user"""
+    await _render_action_history(ctx, user or ctx.author, 'mute', "🔇", "Mute")
+
 @bot.command(name="bans", aliases=["ba"])
 async def user_bans(ctx, user: discord.Member = None):
     """Show ban history for a user"""
-    if not user:
-        user = ctx.author
-
-    records = mod_db.get_user_record(user.id, ctx.guild.id)
-    ban_records = [r for r in records if r['action_type'] == 'ban']
-
-    if not ban_records:
-        embed = discord.Embed(
-            title="📋 No Ban History",
-            description=f"{user.mention} has no ban history.",
-            color=0xFFC916
-        )
-        embed.set_footer(text="🔥 Game Services Moderation System")
-        await ctx.send(embed=embed)
-        return
-
-    embed = discord.Embed(
-        title=f"🔨 Ban History for {user.display_name}",
-        color=0xFFC916,
-        timestamp=discord.utils.utcnow()
-    )
-    embed.set_thumbnail(url=user.display_avatar.url)
-
-    recent_bans = []
-    for record in ban_records[:10]:
-        created_at = record['created_at'].strftime('%m/%d/%Y %H:%M')
-        moderator_id = record['moderator_id']
-        reason = record['reason'][:50] + "..." if len(record['reason']) > 50 else record['reason']
-        status = "<:GsWrong:1414561861352816753>   Removed" if not record['is_active'] else "<:GsRight:1414593140156792893>  Active"
-
-        recent_bans.append(
-            f"**#{record['id']}** Ban - {created_at}\n"
-            f"By: <@{moderator_id}> | {status}\n"
-            f"Reason: {reason}\n"
-        )
-
-    if recent_bans:
-        embed.add_field(name="📝 Recent Bans",
-                       value="\n".join(recent_bans),
-                       inline=False)
-
-    embed.set_footer(text="🔥 Moderation System")
-    await ctx.send(embed=embed)
+    await _render_action_history(ctx, user or ctx.author, 'ban', "🔨", "Ban", footer="🔥 Moderation System")
 
 @bot.command(name="gs.kicks", aliases=["kicks"])
 async def user_kicks(ctx, user: discord.Member = None):
     """Show kick history for a user"""
-    if not user:
-        user = ctx.author
-
-    records = mod_db.get_user_record(user.id, ctx.guild.id)
-    kick_records = [r for r in records if r['action_type'] == 'kick']
+    await _render_action_history(ctx, user or ctx.author, 'kick', "👢", "Kick", template=_KICK_LINE, empty_color=0x00FF00)
 
-    if not kick_records:
-        embed = discord.Embed(
-            title="📋 No Kick History",
-            description=f"{user.mention} has no kick history.",
-            color=0x00FF00
-        )
-        embed.set_footer(text="🔥 Game Services Moderation System")
-        await ctx.send(embed=embed)
-        return
-
-    embed = discord.Embed(
-        title=f"👢 Kick History for {user.display_name}",
-        color=0xFFC916,
-        timestamp=discord.utils.utcnow()
-    )
-    embed.set_thumbnail(url=user.display_avatar.url)
-
-    recent_kicks = []
-    for record in kick_records[:10]:
-        created_at = record['created_at'].strftime('%m/%d/%Y %H:%M')
-        moderator_id = record['moderator_id']
-        reason = record['reason'][:50] + "..." if len(record['reason']) > 50 else record['reason']
-
-        recent_kicks.append(
-            f"**#{record['id']}** Kick - {created_at}\n"
-            f"By: <@{moderator_id}>\n"
-            f"Reason: {reason}\n"
-        )
-
-    if recent_kicks:
-        embed.add_field(name="📝 Recent Kicks",
-                       value="\n".join(recent_kicks),
-                       inline=False)
+# Roblox Server Commands
+def _fixed_embed(title, *fields):
+    """Build a constant embed from (name, value) fields; senders copy it and stamp the time"""
+    embed = discord.Embed(title=title, color=0xFFC916)
+    for name, value in fields:
+        embed.add_field(name=name, value=value, inline=False)
+    embed.set_footer(text="🔥 Game Services")
+    return embed
 
-    embed.set_footer(text="🔥 Game Services Moderation System")
+async def send_fixed_embed(ctx, template):
+    """Send a copy of a prebuilt embed timestamped with the current time"""
+    embed = template.copy()
+    embed.timestamp = discord.utils.utcnow()
     await ctx.send(embed=embed)
 
-# Roblox Server Commands
+_GAGPS_EMBED = _fixed_embed(
+    "🌱 Grow-A-Garden Private Server",
+    ("Private Server Link:", "https://www.roblox.com/share?code=46f8e0e94513bc41a1bf7314925f5420&type=Server")
+)
+_SABPS_EMBED = _fixed_embed(
+    "Steal-A-Brainrot Private Server",
+    ("Private Server Link:(Stealing=Ban)", "https://www.roblox.com/share?code=75f26e5ffe139f42807227d149126668&type=Server")
+)
+_TUTORIAL_EMBED = _fixed_embed(
+    "📚 Tutorial",
+    ("How to generate your own invite link:", "https://youtu.be/UkyljZT6lFg?si=G-C6biADCokHOM70"),
+    ("📝 What you'll learn:", "• How to create non-vanity server invite links\n• Step-by-step guide\n• Easy to follow tutorial")
+)
+_SECRET_SABPS_EMBED = _fixed_embed(
+    "Secret Steal-A-Brainrot Private Server",
+    ("Private Server Link:(Stealing=Ban)", "https://www.roblox.com/share?code=9aa554d3133c214293a36fcf6b027ce3&type=Server")
+)
+
 @bot.command(name="gagps", aliases=["gs.gagps"])
 async def grow_a_garden_ps(ctx):
     """🌱 Get Grow-A-Garden Private Server link"""
-    embed = discord.Embed(
-        title="🌱 Grow-A-Garden Private Server",
-        color=0xFFC916,
-        timestamp=discord.utils.utcnow()
-    )
-    embed.add_field(
-        name="Private Server Link:",
-        value="https://www.roblox.com/share?code=46f8e0e94513bc41a1bf7314925f5420&type=Server",
-        inline=False
-    )
-    embed.set_footer(text="🔥 Game Services")
-    await ctx.send(embed=embed)
+    await send_fixed_embed(ctx, _GAGPS_EMBED)
 
 @bot.command(name="sabps", aliases=["gs.sabps"])
 async def steal_a_brainrot_ps(ctx):
     """" Get Steal-A-Brainrot Private Server link"""
-    embed = discord.Embed(
-        title="Steal-A-Brainrot Private Server",
-        color=0xFFC916,
-        timestamp=discord.utils.utcnow()
-    )
-    embed.add_field(
-        name="Private Server Link:(Stealing=Ban)",
-        value="https://www.roblox.com/share?code=75f26e5ffe139f42807227d149126668&type=Server",
-        inline=False
-    )
-    embed.set_footer(text="🔥 Game Services")
-    await ctx.send(embed=embed)
+    await send_fixed_embed(ctx, _SABPS_EMBED)
 
 @bot.command(name="tutorial", aliases=["gs.tutorial"])
 async def invite_tutorial(ctx):
     """📚 Learn how to create your own invite link"""
-    embed = discord.Embed(
-        title="📚 Tutorial",
-        color=0xFFC916,
-        timestamp=discord.utils.utcnow()
-    )
-    embed.add_field(
-        name="How to generate your own invite link:",
-        value="https://youtu.be/UkyljZT6lFg?si=G-C6biADCokHOM70",
-        inline=False
-    )
-    embed.add_field(
-        name="📝 What you'll learn:",
-        value="• How to create non-vanity server invite links\n• Step-by-step guide\n• Easy to follow tutorial",
-        inline=False
-    )
-    embed.set_footer(text="🔥 Game Services")
-    await ctx.send(embed=embed)
+    await send_fixed_embed(ctx, _TUTORIAL_EMBED)
 
 @bot.command(name="secretsabps", aliases=["gs.secretsabps"])
 async def mal_sabps(ctx):
     """Get Secret Steal-A-Brainrot Private Server link"""
-    embed = discord.Embed(
-        title="Secret Steal-A-Brainrot Private Server",
-        color=0xFFC916,
-        timestamp=discord.utils.utcnow()
-    )
-    embed.add_field(
-        name="Private Server Link:(Stealing=Ban)",
-        value="https://www.roblox.com/share?code=9aa554d3133c214293a36fcf6b027ce3&type=Server",
-        inline=False
-    )
-    embed.set_footer(text="🔥 Game Services")
-    await ctx.send(embed=embed)
+    await send_fixed_embed(ctx, _SECRET_SABPS_EMBED)
+
+
+# Invite creation concurrency for serverlinks, with a short pause per request to stay under rate limits
+SERVER_LINK_CONCURRENCY = 3
+SERVER_LINK_DELAY = 0.25
+_server_link_sem = asyncio.Semaphore(SERVER_LINK_CONCURRENCY)
+
+# Invite URL handed out per guild id: (created_at, url), reused instead of creating a new invite each call
+SERVER_LINK_TTL = 3600
+SERVER_LINK_CACHE_MAX = 512
+_server_link_cache = {}
+
+
+async def _server_invite_url(channel):
+    """Return a cached invite URL for the channel's guild, creating one on a miss"""
+    now = time.monotonic()
+    cached = _server_link_cache.get(channel.guild.id)
+    if cached and now - cached[0] < SERVER_LINK_TTL:
+        return cached[1]
+
+    async with _server_link_sem:
+        invite = await retry_discord(lambda: channel.create_invite(max_age=0, max_uses=0))
+        await asyncio.sleep(SERVER_LINK_DELAY)
+    if len(_server_link_cache) >= SERVER_LINK_CACHE_MAX:
+        _server_link_cache.pop(next(iter(_server_link_cache)))
+    _server_link_cache[channel.guild.id] = (now, invite.url)
+    return invite.url
+
+
+async def _server_link_entry(guild):
+    """Create an invite for a guild and render its serverlinks entry"""
+    member_count = guild.member_count or 0
+    try:
+        # Try to create an invite
+        text_channels = [channel for channel in guild.text_channels if channel.permissions_for(guild.me).create_instant_invite]
+        if not text_channels:
+            return f"**{guild.name}** ({member_count} members)\n*No invite permission*\n\n"
+        url = await _server_invite_url(text_channels[0])
+        return f"**{guild.name}** ({member_count} members)\n{url}\n\n"
+    except (discord.HTTPException, discord.RateLimited) as e:
+        logger.debug(f"Could not create invite for {guild.id}: {e}")
+        return f"**{guild.name}** ({member_count} members)\n*Cannot create invite*\n\n"
+
+
 @bot.command(name="serverlinks", aliases=["gs.serverlinks"])
 async def server_links(ctx):
     """🔗 Get all server invite links (Admin only)"""
     # Check if user has administrator permission
-    if not ctx.author.guild_permissions.administrator:
+    if not ctx.author.guild_permissions.value & _ADMIN_BIT:
         await ctx.send("<:GsWrong:1414561861352816753>   You need administrator permissions to use this command.")
         return
 
@@ -3603,19 +3786,7 @@ async def server_links(ctx):
         inline=False
     )
 
-    server_info = ""
-    for guild in bot.guilds[:10]:  # Limit to first 10 servers
-        member_count = guild.member_count or 0
-        try:
-            # Try to create an invite
-            text_channels = [channel for channel in guild.text_channels if channel.permissions_for(guild.me).create_instant_invite]
-            if text_channels:
-                invite = await text_channels[0].create_invite(max_age=0, max_uses=0)
-                server_info += f"**{guild.name}** ({member_count} members)\n{invite.url}\n\n"
-            else:
-                server_info += f"**{guild.name}** ({member_count} members)\n*No invite permission*\n\n"
-        except:
-            server_info += f"**{guild.name}** ({member_count} members)\n*Cannot create invite*\n\n"
+    server_info = "".join(await asyncio.gather(*(_server_link_entry(guild) for guild in bot.guilds[:10])))  # Limit to first 10 servers
 
     if server_info:
         embed.add_field(
@@ -3647,9 +3818,9 @@ async def send_chat_guide(ctx):
     current_time = discord.utils.utcnow()
 
     # Check cooldown to prevent spam (1 minute cooldown for manual command)
-    if channel_id in chat_guide_cooldown and \
-       (current_time - chat_guide_cooldown[channel_id]).total_seconds() < 60:
-        remaining = 60 - (current_time - chat_guide_cooldown[channel_id]).total_seconds()
+    elapsed = (current_time - chat_guide_cooldown.get(channel_id, _NEVER_SENT)).total_seconds()
+    if elapsed < 60:
+        remaining = 60 - elapsed
         await ctx.send(f"⏰ Chat guide message is on cooldown. Try again in {int(remaining)} seconds.")
         return
 
@@ -3664,12 +3835,16 @@ async def send_chat_guide(ctx):
 @bot.command(name="messagecounter", aliases=["gs.msgcount", "msgcount"])
 async def message_counter_status(ctx):
     """📊 Check message counter status for this channel (Admin only)"""
-    if not ctx.author.guild_permissions.manage_messages:
+    if not ctx.author.guild_permissions.value & _MANAGE_MESSAGES_BIT:
         await ctx.send("<:GsWrong:1414561861352816753>   You need manage messages permission to use this command.")
         return
 
     channel_id = ctx.channel.id
-    message_count = channel_message_counts.get(channel_id, 0)
+    message_count = channel_message_counts[channel_id]
+    if not message_count and channel_id not in chat_guide_cooldown:
+        await ctx.send("📊 No message activity tracked yet for this channel.")
+        return
+
     remaining = CHAT_GUIDE_INTERVAL - (message_count % CHAT_GUIDE_INTERVAL)
 
     embed = discord.Embed(
@@ -3711,10 +3886,10 @@ async def user_full_history(ctx, user: discord.Member = None):
     if not user:
         user = ctx.author
 
-    # Get user's record for this server only
-    records = mod_db.get_user_record(user.id, ctx.guild.id)
+    # Get user's action counts for this server only
+    summary = await get_user_action_summary_cached(user.id, ctx.guild.id)
 
-    if not records:
+    if not summary:
         embed = discord.Embed(
             title="📋 Clean Record",
             description=f"{user.mention} has no moderation history in **{ctx.guild.name}**.",
@@ -3733,16 +3908,15 @@ async def user_full_history(ctx, user: discord.Member = None):
     )
     embed.set_thumbnail(url=user.display_avatar.url)
 
-    # Count actions (active and inactive)
-    warns = len([r for r in records if r['action_type'] == 'warn'])
-    mutes = len([r for r in records if r['action_type'] == 'mute'])
-    bans = len([r for r in records if r['action_type'] == 'ban'])
-    kicks = len([r for r in records if r['action_type'] == 'kick'])
+    # Count active actions, then add inactive ones for the totals
+    active_warns = summary.get(('warn', True), 0)
+    active_mutes = summary.get(('mute', True), 0)
+    active_bans = summary.get(('ban', True), 0)
 
-    # Count active actions
-    active_warns = len([r for r in records if r['action_type'] == 'warn' and r['is_active']])
-    active_mutes = len([r for r in records if r['action_type'] == 'mute' and r['is_active']])
-    active_bans = len([r for r in records if r['action_type'] == 'ban' and r['is_active']])
+    warns = active_warns + summary.get(('warn', False), 0)
+    mutes = active_mutes + summary.get(('mute', False), 0)
+    bans = active_bans + summary.get(('ban', False), 0)
+    kicks = summary.get(('kick', True), 0) + summary.get(('kick', False), 0)
 
     embed.add_field(name="📊 Total Actions",
                    value=f"Warnings: {warns}\nMutes: {mutes}\nBans: {bans}\nKicks: {kicks}",
@@ -3757,24 +3931,9 @@ async def user_full_history(ctx, user: discord.Member = None):
                    inline=True)
 
     # Show recent actions (last 8)
-    recent_actions = []
-    for record in records[:8]:
-        action_type = record['action_type'].title()
-        created_at = record['created_at'].strftime('%m/%d/%Y %H:%M')
-        moderator_id = record['moderator_id']
-        reason = record['reason'][:45] + "..." if len(record['reason']) > 45 else record['reason']
-        status = "<:GsWrong:1414561861352816753>   Removed" if not record['is_active'] else "<:GsRight:1414593140156792893>  Active"
-
-        recent_actions.append(
-            f"**#{record['id']}** {action_type} - {created_at}\n"
-            f"By: <@{moderator_id}> | {status}\n"
-            f"Reason: {reason}\n"
-        )
-
+    recent_actions = format_record_lines(await get_user_record_cached(user.id, ctx.guild.id, limit=8), _RECORD_LINE, reason_length=45)
     if recent_actions:
-        embed.add_field(name="📝 Recent Actions",
-                       value="\n".join(recent_actions),
-                       inline=False)
+        embed.add_field(name="📝 Recent Actions", value=recent_actions, inline=False)
 
     embed.set_footer(text="🔥 Game Services Moderation System • Server-Specific Data")
     await ctx.send(embed=embed)
@@ -3842,17 +4001,18 @@ async def report_user(ctx, user: discord.Member, *, reason="No reason provided")
     await ctx.send(embed=confirm_embed, view=view)
 
 # Invite tracking commands
+def invite_score(data):
+    """Total invite score: valid and bonus invites minus fakes and rejoins"""
+    return data['invites'] + data['bonus'] - data['fake'] - data['rejoins']
+
 @bot.command(name="invites", aliases=["inv", "gs.invites"])
 async def show_invites(ctx, user: discord.Member = None):
     """Show invite statistics for a user"""
     target_user = user or ctx.author
     user_id = target_user.id
 
-    if user_id not in user_invites:
-        user_invites[user_id] = {'invites': 0, 'fake': 0, 'rejoins': 0, 'bonus': 0}
-
-    data = user_invites[user_id]
-    total = data['invites'] + data['bonus'] - data['fake'] - data['rejoins']
+    data = user_invites.stats(user_id)
+    total = invite_score(data)
 
     embed = discord.Embed(
         title="📊 Invite Statistics",
@@ -3876,14 +4036,12 @@ async def show_invites(ctx, user: discord.Member = None):
 @bot.command(name="addinvite", aliases=["addinv"])
 async def add_invite(ctx, user: discord.Member, amount: int = 1):
     """Add bonus invites to a user (Moderators only)"""
-    if not ctx.author.guild_permissions.kick_members:
+    if not ctx.author.guild_permissions.value & _KICK_BIT:
         await ctx.send("<:GsWrong:1414561861352816753>   You don't have permission to manage invites.")
         return
 
-    if user.id not in user_invites:
-        user_invites[user.id] = {'invites': 0, 'fake': 0, 'rejoins': 0, 'bonus': 0}
-
-    user_invites[user.id]['bonus'] += amount
+    bonus_total = user_invites.add_bonus(user.id, amount)
+    save_invite_data()
 
     embed = discord.Embed(
         title="<:GsRight:1414593140156792893>  Bonus Invites Added",
@@ -3893,7 +4051,7 @@ async def add_invite(ctx, user: discord.Member, amount: int = 1):
     embed.add_field(name="👤 User", value=user.mention, inline=True)
     embed.add_field(name="🎁 Added", value=f"+{amount} bonus invites", inline=True)
     embed.add_field(name="👮 Moderator", value=ctx.author.mention, inline=True)
-    embed.add_field(name="📊 New Bonus Total", value=str(user_invites[user.id]['bonus']), inline=False)
+    embed.add_field(name="📊 New Bonus Total", value=str(bonus_total), inline=False)
     embed.set_footer(text="🔥 Game Services Invite System")
 
     await ctx.send(embed=embed)
@@ -3901,14 +4059,12 @@ async def add_invite(ctx, user: discord.Member, amount: int = 1):
 @bot.command(name="removeinvite", aliases=["reminv"])
 async def remove_invite(ctx, user: discord.Member, amount: int = 1):
     """Remove bonus invites from a user (Moderators only)"""
-    if not ctx.author.guild_permissions.kick_members:
+    if not ctx.author.guild_permissions.value & _KICK_BIT:
         await ctx.send("<:GsWrong:1414561861352816753>   You don't have permission to manage invites.")
         return
 
-    if user.id not in user_invites:
-        user_invites[user.id] = {'invites': 0, 'fake': 0, 'rejoins': 0, 'bonus': 0}
-
-    user_invites[user.id]['bonus'] = max(0, user_invites[user.id]['bonus'] - amount)
+    bonus_total = user_invites.add_bonus(user.id, -amount)
+    save_invite_data()
 
     embed = discord.Embed(
         title="➖ Bonus Invites Removed",
@@ -3918,7 +4074,7 @@ async def remove_invite(ctx, user: discord.Member, amount: int = 1):
     embed.add_field(name="👤 User", value=user.mention, inline=True)
     embed.add_field(name="🔻 Removed", value=f"-{amount} bonus invites", inline=True)
     embed.add_field(name="👮 Moderator", value=ctx.author.mention, inline=True)
-    embed.add_field(name="📊 New Bonus Total", value=str(user_invites[user.id]['bonus']), inline=False)
+    embed.add_field(name="📊 New Bonus Total", value=str(bonus_total), inline=False)
     embed.set_footer(text="🔥 Game Services Invite System")
 
     await ctx.send(embed=embed)
@@ -3935,14 +4091,8 @@ async def invite_leaderboard(ctx):
         await ctx.send(embed=embed)
         return
 
-    # Calculate total scores and sort
-    leaderboard = []
-    for user_id, data in user_invites.items():
-        total = data['invites'] + data['bonus'] - data['fake'] - data['rejoins']
-        leaderboard.append((user_id, total, data))
-
-    leaderboard.sort(key=lambda x: x[1], reverse=True)
-    leaderboard = leaderboard[:10]  # Top 10
+    # Top 10 by total score
+    leaderboard = user_invites.top(10)
 
     embed = discord.Embed(
         title="🏆 Invite Leaderboard",
@@ -3951,15 +4101,15 @@ async def invite_leaderboard(ctx):
         timestamp=discord.utils.utcnow()
     )
 
-    for i, (user_id, total, data) in enumerate(leaderboard, 1):
-        user = bot.get_user(user_id)
+    get_user = bot.get_user
+    for i, (user_id, score) in enumerate(leaderboard, 1):
+        user = get_user(user_id)
         user_name = user.display_name if user else f"User {user_id}"
-
-        medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
+        data = user_invites.stats(user_id)
 
         embed.add_field(
-            name=f"{medal} {user_name}",
-            value=f"**{total}** total invites\n<:GsRight:1414593140156792893>  {data['invites']} • 🚫 {data['fake']} • 🔄 {data['rejoins']} • 🎁 {data['bonus']}",
+            name=f"{_medal(i)} {user_name}",
+            value=f"**{score}** total invites\n<:GsRight:1414593140156792893>  {data['invites']} • 🚫 {data['fake']} • 🔄 {data['rejoins']} • 🎁 {data['bonus']}",
             inline=False
         )
 
@@ -4060,13 +4210,16 @@ async def scyther_command(ctx):
     await ctx.send(fixed_message)
 
 # --- Auto Ticket Greeting ---
+_TICKET_NAME_RE = re.compile(r"ticket", re.IGNORECASE)
+TICKET_GREETING = "**Hello, please be patient until staff respond to your ticket, meanwhile state why you made it.**"
+
 @bot.event
 async def on_guild_channel_create(channel):
     # Only act on text channels
     if isinstance(channel, discord.TextChannel):
-        if channel.name.lower().startswith("ticket"):
+        if _TICKET_NAME_RE.match(channel.name):
             try:
-                await channel.send("**Hello, please be patient until staff respond to your ticket, meanwhile state why you made it.**")
+                await channel.send(TICKET_GREETING)
             except Exception as e:
                 print(f"Error sending ticket greeting: {e}")
 
@@ -4101,9 +4254,11 @@ async def clear(ctx, amount: int = None):
 
     try:
         # Prevent removing pinned messages
-        deleted = await ctx.channel.purge(limit=limit, check=lambda m: not m.pinned)
-        # Count deleted messages excluding the command message (if it was included)
-        deleted_count = sum(1 for m in deleted if m.id != ctx.message.id)
+        # Anchor just after the command message so anything posted since is left alone
+        anchor = discord.Object(id=ctx.message.id + 1)
+        deleted = await ctx.channel.purge(limit=limit, check=lambda m: not m.pinned, before=anchor, oldest_first=False, bulk=True)
+        # Newest first, so the command message (if it was included) is the first one deleted
+        deleted_count = len(deleted) - (bool(deleted) and deleted[0].id == ctx.message.id)
         confirm = await ctx.send(f"<:GsRight:1414593140156792893>  Deleted {deleted_count} messages.")
         await confirm.delete(delay=5)
 
@@ -4135,6 +4290,51 @@ async def aarav_command(ctx):
 
 # ---------------- gs.absence command ----------------
 ABSENCE_ROLE_ID = 1374481044916408340
+_TIME_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}  # Seconds per absence duration unit
+_ABSENCE_DURATION_RE = re.compile(r"^(\d+)([smhd])$", re.IGNORECASE)
+
+# Pending absence expiries as (due monotonic time, guild_id, member_id, role_id, channel_id), soonest first
+_absence_heap = []
+_absence_wakeup = asyncio.Event()
+_absence_ticker_task = None
+
+async def _end_absence(guild_id, member_id, role_id, channel_id):
+    """Remove an expired absence role and announce it in the channel it was set from"""
+    try:
+        guild = bot.get_guild(guild_id)
+        m = guild.get_member(member_id) if guild else None
+        role = m.get_role(role_id) if m else None
+        if role:
+            await m.remove_roles(role)
+            # Plain text end message
+            channel = bot.get_channel(channel_id)
+            if channel:
+                await channel.send(f"<:GsRight:1414593140156792893>  {m.mention}'s absence has ended.")
+    except Exception:
+        pass
+
+async def _absence_ticker():
+    """Sleep until the soonest absence expiry, end it, and repeat"""
+    while True:
+        delay = _absence_heap[0][0] - time.monotonic() if _absence_heap else None
+        if delay is None or delay > 0:
+            # woken early when a new absence is scheduled, in case it expires sooner
+            _absence_wakeup.clear()
+            try:
+                await asyncio.wait_for(_absence_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        _, guild_id, member_id, role_id, channel_id = heapq.heappop(_absence_heap)
+        await _end_absence(guild_id, member_id, role_id, channel_id)
+
+def schedule_absence_end(seconds, guild_id, member_id, role_id, channel_id):
+    """Queue an absence role removal on the shared ticker"""
+    global _absence_ticker_task
+    heapq.heappush(_absence_heap, (time.monotonic() + seconds, guild_id, member_id, role_id, channel_id))
+    _absence_wakeup.set()
+    if _absence_ticker_task is None or _absence_ticker_task.done():
+        _absence_ticker_task = asyncio.create_task(_absence_ticker())
 
 @bot.command(name="absence")
 @commands.has_permissions(administrator=True)
@@ -4143,8 +4343,10 @@ async def absence(ctx, member: discord.Member, duration: str):
     Usage: gs.absence @member 10m
     Only usable by administrators. Cannot target users with equal/higher role or the server owner.
     """
+    guild = ctx.guild
+
     # Protect server owner
-    if member == ctx.guild.owner:
+    if member.id == guild.owner_id:
         await ctx.send("<:GsWrong:1414561861352816753>   You cannot mark the server owner absent.")
         return
 
@@ -4154,16 +4356,13 @@ async def absence(ctx, member: discord.Member, duration: str):
         return
 
     # Parse duration
-    time_units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
-    try:
-        unit = duration[-1].lower()
-        amount = int(duration[:-1])
-        seconds = amount * time_units[unit]
-    except Exception:
+    match = _ABSENCE_DURATION_RE.match(duration)
+    if not match:
         await ctx.send("Invalid time format. Use e.g. `10m`, `2h`, `1d`.")
         return
+    seconds = int(match.group(1)) * _TIME_UNITS[match.group(2).lower()]
 
-    role = ctx.guild.get_role(ABSENCE_ROLE_ID)
+    role = guild.get_role(ABSENCE_ROLE_ID)
     if not role:
         await ctx.send("Absence role not found!")
         return
@@ -4178,18 +4377,7 @@ async def absence(ctx, member: discord.Member, duration: str):
     await ctx.send(f"📌 {member.mention} is now marked absent for **{duration}**. The role will be removed automatically.")
 
     # Schedule role removal
-    async def remove_role_later():
-        await asyncio.sleep(seconds)
-        try:
-            m = ctx.guild.get_member(member.id)
-            if m and role in m.roles:
-                await m.remove_roles(role)
-                # Plain text end message
-                await ctx.send(f"<:GsRight:1414593140156792893>  {m.mention}'s absence has ended.")
-        except Exception:
-            pass
-
-    bot.loop.create_task(remove_role_later())
+    schedule_absence_end(seconds, guild.id, member.id, role.id, ctx.channel.id)
 
 # ---------------- gs.dm command ----------------
 @bot.command(name="dm")
@@ -4281,6 +4469,8 @@ import datetime
 import json
 import os
 import re
+import sqlite3
+from collections import deque
 
 # ---------------- CONFIG ----------------
 STAFF_ROLE_ID = 1394686620300476476   # Staff role
@@ -4289,7 +4479,7 @@ TICKET_CATEGORY_2 = 1372934887186890903  # Support tickets category
 LOG_CHANNEL_ID = 1414528231834386545     # Ticket logs channel
 PANEL_ALLOWED_USER = 721063236371480717  # only this user can run gs.ticketpanel
 GOLD = 0xFFC916
-DB_FILE = "tickets.json"
+DB_FILE = "tickets.json"  # legacy single-file DB, migrated into TICKETS_SQLITE
 
 # ---------------- Bot setup (safe create-if-missing) ----------------
 try:
@@ -4301,61 +4491,376 @@ except NameError:
     bot = commands.Bot(command_prefix=['gs.', 'gs '], intents=intents)
 
 # ---------------- Persistent DB helpers ----------------
-DB_LOCK = asyncio.Lock()
-# structure: {"tickets": {"<channel_id>": {"creator_id": int|None, "claimer_id": int|None, "action_message_id": int|None, "created_at": iso}}, "panels": [{"channel_id": int, "message_id": int}, ...]}
+# structure: {"tickets": {"<channel_id>": {"creator_id": int|None, "claimer_id": int|None, "action_message_id": int|None, "action_embed": dict (optional), "created_at": iso}}, "panels": [{"channel_id": int, "message_id": int}, ...]}
 _tickets_db = {"tickets": {}, "panels": []}
 
-def load_db():
-    global _tickets_db
-    if os.path.exists(DB_FILE):
+# SQLite in WAL mode: an update writes only its own row; DB_FILE / TICKETS_DIR are only read to migrate old data
+TICKETS_SQLITE = "tickets.db"
+TICKETS_DIR = "tickets"
+PANELS_FILE = "panels.json"
+_dirty_tickets = set()   # ticket keys to write (or remove, if no longer in _tickets_db) on the next save
+_panels_dirty = False
+_db_conn = None
+
+def _db_connect():
+    global _db_conn
+    if _db_conn is None:
+        # only _db_flusher writes, and it awaits each write before the next, so sharing across worker threads is safe
+        _db_conn = sqlite3.connect(TICKETS_SQLITE, check_same_thread=False)
+        _db_conn.execute("PRAGMA journal_mode=WAL")
+        _db_conn.execute("PRAGMA synchronous=NORMAL")
+        _db_conn.execute(
+            "CREATE TABLE IF NOT EXISTS tickets (channel_id INTEGER PRIMARY KEY, creator_id INTEGER, claimer_id INTEGER, "
+            "action_message_id INTEGER, action_embed TEXT, created_at TEXT, closed INTEGER, closed_at TEXT)"
+        )
+        _db_conn.execute("CREATE TABLE IF NOT EXISTS panels (channel_id INTEGER, message_id INTEGER)")
+        _db_conn.commit()
+    return _db_conn
+
+def _ticket_row(key, meta: dict) -> tuple:
+    embed = meta.get("action_embed")
+    return (int(key), meta.get("creator_id"), meta.get("claimer_id"), meta.get("action_message_id"),
+            json.dumps(embed) if embed else None, meta.get("created_at"), int(bool(meta.get("closed"))), meta.get("closed_at"))
+
+def _ticket_meta(row) -> dict:
+    _, creator_id, claimer_id, action_message_id, action_embed, created_at, closed, closed_at = row
+    meta = {"creator_id": creator_id, "claimer_id": claimer_id, "action_message_id": action_message_id, "created_at": created_at}
+    if action_embed:
+        meta["action_embed"] = json.loads(action_embed)
+    if closed:
+        meta["closed"] = True
+        meta["closed_at"] = closed_at
+    return meta
+
+def _load_legacy_db() -> dict:
+    db = {"tickets": {}, "panels": []}
+    if os.path.isdir(TICKETS_DIR):
+        for name in os.listdir(TICKETS_DIR):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(TICKETS_DIR, name), "r", encoding="utf-8") as f:
+                    db["tickets"][name[:-5]] = json.load(f)
+            except Exception as e:
+                print(f"Could not load ticket {name}:", e)
+        if os.path.exists(PANELS_FILE):
+            try:
+                with open(PANELS_FILE, "r", encoding="utf-8") as f:
+                    db["panels"] = json.load(f)
+            except Exception:
+                pass
+    elif os.path.exists(DB_FILE):
         try:
             with open(DB_FILE, "r", encoding="utf-8") as f:
-                _tickets_db = json.load(f)
+                db = json.load(f)
         except Exception:
-            _tickets_db = {"tickets": {}, "panels": []}
-    else:
-        _tickets_db = {"tickets": {}, "panels": []}
+            pass
+    return db
+
+def load_db():
+    global _tickets_db, _panels_dirty
+    _tickets_db = {"tickets": {}, "panels": []}
+    try:
+        conn = _db_connect()
+        rows = conn.execute("SELECT * FROM tickets").fetchall()
+        panels = conn.execute("SELECT channel_id, message_id FROM panels").fetchall()
+    except Exception as e:
+        print("Could not load ticket DB:", e)
+        return
+    if rows or panels:
+        _tickets_db["tickets"] = {str(row[0]): _ticket_meta(row) for row in rows}
+        _tickets_db["panels"] = [{"channel_id": channel_id, "message_id": message_id} for channel_id, message_id in panels]
+        return
+    # empty database: bring over JSON data from before the switch, written on the first save
+    _tickets_db = _load_legacy_db()
+    _dirty_tickets.update(_tickets_db.get("tickets", {}))
+    _panels_dirty = bool(_tickets_db.get("panels"))
+
+def _write_db_rows(upserts: list, deletes: list, panels):
+    conn = _db_connect()
+    with conn:
+        if upserts:
+            conn.executemany("INSERT OR REPLACE INTO tickets VALUES (?, ?, ?, ?, ?, ?, ?, ?)", upserts)
+        if deletes:
+            conn.executemany("DELETE FROM tickets WHERE channel_id = ?", deletes)
+        if panels is not None:
+            conn.execute("DELETE FROM panels")
+            conn.executemany("INSERT INTO panels VALUES (?, ?)", panels)
 
 async def save_db():
-    async with DB_LOCK:
-        # make a safe write
-        tmp = DB_FILE + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(_tickets_db, f, indent=2)
-        os.replace(tmp, DB_FILE)
+    """Write the dirty rows; only called from _db_flusher, which serializes writes without a lock."""
+    global _panels_dirty
+    # snapshot the changed rows on the loop, then keep the disk writes off it
+    tickets = _tickets_db.get("tickets", {})
+    keys = set(_dirty_tickets)
+    _dirty_tickets.clear()
+    upserts = [_ticket_row(key, tickets[key]) for key in keys if key in tickets]
+    deletes = [(int(key),) for key in keys if key not in tickets]
+    panels = [(p.get("channel_id"), p.get("message_id")) for p in _tickets_db.get("panels", [])] if _panels_dirty else None
+    had_panels, _panels_dirty = _panels_dirty, False
+    try:
+        await asyncio.to_thread(_write_db_rows, upserts, deletes, panels)
+    except Exception:
+        # retry these on the next save
+        _dirty_tickets.update(keys)
+        _panels_dirty = _panels_dirty or had_panels
+        raise
+
+# ---------------- Debounced DB writes ----------------
+DB_SAVE_DELAY = 0.5  # seconds of quiet to coalesce ticket changes into one write
+_db_dirty = asyncio.Event()
+_db_flusher_task = None
+
+async def _db_flusher():
+    while True:
+        await _db_dirty.wait()
+        await asyncio.sleep(DB_SAVE_DELAY)
+        # clear before the snapshot so changes made during the write schedule another one
+        _db_dirty.clear()
+        try:
+            await save_db()
+        except Exception as e:
+            print("Error saving ticket DB:", e)
+
+def mark_db_dirty(ticket_key=None, panels=False):
+    """Schedule a write of one ticket and/or the panel list; changes within DB_SAVE_DELAY share one write."""
+    global _db_flusher_task, _panels_dirty
+    if ticket_key is not None:
+        _dirty_tickets.add(ticket_key)
+    _panels_dirty = _panels_dirty or panels
+    _db_dirty.set()
+    if _db_flusher_task is None or _db_flusher_task.done():
+        _db_flusher_task = asyncio.create_task(_db_flusher())
 
 load_db()
 
-# ---------------- Utility: transcript & staff detection ----------------
-async def make_transcript(channel: discord.TextChannel) -> discord.File:
-    """Return a discord.File object containing the channel transcript."""
-    transcript_lines = []
-    async for msg in channel.history(limit=None, oldest_first=True):
-        ts = msg.created_at.astimezone().strftime("%Y-%m-%d %H:%M:%S")
-        # include attachments info (simple)
-        att_text = ""
-        if msg.attachments:
-            att_text = " [attachments: " + ", ".join(a.url for a in msg.attachments) + "]"
-        # guard binary / big content by truncating if necessary
-        content = msg.content or ""
-        if len(content) > 3000:
-            content = content[:3000] + "...[truncated]"
-        transcript_lines.append(f"[{ts}] {msg.author} ({getattr(msg.author, 'id', 'unknown')}): {content}{att_text}")
-    data = "\n".join(transcript_lines) or "(no messages)"
-    return discord.File(io.BytesIO(data.encode("utf-8")), filename=f"{channel.name}-transcript.txt")
-
-async def gather_staff_who_spoke(channel: discord.TextChannel, staff_role: discord.Role):
-    """Return (set of Member, mention_string). Searches message history and finds staff who posted."""
-    staff_members = set()
-    async for msg in channel.history(limit=None):
-        if msg.author.bot:
+# ---------------- Cached guild lookups ----------------
+# (guild_id, object_id) -> Role / channel, resolved once per ready; cleared when roles or channels go away
+_ticket_refs = {}
+
+def cached_role(guild: discord.Guild, role_id: int):
+    key = (guild.id, role_id)
+    role = _ticket_refs.get(key)
+    if role is None:
+        role = guild.get_role(role_id)
+        if role is not None:
+            _ticket_refs[key] = role
+    return role
+
+def cached_channel(guild: discord.Guild, channel_id: int):
+    key = (guild.id, channel_id)
+    channel = _ticket_refs.get(key)
+    if channel is None:
+        channel = guild.get_channel(channel_id)
+        if channel is not None:
+            _ticket_refs[key] = channel
+    return channel
+
+def is_staff(user) -> bool:
+    # Member.get_role checks the member's sorted role ids instead of scanning Role objects; Users have no roles
+    get_role = getattr(user, "get_role", None)
+    return get_role is not None and get_role(STAFF_ROLE_ID) is not None
+
+# (guild_id, user_id) -> monotonic expiry for members known to have left, so lookups skip the REST 404;
+# without the members intent a rejoin can't clear an entry, so it only spans a burst of lookups
+MISSING_MEMBER_TTL = 30
+MISSING_MEMBER_MAX = 1024
+_missing_members = {}
+
+def _mark_member_missing(guild_id: int, user_id: int):
+    now = time.monotonic()
+    if len(_missing_members) >= MISSING_MEMBER_MAX:
+        for key in [key for key, expiry in _missing_members.items() if expiry <= now]:
+            del _missing_members[key]
+    _missing_members[(guild_id, user_id)] = now + MISSING_MEMBER_TTL
+
+async def resolve_member(guild: discord.Guild, user_id: int):
+    """Cached member, else a REST fetch unless the user recently turned out to be gone."""
+    member = guild.get_member(user_id)
+    if member is not None:
+        return member
+    expiry = _missing_members.get((guild.id, user_id))
+    if expiry and expiry > time.monotonic():
+        return None
+    try:
+        return await guild.fetch_member(user_id)
+    except discord.NotFound:
+        _mark_member_missing(guild.id, user_id)
+    except discord.HTTPException:
+        pass
+    return None
+
+@bot.listen("on_guild_role_delete")
+async def _forget_deleted_role(role):
+    _ticket_refs.pop((role.guild.id, role.id), None)
+
+@bot.listen("on_guild_channel_delete")
+async def _forget_deleted_channel(channel):
+    _ticket_refs.pop((channel.guild.id, channel.id), None)
+
+# ---------------- Transcript cache ----------------
+TRANSCRIPT_DIR = "transcripts"
+# busier tickets drop their cache and fall back to a full history scan; a deque(maxlen=...) would instead
+# trim the opening lines, and the scan after the last cached message could never bring them back
+TRANSCRIPT_CACHE_MAX = 2000
+TRANSCRIPT_FLUSH_INTERVAL = 2.0    # seconds to collect lines before appending them to disk
+TRANSCRIPT_CONTENT_BYTES = 3000    # per-message content cap in the transcript file
+# channel_id -> deque of (message_id, line, staff_author_id or None) for tickets recorded from their first message
+_msg_cache = {}
+# tickets whose cache is fed by on_message; caches loaded from disk miss whatever was sent while offline
+_live_transcripts = set()
+# channel_id -> jsonl lines waiting to be appended, or None to remove that ticket's file
+_transcript_pending = {}
+_transcript_flusher_task = None
+
+def transcript_line(msg: discord.Message) -> str:
+    ts = msg.created_at.astimezone().strftime("%Y-%m-%d %H:%M:%S")
+    # include attachments info (simple)
+    att_text = ""
+    if msg.attachments:
+        att_text = " [attachments: " + ", ".join(a.url for a in msg.attachments) + "]"
+    # guard binary / big content by truncating if necessary, on UTF-8 size since that is what the file carries
+    content = msg.content or ""
+    if len(content) * 4 > TRANSCRIPT_CONTENT_BYTES:  # at most 4 bytes per character, so short messages skip the encode
+        data = content.encode("utf-8")
+        if len(data) > TRANSCRIPT_CONTENT_BYTES:
+            # "ignore" drops a character cut in half at the boundary
+            content = data[:TRANSCRIPT_CONTENT_BYTES].decode("utf-8", "ignore") + "...[truncated]"
+    return f"[{ts}] {msg.author} ({getattr(msg.author, 'id', 'unknown')}): {content}{att_text}"
+
+def staff_author_id(msg: discord.Message):
+    """Return the author's id if a non-bot staff member sent the message, else None."""
+    if msg.author.bot:
+        return None
+    return msg.author.id if is_staff(msg.author) else None
+
+def _transcript_path(channel_id) -> str:
+    return os.path.join(TRANSCRIPT_DIR, f"{channel_id}.jsonl")
+
+def load_transcripts():
+    for key in _tickets_db.get("tickets", {}):
+        path = _transcript_path(key)
+        if not os.path.exists(path):
             continue
-        # msg.author may be Member or User; use roles attr safely
-        roles = getattr(msg.author, "roles", [])
-        if staff_role in roles:
-            staff_members.add(msg.author)
-    mentions = ", ".join(m.mention for m in staff_members) if staff_members else "No staff replied."
-    return staff_members, mentions
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                _msg_cache[int(key)] = deque(tuple(json.loads(line)) for line in f if line.strip())
+        except Exception as e:
+            print(f"Could not load cached transcript for {key}:", e)
+
+def _write_transcripts(pending):
+    os.makedirs(TRANSCRIPT_DIR, exist_ok=True)
+    for channel_id, lines in pending.items():
+        path = _transcript_path(channel_id)
+        if lines is None:
+            if os.path.exists(path):
+                os.remove(path)
+        else:
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+
+async def _transcript_flusher():
+    """Append queued transcript lines to disk until nothing is left to write"""
+    global _transcript_pending
+    while _transcript_pending:
+        await asyncio.sleep(TRANSCRIPT_FLUSH_INTERVAL)
+        pending, _transcript_pending = _transcript_pending, {}
+        try:
+            await asyncio.to_thread(_write_transcripts, pending)
+        except Exception as e:
+            print("Error writing cached transcripts:", e)
+            # a file with missing lines must not be trusted after a restart
+            for channel_id in pending:
+                drop_transcript_cache(channel_id)
+
+def _queue_transcript_write(channel_id, line):
+    global _transcript_flusher_task
+    if line is None:
+        _transcript_pending[channel_id] = None
+    else:
+        _transcript_pending.setdefault(channel_id, []).append(line)
+    if _transcript_flusher_task is None or _transcript_flusher_task.done():
+        _transcript_flusher_task = asyncio.create_task(_transcript_flusher())
+
+def start_transcript_cache(channel_id: int):
+    """Record a new ticket's messages from here on; call before its first message is sent."""
+    _msg_cache[channel_id] = deque()
+    _live_transcripts.add(channel_id)
+
+def drop_transcript_cache(channel_id: int):
+    _msg_cache.pop(channel_id, None)
+    _live_transcripts.discard(channel_id)
+    _queue_transcript_write(channel_id, None)
+
+@bot.listen("on_message")
+async def record_ticket_message(message: discord.Message):
+    channel_id = message.channel.id
+    if channel_id not in _live_transcripts:
+        return
+    cache = _msg_cache[channel_id]
+    if len(cache) >= TRANSCRIPT_CACHE_MAX:
+        drop_transcript_cache(channel_id)
+        return
+    entry = (message.id, transcript_line(message), staff_author_id(message))
+    cache.append(entry)
+    _queue_transcript_write(channel_id, json.dumps(entry) + "\n")
+
+def _transcript_caches(channel_id, message_ids) -> bool:
+    cache = _msg_cache.get(channel_id)
+    return bool(cache) and any(entry[0] in message_ids for entry in cache)
+
+# the jsonl file is append-only, so an edited or deleted cached message drops the whole cache
+# and close falls back to a full history scan that shows the channel as it is now
+@bot.listen("on_raw_message_edit")
+async def _transcript_message_edited(payload: discord.RawMessageUpdateEvent):
+    # link embeds arrive as edits too, but only real edits carry an edited_timestamp
+    if payload.data.get("edited_timestamp") and _transcript_caches(payload.channel_id, {payload.message_id}):
+        drop_transcript_cache(payload.channel_id)
+
+@bot.listen("on_raw_message_delete")
+async def _transcript_message_deleted(payload: discord.RawMessageDeleteEvent):
+    if _transcript_caches(payload.channel_id, {payload.message_id}):
+        drop_transcript_cache(payload.channel_id)
+
+@bot.listen("on_raw_bulk_message_delete")
+async def _transcript_messages_deleted(payload: discord.RawBulkMessageDeleteEvent):
+    if _transcript_caches(payload.channel_id, payload.message_ids):
+        drop_transcript_cache(payload.channel_id)
+
+load_transcripts()
+
+# ---------------- Utility: transcript & staff detection ----------------
+async def build_transcript_and_staff(channel: discord.TextChannel):
+    """Return (transcript discord.File, set of staff ids who posted, mention_string) from one history scan."""
+    # lines go straight into the file buffer, newline-separated
+    buf = io.BytesIO()
+    write = buf.write
+    staff_ids = set()
+    cached = _msg_cache.get(channel.id)
+    after = None
+    if cached is not None:
+        # cached lines, then only what arrived after the last cached message
+        for _, line, staff_id in cached:
+            if buf.tell():
+                write(b"\n")
+            write(line.encode("utf-8"))
+            if staff_id:
+                staff_ids.add(staff_id)
+        after = discord.Object(id=cached[-1][0]) if cached else None
+    async for msg in channel.history(limit=None, after=after, oldest_first=True):
+        if buf.tell():
+            write(b"\n")
+        write(transcript_line(msg).encode("utf-8"))
+        staff_id = staff_author_id(msg)
+        if staff_id:
+            staff_ids.add(staff_id)
+
+    if not buf.tell():
+        write(b"(no messages)")
+    buf.seek(0)
+    transcript = discord.File(buf, filename=f"{channel.name}-transcript.txt")
+    mentions = ", ".join(f"<@{staff_id}>" for staff_id in staff_ids) if staff_ids else "No staff replied."
+    return transcript, staff_ids, mentions
 
 # ---------------- Persistent Views ----------------
 class TicketView(View):
@@ -4379,9 +4884,7 @@ class TicketActionView(View):
     @discord.ui.button(label="Close", style=discord.ButtonStyle.secondary, custom_id="ticket_close")
     async def close_btn(self, interaction: discord.Interaction, button: Button):
         # only staff
-        guild = interaction.guild
-        staff_role = guild.get_role(STAFF_ROLE_ID)
-        if not staff_role or staff_role not in interaction.user.roles:
+        if not is_staff(interaction.user):
             return await interaction.response.send_message(embed=discord.Embed(
                 description="<:GsWrong:1414561861352816753> You can’t use this.", color=0x000000), ephemeral=True)
         # show confirm
@@ -4389,22 +4892,66 @@ class TicketActionView(View):
 
     @discord.ui.button(label="Delete", style=discord.ButtonStyle.secondary, custom_id="ticket_delete")
     async def delete_btn(self, interaction: discord.Interaction, button: Button):
-        guild = interaction.guild
-        staff_role = guild.get_role(STAFF_ROLE_ID)
-        if not staff_role or staff_role not in interaction.user.roles:
+        if not is_staff(interaction.user):
             return await interaction.response.send_message(embed=discord.Embed(
                 description="<:GsWrong:1414561861352816753> You can’t use this.", color=0x000000), ephemeral=True)
         await show_confirmation(interaction, action="delete")
 
     @discord.ui.button(label="Claim", style=discord.ButtonStyle.secondary, custom_id="ticket_claim")
     async def claim_btn(self, interaction: discord.Interaction, button: Button):
-        guild = interaction.guild
-        staff_role = guild.get_role(STAFF_ROLE_ID)
-        if not staff_role or staff_role not in interaction.user.roles:
+        if not is_staff(interaction.user):
             return await interaction.response.send_message(embed=discord.Embed(
                 description="<:GsWrong:1414561861352816753> You can’t use this.", color=0x000000), ephemeral=True)
         await show_confirmation(interaction, action="claim")
 
+# Yes/No prompt used by show_confirmation
+class ConfirmView(View):
+    def __init__(self, action, original_embed, timeout=30):
+        super().__init__(timeout=timeout)
+        self.action = action
+        self.original_embed = original_embed
+
+    @discord.ui.button(label="Yes", emoji="<:GsRight:1414593140156792893>",
+                       style=discord.ButtonStyle.secondary, custom_id="confirm_yes")
+    async def yes(self, yes_i: discord.Interaction, button: Button):
+        # double-check staff
+        guild = yes_i.guild
+        if not is_staff(yes_i.user):
+            return await yes_i.response.send_message(embed=discord.Embed(
+                description="<:GsWrong:1414561861352816753> You can’t use this.", color=0x000000), ephemeral=True)
+
+        # perform the desired action on the channel where the button was pressed
+        channel = yes_i.channel
+        # fetch fresh channel object
+        channel = guild.get_channel(channel.id)
+        # perform
+        if self.action == "close":
+            await do_close_ticket(channel, yes_i.user)
+            # confirm to the interactor and remove view
+            await yes_i.response.edit_message(embed=discord.Embed(
+                description=f"<:GsRight:1414593140156792893> Ticket closed (user removed) by {yes_i.user.mention}.",
+                color=0x000000), view=None)
+        elif self.action == "delete":
+            await do_delete_ticket(channel, yes_i.user)
+            await yes_i.response.edit_message(embed=discord.Embed(
+                description=f"<:GsRight:1414593140156792893> Ticket deleted by {yes_i.user.mention}.",
+                color=0x000000), view=None)
+        elif self.action == "claim":
+            await do_claim_ticket(channel, yes_i.user)
+            await yes_i.response.edit_message(embed=discord.Embed(
+                description=f"<:GsRight:1414593140156792893> Ticket claimed by {yes_i.user.mention}.",
+                color=0x000000), view=None)
+        else:
+            await yes_i.response.edit_message(embed=discord.Embed(
+                description="Unknown action.", color=0x000000), view=None)
+
+    @discord.ui.button(label="No", emoji="<:GsWrong:1414561861352816753>",
+                       style=discord.ButtonStyle.secondary, custom_id="confirm_no")
+    async def no(self, no_i: discord.Interaction, button: Button):
+        # revert the original embed + view
+        await no_i.response.edit_message(embed=self.original_embed or discord.Embed(
+            description="Ticket actions", color=0x000000), view=TicketActionView())
+
 # helper to show the gold confirmation prompt (edits the same message)
 async def show_confirmation(interaction: discord.Interaction, action: str):
     """
@@ -4428,7 +4975,10 @@ async def show_confirmation(interaction: discord.Interaction, action: str):
     # If embed missing, try to recover from persistent DB (use stored action_message_id for this channel)
     if not original_embed:
         meta = _tickets_db.get("tickets", {}).get(str(interaction.channel.id))
-        if meta and meta.get("action_message_id"):
+        if meta and meta.get("action_embed"):
+            # stored at creation, so no REST fetch inside the interaction window
+            original_embed = discord.Embed.from_dict(meta["action_embed"])
+        elif meta and meta.get("action_message_id"):
             try:
                 msg = await interaction.channel.fetch_message(meta["action_message_id"])
                 if msg.embeds:
@@ -4436,62 +4986,13 @@ async def show_confirmation(interaction: discord.Interaction, action: str):
             except Exception:
                 original_embed = None
 
-    class ConfirmView(View):
-        def __init__(self, action, original_embed):
-            super().__init__(timeout=30)
-            self.action = action
-            self.original_embed = original_embed
-
-        @discord.ui.button(label="Yes", emoji="<:GsRight:1414593140156792893>",
-                           style=discord.ButtonStyle.secondary, custom_id="confirm_yes")
-        async def yes(self, yes_i: discord.Interaction, button: Button):
-            # double-check staff
-            guild = yes_i.guild
-            staff_role = guild.get_role(STAFF_ROLE_ID)
-            if not staff_role or staff_role not in yes_i.user.roles:
-                return await yes_i.response.send_message(embed=discord.Embed(
-                    description="<:GsWrong:1414561861352816753> You can’t use this.", color=0x000000), ephemeral=True)
-
-            # perform the desired action on the channel where the button was pressed
-            channel = yes_i.channel
-            # fetch fresh channel object
-            channel = guild.get_channel(channel.id)
-            # perform
-            if self.action == "close":
-                await do_close_ticket(channel, yes_i.user)
-                # confirm to the interactor and remove view
-                await yes_i.response.edit_message(embed=discord.Embed(
-                    description=f"<:GsRight:1414593140156792893> Ticket closed (user removed) by {yes_i.user.mention}.",
-                    color=0x000000), view=None)
-            elif self.action == "delete":
-                await do_delete_ticket(channel, yes_i.user)
-                await yes_i.response.edit_message(embed=discord.Embed(
-                    description=f"<:GsRight:1414593140156792893> Ticket deleted by {yes_i.user.mention}.",
-                    color=0x000000), view=None)
-            elif self.action == "claim":
-                await do_claim_ticket(channel, yes_i.user)
-                await yes_i.response.edit_message(embed=discord.Embed(
-                    description=f"<:GsRight:1414593140156792893> Ticket claimed by {yes_i.user.mention}.",
-                    color=0x000000), view=None)
-            else:
-                await yes_i.response.edit_message(embed=discord.Embed(
-                    description="Unknown action.", color=0x000000), view=None)
-
-        @discord.ui.button(label="No", emoji="<:GsWrong:1414561861352816753>",
-                           style=discord.ButtonStyle.secondary, custom_id="confirm_no")
-        async def no(self, no_i: discord.Interaction, button: Button):
-            # revert the original embed + view
-            await no_i.response.edit_message(embed=self.original_embed or discord.Embed(
-                description="Ticket actions", color=0x000000), view=TicketActionView())
-
     await interaction.response.edit_message(embed=confirm_embed, view=ConfirmView(action, original_embed))
 
 # ---------------- Core action implementations ----------------
 async def do_close_ticket(channel: discord.TextChannel, action_by: discord.Member):
     """Remove ticket creator's access (do not delete channel), rename to closed-..., produce transcript & log."""
     guild = channel.guild
-    staff_role = guild.get_role(STAFF_ROLE_ID)
-    log_channel = guild.get_channel(LOG_CHANNEL_ID)
+    log_channel = cached_channel(guild, LOG_CHANNEL_ID)
 
     # try to get creator and claimer from DB first
     meta = _tickets_db.get("tickets", {}).get(str(channel.id), {})
@@ -4506,27 +5007,31 @@ async def do_close_ticket(channel: discord.TextChannel, action_by: discord.Membe
         if len(parts) > 1 and parts[1].isdigit():
             claimer_id = int(parts[1])
 
-    ticket_creator = guild.get_member(creator_id) if creator_id else None
-
-    # collect staff who replied before changing perms
-    staff_members, staff_mentions = await gather_staff_who_spoke(channel, staff_role)
+    ticket_creator = await resolve_member(guild, creator_id) if creator_id else None
 
-    # create transcript
-    transcript = await make_transcript(channel)
+    # create transcript and collect staff who replied before changing perms
+    transcript, staff_ids, staff_mentions = await build_transcript_and_staff(channel)
 
     # remove creator permissions (revoke view/send)
-    if ticket_creator:
+    async def revoke_creator():
         try:
             await channel.set_permissions(ticket_creator, overwrite=discord.PermissionOverwrite(view_channel=False, send_messages=False))
         except Exception:
             pass
 
     # optionally rename channel to indicate closed
-    try:
-        if not channel.name.startswith("closed-"):
+    async def mark_closed():
+        try:
             await channel.edit(name=f"closed-{channel.name}")
-    except Exception:
-        pass
+        except Exception:
+            pass
+
+    # independent edits, so run them side by side
+    async with asyncio.TaskGroup() as tg:
+        if ticket_creator:
+            tg.create_task(revoke_creator())
+        if not channel.name.startswith("closed-"):
+            tg.create_task(mark_closed())
 
     # log embed + ping creators/staff in content to ensure they are notified (embeds don't always ping)
     embed = discord.Embed(
@@ -4541,8 +5046,8 @@ async def do_close_ticket(channel: discord.TextChannel, action_by: discord.Membe
         content_ping = ""
         if ticket_creator:
             content_ping += f"{ticket_creator.mention} "
-        if staff_members:
-            content_ping += " ".join(m.mention for m in staff_members)
+        if staff_ids:
+            content_ping += " ".join(f"<@{staff_id}>" for staff_id in staff_ids)
         # send content ping and embed & transcript
         try:
             await log_channel.send(content=content_ping or None, embed=embed, file=transcript)
@@ -4555,13 +5060,12 @@ async def do_close_ticket(channel: discord.TextChannel, action_by: discord.Membe
     if meta_key in _tickets_db.get("tickets", {}):
         _tickets_db["tickets"][meta_key]["closed"] = True
         _tickets_db["tickets"][meta_key]["closed_at"] = datetime.datetime.utcnow().isoformat()
-        await save_db()
+        mark_db_dirty(meta_key)
 
 async def do_delete_ticket(channel: discord.TextChannel, action_by: discord.Member):
     """Make transcript, log and delete channel."""
     guild = channel.guild
-    staff_role = guild.get_role(STAFF_ROLE_ID)
-    log_channel = guild.get_channel(LOG_CHANNEL_ID)
+    log_channel = cached_channel(guild, LOG_CHANNEL_ID)
 
     # identify creator from DB first
     creator_id = None
@@ -4574,10 +5078,9 @@ async def do_delete_ticket(channel: discord.TextChannel, action_by: discord.Memb
         parts = channel.topic.split(";")
         if parts and parts[0].isdigit():
             creator_id = int(parts[0])
-    ticket_creator = guild.get_member(creator_id) if creator_id else None
+    ticket_creator = await resolve_member(guild, creator_id) if creator_id else None
 
-    staff_members, staff_mentions = await gather_staff_who_spoke(channel, staff_role)
-    transcript = await make_transcript(channel)
+    transcript, staff_ids, staff_mentions = await build_transcript_and_staff(channel)
 
     embed = discord.Embed(
         title="<:GsTicketsStyle2:1415298853598396509>  Ticket Deleted",
@@ -4587,12 +5090,15 @@ async def do_delete_ticket(channel: discord.TextChannel, action_by: discord.Memb
     )
     embed.add_field(name="User", value=(ticket_creator.mention if ticket_creator else "Unknown (topic missing)"), inline=False)
     embed.add_field(name="Staff Involved", value=staff_mentions, inline=False)
-    if log_channel:
+
+    async def send_log():
+        if not log_channel:
+            return
         content_ping = ""
         if ticket_creator:
             content_ping += f"{ticket_creator.mention} "
-        if staff_members:
-            content_ping += " ".join(m.mention for m in staff_members)
+        if staff_ids:
+            content_ping += " ".join(f"<@{staff_id}>" for staff_id in staff_ids)
         try:
             await log_channel.send(content=content_ping or None, embed=embed, file=transcript)
         except Exception:
@@ -4602,15 +5108,16 @@ async def do_delete_ticket(channel: discord.TextChannel, action_by: discord.Memb
     meta_key = str(channel.id)
     if meta_key in _tickets_db.get("tickets", {}):
         del _tickets_db["tickets"][meta_key]
-        await save_db()
+        mark_db_dirty(meta_key)
+    drop_transcript_cache(channel.id)
 
-    # delete after logging
-    await channel.delete()
+    # the transcript is already built, so logging and deleting don't depend on each other
+    await asyncio.gather(send_log(), channel.delete())
 
 async def do_claim_ticket(channel: discord.TextChannel, claimer: discord.Member):
     """Give exclusive send permissions to claimer, others staff can view only."""
     guild = channel.guild
-    staff_role = guild.get_role(STAFF_ROLE_ID)
+    staff_role = cached_role(guild, STAFF_ROLE_ID)
 
     # find creator id from DB or topic
     meta_key = str(channel.id)
@@ -4623,28 +5130,25 @@ async def do_claim_ticket(channel: discord.TextChannel, claimer: discord.Member)
         if parts and parts[0].isdigit():
             creator_id = int(parts[0])
     # set staff role send_messages=False (view True)
-    try:
-        await channel.set_permissions(staff_role, view=True, send_messages=False)
-    except Exception:
-        pass
-    # set claimer perms
-    await channel.set_permissions(claimer, view=True, send_messages=True)
-
-    # update channel.topic to include claimer id (creator;claimer)
-    creator_part = str(creator_id) if creator_id else ""
-    try:
-        await channel.edit(topic=f"{creator_part};{claimer.id}")
-    except Exception:
-        pass
+    async def restrict_staff():
+        try:
+            await channel.set_permissions(staff_role, view_channel=True, send_messages=False)
+        except Exception:
+            pass
+    # set claimer perms alongside; the claimer is recorded in the DB only, the topic keeps "creator;"
+    await asyncio.gather(
+        restrict_staff(),
+        channel.set_permissions(claimer, view_channel=True, send_messages=True)
+    )
 
     # update DB
     _tickets_db.setdefault("tickets", {}).setdefault(meta_key, {})
     _tickets_db["tickets"][meta_key]["creator_id"] = creator_id
     _tickets_db["tickets"][meta_key]["claimer_id"] = claimer.id
-    await save_db()
+    mark_db_dirty(meta_key)
 
     # log claim in log channel
-    log_channel = guild.get_channel(LOG_CHANNEL_ID)
+    log_channel = cached_channel(guild, LOG_CHANNEL_ID)
     embed = discord.Embed(title="<:GsTicketsStyle2:1415298853598396509>  Ticket Claimed",
                           description=f"Claimed by {claimer.mention}",
                           color=GOLD,
@@ -4653,10 +5157,17 @@ async def do_claim_ticket(channel: discord.TextChannel, claimer: discord.Member)
         await log_channel.send(embed=embed)
 
 # ---------------- Create a ticket (stores creator id in DB & topic), posts ticket-action message inside ticket ----------------
+# shared overwrites for ticket channels
+_TICKET_HIDDEN = discord.PermissionOverwrite(view_channel=False)
+_TICKET_MEMBER = discord.PermissionOverwrite(view_channel=True, send_messages=True)
+
+# characters allowed in the username part of a ticket channel name
+_SANITIZE_NAME_RE = re.compile(r"[^0-9a-zA-Z_-]")
+
 async def create_ticket(interaction: discord.Interaction, category_id: int, ticket_type: str):
     guild = interaction.guild
-    staff_role = guild.get_role(STAFF_ROLE_ID)
-    category = guild.get_channel(category_id)
+    staff_role = cached_role(guild, STAFF_ROLE_ID)
+    category = cached_channel(guild, category_id)
     if not staff_role or not category:
         return await interaction.response.send_message(embed=discord.Embed(
             description="<:GsWrong:1414561861352816753> Ticket system not set up properly. Contact an admin.",
@@ -4664,14 +5175,14 @@ async def create_ticket(interaction: discord.Interaction, category_id: int, tick
 
     # prepare overwrites
     overwrites = {
-        guild.default_role: discord.PermissionOverwrite(view_channel=False),
-        staff_role: discord.PermissionOverwrite(view_channel=True, send_messages=True),
-        interaction.user: discord.PermissionOverwrite(view_channel=True, send_messages=True)
+        guild.default_role: _TICKET_HIDDEN,
+        staff_role: _TICKET_MEMBER,
+        interaction.user: _TICKET_MEMBER
     }
 
     # create channel and set topic to "creatorID;" (claimer blank)
     # sanitize name (keep your original style but avoid illegal chars)
-    safe_name_user = re.sub(r"[^0-9a-zA-Z-_]", "", f"{interaction.user.name}")[:32]
+    safe_name_user = _SANITIZE_NAME_RE.sub("", interaction.user.name)[:32]
     name_safe = f"{ticket_type}-ticket-{safe_name_user}-{interaction.user.discriminator}"
     ticket_channel = await guild.create_text_channel(
         name=name_safe,
@@ -4680,6 +5191,8 @@ async def create_ticket(interaction: discord.Interaction, category_id: int, tick
         topic=f"{interaction.user.id};"  # creatorID ; claimerID (empty)
     )
 
+    start_transcript_cache(ticket_channel.id)
+
     # send initial embed + ticket action buttons (persistent)
     embed = discord.Embed(
         title=f"{ticket_type.capitalize()} Ticket",
@@ -4695,9 +5208,10 @@ async def create_ticket(interaction: discord.Interaction, category_id: int, tick
         "creator_id": interaction.user.id,
         "claimer_id": None,
         "action_message_id": action_msg.id,
+        "action_embed": embed.to_dict(),
         "created_at": datetime.datetime.utcnow().isoformat()
     }
-    await save_db()
+    mark_db_dirty(str(ticket_channel.id))
 
     # respond to user
     await interaction.response.send_message(embed=discord.Embed(
@@ -4728,13 +5242,28 @@ async def ticketpanel(ctx):
 
     # persist panel message so we can re-attach view after restarts
     _tickets_db.setdefault("panels", []).append({"channel_id": ctx.channel.id, "message_id": panel_msg.id})
-    await save_db()
+    mark_db_dirty(panels=True)
 
 # ---------------- gs.delete command (same flow as Delete button) ----------------
+# confirmation for gs.delete
+class DeleteConfirm(View):
+    def __init__(self, channel: discord.TextChannel):
+        super().__init__()
+        self.channel = channel
+
+    @discord.ui.button(label="Yes", emoji="<:GsRight:1414593140156792893>", style=discord.ButtonStyle.secondary)
+    async def yes(self, interaction: discord.Interaction, button: Button):
+        if not is_staff(interaction.user):
+            return await interaction.response.send_message("<:GsWrong:1414561861352816753> You can’t use this.", ephemeral=True)
+        await do_delete_ticket(self.channel, interaction.user)
+        await interaction.response.edit_message(embed=discord.Embed(description="Deleted.", color=0x000000), view=None)
+    @discord.ui.button(label="No", emoji="<:GsWrong:1414561861352816753>", style=discord.ButtonStyle.secondary)
+    async def no(self, interaction: discord.Interaction, button: Button):
+        await interaction.response.edit_message(embed=discord.Embed(description="<:GsWrong:1414561861352816753> Action denied.", color=0x000000), view=None)
+
 @bot.command(name="delete")
 async def delete_cmd(ctx):
-    staff_role = ctx.guild.get_role(STAFF_ROLE_ID)
-    if not staff_role or staff_role not in ctx.author.roles:
+    if not is_staff(ctx.author):
         return await ctx.send(embed=discord.Embed(description="<:GsWrong:1414561861352816753> You don’t have permission.", color=0x000000))
 
     if not ctx.channel.name.startswith(("buying-ticket-", "support-ticket-", "closed-support", "closed-buying")):
@@ -4743,81 +5272,109 @@ async def delete_cmd(ctx):
     # show confirmation inline (reusing show_confirmation by synthesizing an "interaction-like" edit)
     # easiest: send a new confirmation message for the command:
     confirm_embed = discord.Embed(title="Confirm delete", description="Are you sure you want to delete this ticket?", color=GOLD)
-    class DeleteConfirm(View):
-        @discord.ui.button(label="Yes", emoji="<:GsRight:1414593140156792893>", style=discord.ButtonStyle.secondary)
-        async def yes(self, interaction: discord.Interaction, button: Button):
-            staff_role_local = ctx.guild.get_role(STAFF_ROLE_ID)
-            if staff_role_local not in interaction.user.roles:
-                return await interaction.response.send_message("<:GsWrong:1414561861352816753> You can’t use this.", ephemeral=True)
-            await do_delete_ticket(ctx.channel, interaction.user)
-            await interaction.response.edit_message(embed=discord.Embed(description="Deleted.", color=0x000000), view=None)
-        @discord.ui.button(label="No", emoji="<:GsWrong:1414561861352816753>", style=discord.ButtonStyle.secondary)
-        async def no(self, interaction: discord.Interaction, button: Button):
-            await interaction.response.edit_message(embed=discord.Embed(description="<:GsWrong:1414561861352816753> Action denied.", color=0x000000), view=None)
-
-    await ctx.send(embed=confirm_embed, view=DeleteConfirm())
+    await ctx.send(embed=confirm_embed, view=DeleteConfirm(ctx.channel))
 
 # ---------------- gs.claim command (with gold confirmation) ----------------
+# confirmation for gs.claim
+class ClaimConfirm(View):
+    def __init__(self, channel: discord.TextChannel):
+        super().__init__()
+        self.channel = channel
+
+    @discord.ui.button(label="Yes", emoji="<:GsRight:1414593140156792893>", style=discord.ButtonStyle.secondary)
+    async def yes(self, interaction: discord.Interaction, button: Button):
+        if not is_staff(interaction.user):
+            return await interaction.response.send_message("<:GsWrong:1414561861352816753> You can’t use this.", ephemeral=True)
+        await do_claim_ticket(self.channel, interaction.user)
+        await interaction.response.edit_message(embed=discord.Embed(description=f"<:GsRight:1414593140156792893> Ticket claimed by {interaction.user.mention}.", color=0x000000), view=None)
+    @discord.ui.button(label="No", emoji="<:GsWrong:1414561861352816753>", style=discord.ButtonStyle.secondary)
+    async def no(self, interaction: discord.Interaction, button: Button):
+        await interaction.response.edit_message(embed=discord.Embed(description="<:GsWrong:1414561861352816753> Claim cancelled.", color=0x000000), view=None)
+
 @bot.command(name="claim")
 async def claim_cmd(ctx):
-    staff_role = ctx.guild.get_role(STAFF_ROLE_ID)
-    if not staff_role or staff_role not in ctx.author.roles:
+    if not is_staff(ctx.author):
         return await ctx.send(embed=discord.Embed(description="<:GsWrong:1414561861352816753> You don’t have permission.", color=0x000000))
     if not ctx.channel.name.startswith(("buying-ticket-", "support-ticket-")):
         return await ctx.send(embed=discord.Embed(description="<:GsWrong:1414561861352816753> This command can only be used in a ticket channel.", color=0x000000))
 
     confirm_embed = discord.Embed(title="Claim ticket", description=f"{ctx.author.mention}, do you want to claim this ticket?", color=GOLD)
-    class ClaimConfirm(View):
-        @discord.ui.button(label="Yes", emoji="<:GsRight:1414593140156792893>", style=discord.ButtonStyle.secondary)
-        async def yes(self, interaction: discord.Interaction, button: Button):
-            staff_role_local = ctx.guild.get_role(STAFF_ROLE_ID)
-            if staff_role_local not in interaction.user.roles:
-                return await interaction.response.send_message("<:GsWrong:1414561861352816753> You can’t use this.", ephemeral=True)
-            await do_claim_ticket(ctx.channel, interaction.user)
-            await interaction.response.edit_message(embed=discord.Embed(description=f"<:GsRight:1414593140156792893> Ticket claimed by {interaction.user.mention}.", color=0x000000), view=None)
-        @discord.ui.button(label="No", emoji="<:GsWrong:1414561861352816753>", style=discord.ButtonStyle.secondary)
-        async def no(self, interaction: discord.Interaction, button: Button):
-            await interaction.response.edit_message(embed=discord.Embed(description="<:GsWrong:1414561861352816753> Claim cancelled.", color=0x000000), view=None)
-
-    await ctx.send(embed=confirm_embed, view=ClaimConfirm())
+    await ctx.send(embed=confirm_embed, view=ClaimConfirm(ctx.channel))
 
 # ---------------- gs.transfer @member (give claim to another staff) ----------------
 @bot.command(name="transfer")
 async def transfer_cmd(ctx, member: discord.Member):
-    staff_role = ctx.guild.get_role(STAFF_ROLE_ID)
-    if not staff_role or staff_role not in ctx.author.roles:
+    staff_role = cached_role(ctx.guild, STAFF_ROLE_ID)
+    if not staff_role or not is_staff(ctx.author):
         return await ctx.send(embed=discord.Embed(description="<:GsWrong:1414561861352816753> You don’t have permission.", color=0x000000))
     if not ctx.channel.name.startswith(("buying-ticket-", "support-ticket-")):
         return await ctx.send(embed=discord.Embed(description="<:GsWrong:1414561861352816753> This command can only be used in a ticket channel.", color=0x000000))
     # target must be staff
-    if staff_role not in member.roles:
+    if not is_staff(member):
         return await ctx.send(embed=discord.Embed(description="<:GsWrong:1414561861352816753> Target is not staff.", color=0x000000))
 
     # set staff role perms to view only, make member send_messages True
-    await ctx.channel.set_permissions(staff_role, view=True, send_messages=False)
-    await ctx.channel.set_permissions(member, view=True, send_messages=True)
-    # update topic claimer part while preserving creator id
-    creator_part = ""
-    if ctx.channel.topic:
-        parts = ctx.channel.topic.split(";")
-        if parts and parts[0].isdigit():
-            creator_part = parts[0]
-    await ctx.channel.edit(topic=f"{creator_part};{member.id}")
+    await asyncio.gather(
+        ctx.channel.set_permissions(staff_role, view_channel=True, send_messages=False),
+        ctx.channel.set_permissions(member, view_channel=True, send_messages=True)
+    )
 
     # update DB
     meta_key = str(ctx.channel.id)
     _tickets_db.setdefault("tickets", {}).setdefault(meta_key, {})
     _tickets_db["tickets"][meta_key]["claimer_id"] = member.id
-    await save_db()
+    mark_db_dirty(meta_key)
 
     await ctx.send(embed=discord.Embed(description=f"Ticket transferred to {member.mention}.", color=GOLD))
 
 # ---------------- Register persistent views on_ready and reattach to messages ----------------
 VIEWS_REGISTERED = False
+STARTUP_SCAN_CONCURRENCY = 5  # untracked ticket channels scanned at once on ready
+MIGRATION_HISTORY_LIMIT = 20  # oldest messages checked for the action message of an untracked ticket
+
+async def migrate_ticket_channel(channel: discord.TextChannel, sem: asyncio.Semaphore):
+    """Add a DB entry for an untracked ticket channel, inferred from its topic and history. Returns the new key or None."""
+    key = str(channel.id)
+    if key in _tickets_db.get("tickets", {}):
+        return None
+    # try to infer creator/claimer from topic
+    creator_id = None
+    claimer_id = None
+    if channel.topic:
+        parts = channel.topic.split(";")
+        if parts and parts[0].isdigit():
+            creator_id = int(parts[0])
+        if len(parts) > 1 and parts[1].isdigit():
+            claimer_id = int(parts[1])
+    # the action message is the first thing the bot posts in a ticket, so look at the oldest messages
+    action_msg_id = None
+    bot_id = bot.user.id
+    async with sem:
+        async for msg in channel.history(limit=MIGRATION_HISTORY_LIMIT, oldest_first=True):
+            if msg.author.id == bot_id and msg.embeds:
+                action_msg_id = msg.id
+                break
+    _tickets_db.setdefault("tickets", {})[key] = {
+        "creator_id": creator_id,
+        "claimer_id": claimer_id,
+        "action_message_id": action_msg_id,
+        "created_at": datetime.datetime.utcnow().isoformat()
+    }
+    return key
+
+def reattach_view(message_id, view_cls):
+    """Bind a fresh persistent view to a stored message so interactions work after restart, without touching the message."""
+    try:
+        bot.add_view(view_cls(), message_id=int(message_id))
+    except Exception as e:
+        # don't crash startup on bad message ids
+        print(f"Could not reattach {view_cls.__name__} to message {message_id}:", e)
 
 @bot.event
 async def on_ready():
     global VIEWS_REGISTERED
+    # a fresh READY rebuilds the guild cache, so drop references to the old role/channel objects
+    _ticket_refs.clear()
     if not VIEWS_REGISTERED:
         try:
             bot.add_view(TicketView())
@@ -4831,65 +5388,29 @@ async def on_ready():
     # This helps the bot "remember" embeds and make buttons work after restart
     # Migrate any existing ticket channels (that use naming convention) into DB if missing
     try:
-        # migrate channels that look like tickets and are not yet in DB
-        for channel in bot.get_all_channels():
-            if not isinstance(channel, discord.TextChannel):
-                continue
-            if channel.name.startswith(("buying-ticket-", "support-ticket-")):
-                key = str(channel.id)
-                if key not in _tickets_db.get("tickets", {}):
-                    # try to infer creator/claimer from topic
-                    creator_id = None
-                    claimer_id = None
-                    if channel.topic:
-                        parts = channel.topic.split(";")
-                        if parts and parts[0].isdigit():
-                            creator_id = int(parts[0])
-                        if len(parts) > 1 and parts[1].isdigit():
-                            claimer_id = int(parts[1])
-                    # try to find the bot's action message in recent history
-                    action_msg_id = None
-                    async for msg in channel.history(limit=200):
-                        if msg.author == bot.user and msg.embeds:
-                            action_msg_id = msg.id
-                            break
-                    _tickets_db.setdefault("tickets", {})[key] = {
-                        "creator_id": creator_id,
-                        "claimer_id": claimer_id,
-                        "action_message_id": action_msg_id,
-                        "created_at": datetime.datetime.utcnow().isoformat()
-                    }
-                    await save_db()
-
-        # reattach views to action messages
-        for ch_id, meta in list(_tickets_db.get("tickets", {}).items()):
-            try:
-                channel = bot.get_channel(int(ch_id))
-                if not channel:
-                    continue
-                msg_id = meta.get("action_message_id")
-                if not msg_id:
-                    continue
-                try:
-                    msg = await channel.fetch_message(int(msg_id))
-                    # attach the persistent view to this message so interactions work after restart
-                    await msg.edit(view=TicketActionView())
-                except Exception as e:
-                    print(f"Could not reattach TicketActionView to message {msg_id} in channel {ch_id}:", e)
-            except Exception:
-                continue
-
-        # reattach views to panel messages
+        sem = asyncio.Semaphore(STARTUP_SCAN_CONCURRENCY)
+        # migrate channels that look like tickets and are not yet in DB; their rows are
+        # persisted together after the scan so the history fetches don't spread them over several writes
+        results = await asyncio.gather(
+            *(
+                migrate_ticket_channel(channel, sem)
+                for channel in bot.get_all_channels()
+                if isinstance(channel, discord.TextChannel) and channel.name.startswith(("buying-ticket-", "support-ticket-"))
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print("Could not migrate ticket channel:", result)
+            elif result:
+                mark_db_dirty(result)
+
+        # reattach views to action messages and panel messages
+        for meta in _tickets_db.get("tickets", {}).values():
+            if meta.get("action_message_id"):
+                reattach_view(meta["action_message_id"], TicketActionView)
         for panel in _tickets_db.get("panels", []):
-            try:
-                channel = bot.get_channel(int(panel.get("channel_id")))
-                if not channel:
-                    continue
-                msg = await channel.fetch_message(int(panel.get("message_id")))
-                await msg.edit(view=TicketView())
-            except Exception as e:
-                # don't crash startup on bad panels
-                print("Could not reattach TicketView to panel message:", e)
+            reattach_view(panel.get("message_id"), TicketView)
     except Exception as e:
         print("Error during on_ready reattach/migrate:", e)
 
@@ -4897,7 +5418,7 @@ async def on_ready():
 # Keep your customizations (emojis, gold color, thumbnails), this version fixes:
 #  - persistent views properly re-registered on_ready
 #  - action / panel message ids stored on-disk so views can be re-attached after restart
-#  - ticket creator/claimer metadata stored on-disk (tickets.json) and migrated from existing channel topics when possible
+#  - ticket creator/claimer metadata stored on-disk (tickets.db) and migrated from existing channel topics when possible
 #  - show_confirmation will attempt to recover the original embed from the stored action message if the interaction message lacks it
 
 # Note: run the bot as usual: bot.run("YOUR_TOKEN") in your main runner script.
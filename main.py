@@ -5,6 +5,7 @@ import os
 from fixed_bot import DiscordBot
 from web_server import create_app
 from database import mod_db
+from waitress import serve
 
 # Configure logging
 logging.basicConfig(
@@ -49,7 +50,7 @@ def run_flask_server():
     try:
         app = create_app()
         logger.info("Starting Flask server on port 5000...")
-        app.run(host='0.0.0.0', port=5000, debug=False)
+        serve(app, host='0.0.0.0', port=5000, threads=8, connection_limit=200)
     except Exception as e:
         logger.error(f"Error running Flask server: {e}")
 
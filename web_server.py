@@ -1,48 +1,257 @@
-from flask import Flask, jsonify, request, render_template
+from flask import Flask, Response, jsonify, request, render_template
+from flask.json.provider import DefaultJSONProvider
 import logging
 import datetime
 import os
+import sys
+import time
 import json
-from fixed_bot import BASE_WEIGHTS, PET_DATABASE, save_pet_data
-import copy
+import fixed_bot
+from fixed_bot import BASE_WEIGHTS, BASE_WEIGHT_TABLE, PET_DATA_LOCK, bot, save_pet_data
 import asyncio
 import discord
+from functools import lru_cache
+from bisect import bisect_right
+import math
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# int keys (the /calculate predictions) are allowed and keys are sorted. Unlike jsonify, orjson sorts
+# them after converting to strings, so predictions come out "1", "10", "100", "2", ...; clients look
+# ages up by key, so only the order differs
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+def dumps_bytes(obj):
+    """Compact JSON bytes for prebuilt response bodies"""
+    return orjson.dumps(obj, option=ORJSON_OPTIONS)
+
+PYTHON_VERSION = sys.version.split()[0]
+
+# Monitoring endpoints hit every few seconds; logging each hit would swamp the log
+UNLOGGED_PATHS = frozenset({'/ping', '/health', '/uptime'})
+
+# Spaces and hyphens in a pet name become underscores in its key
+PET_KEY_TABLE = str.maketrans(' -', '__')
+
+# Bound on distinct inputs remembered by the calculator caches
+CALC_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=CALC_CACHE_SIZE)
+def predict_weight_series(current_age, current_weight):
+    """Predicted weights for ages 1-100 as a tuple, cached per (age, weight)"""
+    weight_ratio = current_weight / BASE_WEIGHTS.get(current_age, 1.0)
+    table = BASE_WEIGHT_TABLE
+    return tuple(round(table[age] * weight_ratio, 2) for age in range(1, 101))
+
+# Value calculation multipliers (elvebredd-style)
+DEMAND_MULTIPLIERS = {
+    'Terrible': 0.7,
+    'Low': 0.85,
+    'Medium': 1.0,
+    'High': 1.3,
+    'Extremely High': 1.6
+}
+TREND_MULTIPLIERS = {
+    'Dropping': 0.8,
+    'Stable': 1.0,
+    'Rising': 1.2
+}
+TIER_MULTIPLIERS = {
+    'Common': 0.9,
+    'Uncommon': 1.0,
+    'Rare': 1.1,
+    'Epic': 1.25,
+    'Legendary': 1.5,
+    'Divine': 1.8
+}
+# log(1 + monthly change) per trend, 10% of the trend effect per month
+TREND_LOG_GROWTH = {trend: math.log1p((mult - 1) * 0.1) for trend, mult in TREND_MULTIPLIERS.items()}
+
+# Investment rating for a total multiplier below 1.0, from 1.0, from 1.2 and from 1.5
+RATING_THRESHOLDS = (1.0, 1.2, 1.5)
+RATING_LABELS = ('❌ Poor', '⭐ Fair', '⭐⭐ Good', '⭐⭐⭐ Excellent')
+
+@lru_cache(maxsize=CALC_CACHE_SIZE)
+def predict_value(pet_name, current_value, demand, trend, tier, time_horizon):
+    """Value prediction as (predicted_value, prediction_trend, investment_rating, analysis, change_pct), cached per input"""
+    # Calculate base multiplier
+    demand_mult = DEMAND_MULTIPLIERS.get(demand, 1.0)
+    trend_mult = TREND_MULTIPLIERS.get(trend, 1.0)
+    tier_mult = TIER_MULTIPLIERS.get(tier, 1.0)
+    
+    # Time factor (compound effect over time)
+    time_mult = math.exp(TREND_LOG_GROWTH.get(trend, 0.0) * (time_horizon / 30))
+    
+    # Calculate predicted value
+    total_mult = demand_mult * trend_mult * tier_mult * time_mult
+    predicted_value = round(current_value * total_mult)
+    
+    # Determine prediction trend
+    if predicted_value > current_value * 1.1:
+        prediction_trend = 'positive'
+    elif predicted_value < current_value * 0.9:
+        prediction_trend = 'negative'
+    else:
+        prediction_trend = 'neutral'
+    
+    # Investment rating
+    investment_rating = RATING_LABELS[bisect_right(RATING_THRESHOLDS, total_mult)]
+    
+    # Generate analysis
+    change_pct = round((predicted_value - current_value) / current_value * 100, 1)
+    if change_pct > 0:
+        analysis = f"Based on {demand} demand and {trend.lower()} trend, {pet_name} is expected to increase by {change_pct}% over {time_horizon} days. The {tier} tier provides additional value stability."
+    elif change_pct < 0:
+        analysis = f"Market analysis suggests {pet_name} may decrease by {abs(change_pct)}% over {time_horizon} days due to {demand.lower()} demand and {trend.lower()} market conditions."
+    else:
+        analysis = f"{pet_name} is expected to maintain stable value over {time_horizon} days with current market conditions."
+    
+    return predicted_value, prediction_trend, investment_rating, analysis, change_pct
+
+# Display titles for the pet fields the admin panel edits
+FIELD_TITLES = {field: field.title() for field in ('value', 'demand', 'trend', 'tier', 'obtainement', 'image_url')}
+
+# Seconds admin pet edits are collected before one Discord notification goes out for all of them
+NOTIFY_BATCH_WINDOW = 2.0
+EMBED_FIELD_LIMIT = 25  # Discord's per-embed field cap
+
+# Serialized /pet-list body and the pet data version it was built from
+_pet_list_cache = (None, b'')
+
+def pet_list_json():
+    """JSON body for /pet-list, rebuilt only after the pet data has been saved or reloaded"""
+    global _pet_list_cache
+    version, body = _pet_list_cache
+    if version != fixed_bot.PET_DATA_VERSION:
+        with PET_DATA_LOCK:
+            version = fixed_bot.PET_DATA_VERSION
+            pets = list(fixed_bot.PET_DATABASE.values())
+        pets_list = [
+            {
+                'name': pet['name'],
+                'value': pet['value'],
+                'demand': pet['demand'],
+                'trend': pet['trend'],
+                'tier': pet['tier'],
+                'obtainement': pet.get('obtainement', ''),
+                'image_url': pet.get('image_url', '')
+            }
+            for pet in pets
+        ]
+        body = dumps_bytes(pets_list)
+        _pet_list_cache = (version, body)
+    return body
+
 def create_app():
     """Create and configure Flask application"""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
-    # Store bot start time
+    # Store bot start time; uptime is measured on the monotonic clock, the wall clock is only reported
     start_time = datetime.datetime.utcnow()
+    start_monotonic = time.monotonic()
+    
+    # Fixed part of /status; none of it changes while the process runs
+    status_base = {
+        'bot_name': 'Discord WFL Bot',
+        'version': '1.0.0',
+        'status': 'running',
+        'monitoring_channel': '1401169397850308708',
+        'reaction_emojis': [':W1:', ':F1:', ':L1:'],
+        'environment': {
+            'python_version': PYTHON_VERSION,
+            'discord_token_configured': bool(os.getenv('DISCORD_TOKEN'))
+        }
+    }
+    
+    # Discord notifications, collected on the bot loop and sent in batches
+    pending_notifications = []
+    notification_flusher = None
     
-    # Discord notification helper
     def notify_discord(pet_name, action, old_values=None, new_values=None):
-        """Schedule Discord notification"""
+        """Queue a Discord notification on the bot's event loop"""
         try:
-            import threading
-            from fixed_bot import bot
-            
-            def send_notification():
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(_send_discord_notification(pet_name, action, old_values, new_values))
-                    loop.close()
-                except Exception as e:
-                    logger.error(f"Error in notification thread: {e}")
-            
-            thread = threading.Thread(target=send_notification)
-            thread.daemon = True
-            thread.start()
+            loop = bot.loop
+            if not loop.is_running():
+                logger.warning(f"Bot loop not running, skipping Discord notification for {pet_name}")
+                return
+            loop.call_soon_threadsafe(_queue_notification, (pet_name, action, old_values, new_values))
+        except AttributeError:
+            # discord.py refuses access to bot.loop until the bot has been started
+            logger.warning(f"Bot not started, skipping Discord notification for {pet_name}")
         except Exception as e:
             logger.error(f"Failed to schedule Discord notification: {e}")
     
-    async def _send_discord_notification(pet_name, action, old_values=None, new_values=None):
-        """Send pet update notification to Discord channel"""
+    def _queue_notification(event):
+        """Add a notification to the pending batch, starting the sender if it is idle (bot loop only)"""
+        nonlocal notification_flusher
+        pending_notifications.append(event)
+        if notification_flusher is None or notification_flusher.done():
+            notification_flusher = asyncio.create_task(_flush_notifications())
+    
+    async def _flush_notifications():
+        """Send whatever arrives within each batch window together"""
+        while pending_notifications:
+            await asyncio.sleep(NOTIFY_BATCH_WINDOW)
+            events = pending_notifications[:]
+            pending_notifications.clear()
+            await _send_discord_notifications(events)
+    
+    def _notification_fields(pet_name, action, old_values=None, new_values=None):
+        """Embed fields as (name, value, inline) describing one pet change"""
+        fields = []
+        if action == "added":
+            fields.append(("➕ New Pet Added", f"**{pet_name}**", False))
+            if new_values:
+                fields.append((
+                    "📊 Pet Details",
+                    f"**Value:** {new_values.get('value', 'N/A')}\n**Demand:** {new_values.get('demand', 'N/A')}\n**Trend:** {new_values.get('trend', 'N/A')}\n**Tier:** {new_values.get('tier', 'N/A')}",
+                    True
+                ))
+        elif action == "updated":
+            fields.append(("✏️ Pet Updated", f"**{pet_name}**", False))
+            
+            changes = [
+                f"**{FIELD_TITLES.get(field) or field.title()}:** {old_values.get(field, 'N/A')} → {new_val}"
+                for field, new_val in new_values.items()
+                if old_values.get(field, 'N/A') != new_val
+            ] if old_values and new_values else []
+            
+            if changes:
+                fields.append(("📈 Changes Made", "\n".join(changes), False))
+        elif action == "deleted":
+            fields.append(("🗑️ Pet Deleted", f"**{pet_name}**", False))
+            if old_values:
+                fields.append((
+                    "📊 Previous Details",
+                    f"**Value:** {old_values.get('value', 'N/A')}\n**Demand:** {old_values.get('demand', 'N/A')}\n**Trend:** {old_values.get('trend', 'N/A')}\n**Tier:** {old_values.get('tier', 'N/A')}",
+                    True
+                ))
+        return fields
+    
+    async def _send_discord_notifications(events):
+        """Send a batch of pet update notifications, packing as many changes per embed as fit"""
         try:
-            from fixed_bot import bot
+            # sends go through the bot's own HTTP session, which only exists once it has logged in
+            if not bot.is_ready():
+                logger.warning(f"Bot not ready, dropping Discord notification for {len(events)} pet change(s)")
+                return
+            
             channel_id = 1414528231834386545
             channel = bot.get_channel(channel_id)
             
@@ -50,64 +259,40 @@ def create_app():
                 logger.warning(f"Could not find Discord channel {channel_id}")
                 return
             
-            embed = discord.Embed(
-                title="🐾 Pet Database Update",
-                color=0xFFC916,
-                timestamp=datetime.datetime.utcnow()
-            )
-            
-            if action == "added":
-                embed.add_field(
-                    name="➕ New Pet Added",
-                    value=f"**{pet_name}**",
-                    inline=False
+            # Keep each pet's fields together in one embed
+            embeds = [[]]
+            for event in events:
+                fields = _notification_fields(*event)
+                if len(embeds[-1]) + len(fields) > EMBED_FIELD_LIMIT:
+                    embeds.append([])
+                embeds[-1].extend(fields)
+            
+            for fields in embeds:
+                embed = discord.Embed(
+                    title="🐾 Pet Database Update",
+                    color=0xFFC916,
+                    timestamp=datetime.datetime.utcnow()
                 )
-                if new_values:
-                    embed.add_field(
-                        name="📊 Pet Details",
-                        value=f"**Value:** {new_values.get('value', 'N/A')}\n**Demand:** {new_values.get('demand', 'N/A')}\n**Trend:** {new_values.get('trend', 'N/A')}\n**Tier:** {new_values.get('tier', 'N/A')}",
-                        inline=True
-                    )
-            elif action == "updated":
-                embed.add_field(
-                    name="✏️ Pet Updated",
-                    value=f"**{pet_name}**",
-                    inline=False
-                )
-                
-                changes = []
-                if old_values and new_values:
-                    for field, new_val in new_values.items():
-                        old_val = old_values.get(field, 'N/A')
-                        if old_val != new_val:
-                            changes.append(f"**{field.title()}:** {old_val} → {new_val}")
-                
-                if changes:
-                    embed.add_field(
-                        name="📈 Changes Made",
-                        value="\n".join(changes),
-                        inline=False
-                    )
-            elif action == "deleted":
-                embed.add_field(
-                    name="🗑️ Pet Deleted",
-                    value=f"**{pet_name}**",
-                    inline=False
-                )
-                if old_values:
-                    embed.add_field(
-                        name="📊 Previous Details",
-                        value=f"**Value:** {old_values.get('value', 'N/A')}\n**Demand:** {old_values.get('demand', 'N/A')}\n**Trend:** {old_values.get('trend', 'N/A')}\n**Tier:** {old_values.get('tier', 'N/A')}",
-                        inline=True
-                    )
-            
-            embed.set_footer(text="🌐 Updated via Admin Website")
-            await channel.send(embed=embed)
-            logger.info(f"Sent Discord notification for {action} action on {pet_name}")
+                for name, value, inline in fields:
+                    embed.add_field(name=name, value=value, inline=inline)
+                embed.set_footer(text="🌐 Updated via Admin Website")
+                await channel.send(embed=embed)
+            logger.info(f"Sent Discord notification for {len(events)} pet change(s) in {len(embeds)} message(s)")
             
         except Exception as e:
             logger.error(f"Failed to send Discord notification: {e}")
     
+    # Serialized monitoring responses as endpoint -> (monotonic second, body)
+    monitor_cache = {}
+    
+    def cached_monitor_response(name, build):
+        """Response for a polled monitoring endpoint, serialized at most once per second"""
+        now = int(time.monotonic())
+        cached = monitor_cache.get(name)
+        if cached is None or cached[0] != now:
+            cached = monitor_cache[name] = (now, dumps_bytes(build()))
+        return Response(cached[1], mimetype='application/json')
+    
     @app.route('/')
     def home():
         """Serve the main website with all three tabs"""
@@ -116,18 +301,18 @@ def create_app():
     @app.route('/health')
     def health_check():
         """Basic health check endpoint"""
-        return jsonify({
+        return cached_monitor_response('health', lambda: {
             'status': 'healthy',
             'service': 'Discord WFL Bot',
             'timestamp': datetime.datetime.utcnow().isoformat(),
-            'uptime_seconds': (datetime.datetime.utcnow() - start_time).total_seconds()
+            'uptime_seconds': time.monotonic() - start_monotonic
         })
     
     @app.route('/uptime')
     def uptime():
         """Uptime monitoring endpoint"""
-        uptime_delta = datetime.datetime.utcnow() - start_time
-        uptime_seconds = uptime_delta.total_seconds()
+        uptime_seconds = time.monotonic() - start_monotonic
+        uptime_delta = datetime.timedelta(seconds=uptime_seconds)
         
         return jsonify({
             'status': 'online',
@@ -141,16 +326,8 @@ def create_app():
     def status():
         """Detailed status endpoint"""
         return jsonify({
-            'bot_name': 'Discord WFL Bot',
-            'version': '1.0.0',
-            'status': 'running',
-            'monitoring_channel': '1401169397850308708',
-            'reaction_emojis': [':W1:', ':F1:', ':L1:'],
-            'uptime_seconds': (datetime.datetime.utcnow() - start_time).total_seconds(),
-            'environment': {
-                'python_version': os.sys.version.split()[0],
-                'discord_token_configured': bool(os.getenv('DISCORD_TOKEN'))
-            }
+            **status_base,
+            'uptime_seconds': time.monotonic() - start_monotonic
         })
     
     @app.route('/calculate', methods=['POST'])
@@ -170,16 +347,8 @@ def create_app():
             if current_weight <= 0:
                 return jsonify({'error': 'Weight must be greater than 0'}), 400
             
-            # Calculate base weight ratio
-            current_base_weight = BASE_WEIGHTS.get(current_age, 1.0)
-            weight_ratio = current_weight / current_base_weight
-            
             # Calculate predictions for all ages
-            predictions = {}
-            for age in range(1, 101):
-                base_weight = BASE_WEIGHTS.get(age, 1.0)
-                predicted_weight = round(base_weight * weight_ratio, 2)
-                predictions[age] = predicted_weight
+            predictions = dict(zip(range(1, 101), predict_weight_series(current_age, current_weight)))
             
             return jsonify({
                 'current_age': current_age,
@@ -203,69 +372,9 @@ def create_app():
             tier = data.get('tier', 'Common')
             time_horizon = data.get('time_horizon', 30)
             
-            # Value calculation logic (elvebredd-style)
-            multipliers = {
-                'demand': {
-                    'Terrible': 0.7,
-                    'Low': 0.85, 
-                    'Medium': 1.0,
-                    'High': 1.3,
-                    'Extremely High': 1.6
-                },
-                'trend': {
-                    'Dropping': 0.8,
-                    'Stable': 1.0,
-                    'Rising': 1.2
-                },
-                'tier': {
-                    'Common': 0.9,
-                    'Uncommon': 1.0,
-                    'Rare': 1.1,
-                    'Epic': 1.25,
-                    'Legendary': 1.5,
-                    'Divine': 1.8
-                }
-            }
-            
-            # Calculate base multiplier
-            demand_mult = multipliers['demand'].get(demand, 1.0)
-            trend_mult = multipliers['trend'].get(trend, 1.0)
-            tier_mult = multipliers['tier'].get(tier, 1.0)
-            
-            # Time factor (compound effect over time)
-            daily_change = (trend_mult - 1) * 0.1  # 10% of trend effect per month
-            time_mult = (1 + daily_change) ** (time_horizon / 30)
-            
-            # Calculate predicted value
-            total_mult = demand_mult * trend_mult * tier_mult * time_mult
-            predicted_value = round(current_value * total_mult)
-            
-            # Determine prediction trend
-            if predicted_value > current_value * 1.1:
-                prediction_trend = 'positive'
-            elif predicted_value < current_value * 0.9:
-                prediction_trend = 'negative'
-            else:
-                prediction_trend = 'neutral'
-            
-            # Investment rating
-            if total_mult >= 1.5:
-                investment_rating = '⭐⭐⭐ Excellent'
-            elif total_mult >= 1.2:
-                investment_rating = '⭐⭐ Good'
-            elif total_mult >= 1.0:
-                investment_rating = '⭐ Fair'
-            else:
-                investment_rating = '❌ Poor'
-            
-            # Generate analysis
-            change_pct = round((predicted_value - current_value) / current_value * 100, 1)
-            if change_pct > 0:
-                analysis = f"Based on {demand} demand and {trend.lower()} trend, {pet_name} is expected to increase by {change_pct}% over {time_horizon} days. The {tier} tier provides additional value stability."
-            elif change_pct < 0:
-                analysis = f"Market analysis suggests {pet_name} may decrease by {abs(change_pct)}% over {time_horizon} days due to {demand.lower()} demand and {trend.lower()} market conditions."
-            else:
-                analysis = f"{pet_name} is expected to maintain stable value over {time_horizon} days with current market conditions."
+            predicted_value, prediction_trend, investment_rating, analysis, change_pct = predict_value(
+                pet_name, current_value, demand, trend, tier, time_horizon
+            )
             
             return jsonify({
                 'pet_name': pet_name,
@@ -289,18 +398,7 @@ def create_app():
     def get_pet_list():
         """Get list of pets for frontend"""
         try:
-            pets_list = []
-            for key, pet in PET_DATABASE.items():
-                pets_list.append({
-                    'name': pet['name'],
-                    'value': pet['value'],
-                    'demand': pet['demand'],
-                    'trend': pet['trend'],
-                    'tier': pet['tier'],
-                    'obtainement': pet.get('obtainement', ''),
-                    'image_url': pet.get('image_url', '')
-                })
-            return jsonify(pets_list)
+            return Response(pet_list_json(), mimetype='application/json')
         except Exception as e:
             logger.error(f'Error getting pet list: {e}')
             return jsonify({'error': 'Failed to load pets'}), 500
@@ -309,10 +407,12 @@ def create_app():
     def get_all_pets():
         """Get all pets data for admin panel"""
         try:
-            return jsonify({
-                'pets': PET_DATABASE,
-                'count': len(PET_DATABASE)
-            })
+            # serialize under the lock so bot-side updates can't change the dict mid-dump
+            with PET_DATA_LOCK:
+                return jsonify({
+                    'pets': fixed_bot.PET_DATABASE,
+                    'count': len(fixed_bot.PET_DATABASE)
+                })
         except Exception as e:
             logger.error(f'Error getting pets data: {e}')
             return jsonify({'error': 'Failed to load pets data'}), 500
@@ -328,30 +428,31 @@ def create_app():
                 return jsonify({'error': 'Pet name is required'}), 400
             
             # Create pet key (lowercase, underscores)
-            pet_key = name.lower().replace(' ', '_').replace('-', '_')
-            
-            # Check if pet already exists
-            if pet_key in PET_DATABASE:
-                return jsonify({'error': f'Pet {name} already exists'}), 400
-            
-            # Create new pet entry
-            new_pet = {
-                'name': name,
-                'value': data.get('value', '0 Mimic Value'),
-                'demand': data.get('demand', 'Medium'),
-                'trend': data.get('trend', 'Stable'),
-                'tier': data.get('tier', 'Common'),
-                'obtainement': data.get('obtainement', 'Unknown'),
-                'image_url': data.get('image_url', ''),
-                'last_updated': datetime.datetime.utcnow().isoformat(),
-                'message_id': None
-            }
+            pet_key = name.lower().translate(PET_KEY_TABLE)
+            
+            with PET_DATA_LOCK:
+                # Check if pet already exists
+                if pet_key in fixed_bot.PET_DATABASE:
+                    return jsonify({'error': f'Pet {name} already exists'}), 400
+            
+                # Create new pet entry
+                new_pet = {
+                    'name': name,
+                    'value': data.get('value', '0 Mimic Value'),
+                    'demand': data.get('demand', 'Medium'),
+                    'trend': data.get('trend', 'Stable'),
+                    'tier': data.get('tier', 'Common'),
+                    'obtainement': data.get('obtainement', 'Unknown'),
+                    'image_url': data.get('image_url', ''),
+                    'last_updated': datetime.datetime.utcnow().isoformat(),
+                    'message_id': None
+                }
             
-            # Add to database
-            PET_DATABASE[pet_key] = new_pet
+                # Add to database
+                fixed_bot.PET_DATABASE[pet_key] = new_pet
             
-            # Save to file
-            save_pet_data()
+                # Save to file
+                save_pet_data()
             
             # Send Discord notification
             notify_discord(name, "added", None, new_pet)
@@ -367,25 +468,26 @@ def create_app():
     def update_pet(pet_key):
         """Update an existing pet"""
         try:
-            if pet_key not in PET_DATABASE:
-                return jsonify({'error': 'Pet not found'}), 404
-            
             data = request.json
-            pet = PET_DATABASE[pet_key]
+            with PET_DATA_LOCK:
+                if pet_key not in fixed_bot.PET_DATABASE:
+                    return jsonify({'error': 'Pet not found'}), 404
+            
+                pet = fixed_bot.PET_DATABASE[pet_key]
             
-            # Store old values for notification
-            old_values = copy.deepcopy(pet)
+                # Store old values for notification
+                old_values = dict(pet)
             
-            # Update only provided fields
-            updatable_fields = ['value', 'demand', 'trend', 'tier', 'obtainement', 'image_url']
-            for field in updatable_fields:
-                if field in data:
-                    pet[field] = data[field]
+                # Update only provided fields
+                updatable_fields = ['value', 'demand', 'trend', 'tier', 'obtainement', 'image_url']
+                for field in updatable_fields:
+                    if field in data:
+                        pet[field] = data[field]
             
-            pet['last_updated'] = datetime.datetime.utcnow().isoformat()
+                pet['last_updated'] = datetime.datetime.utcnow().isoformat()
             
-            # Save to file
-            save_pet_data()
+                # Save to file
+                save_pet_data()
             
             # Send Discord notification with changes
             notify_discord(pet["name"], "updated", old_values, data)
@@ -401,17 +503,18 @@ def create_app():
     def delete_pet(pet_key):
         """Delete a pet from the database"""
         try:
-            if pet_key not in PET_DATABASE:
-                return jsonify({'error': 'Pet not found'}), 404
+            with PET_DATA_LOCK:
+                if pet_key not in fixed_bot.PET_DATABASE:
+                    return jsonify({'error': 'Pet not found'}), 404
             
-            # Store pet data for notification before deleting
-            deleted_pet = copy.deepcopy(PET_DATABASE[pet_key])
-            pet_name = deleted_pet['name']
+                # Store pet data for notification before deleting
+                deleted_pet = dict(fixed_bot.PET_DATABASE[pet_key])
+                pet_name = deleted_pet['name']
             
-            del PET_DATABASE[pet_key]
+                del fixed_bot.PET_DATABASE[pet_key]
             
-            # Save to file
-            save_pet_data()
+                # Save to file
+                save_pet_data()
             
             # Send Discord notification
             notify_discord(pet_name, "deleted", deleted_pet, None)
@@ -426,7 +529,7 @@ def create_app():
     @app.route('/ping')
     def ping():
         """Simple ping endpoint for monitoring"""
-        return jsonify({
+        return cached_monitor_response('ping', lambda: {
             'status': 'pong',
             'timestamp': datetime.datetime.utcnow().isoformat(),
             'bot_active': True
@@ -443,10 +546,11 @@ def create_app():
         logger.error(f'Internal server error: {error}')
         return jsonify({'error': 'Internal server error'}), 500
     
-    # Add request logging
+    # Add request logging, leaving out the endpoints uptime monitors poll
     @app.before_request
     def log_request():
-        from flask import request
+        if request.path in UNLOGGED_PATHS:
+            return
         logger.info(f'Incoming request: {request.method} {request.path} from {request.remote_addr}')
     
     return app